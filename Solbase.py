@@ -39,25 +39,29 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",  # Body-Centered Cubic
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 2.866, "b": 2.866, "c": 2.866, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    # CORNER ATOMS (8 corners - shared with adjacent cells)
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    
-                    # BODY CENTER ATOM (1 atom at cube center)
-                    {"element": "Fe", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Fe"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,  # (8 corners × 1/8) + 1 center = 2
                 "description": "Body-Centered Cubic: Atoms at cube corners and body center"
             },
+            "temperature_curves": {  # EN 1993-1-2 reduction factors for carbon steel
+                "youngs_modulus": {"temperature": [20, 100, 200, 300, 400, 500, 600, 700],
+                                   "values": [200, 200, 180, 160, 140, 120, 62, 26]},
+                "yield_strength": {"temperature": [20, 100, 200, 300, 400, 500, 600, 700],
+                                   "values": [350, 350, 350, 350, 350, 273, 164.5, 80.5]},
+                "thermal_conductivity": {"temperature": [20, 100, 200, 400, 600],
+                                         "values": [51.9, 51.0, 48.5, 42.7, 35.6]}
+            },
+            "property_ranges": {  # spread across cold-drawn bar suppliers
+                "yield_strength": {"min": 295, "typical": 350, "max": 420},
+                "tensile_strength": {"min": 380, "typical": 420, "max": 470},
+                "youngs_modulus": {"distribution": "normal", "std": 4}
+            },
+            "diffusion": {  # carbon in austenite, for carburizing
+                "C": {"D0": 2.3e-5, "Q": 148, "phase": "austenite"}
+            },
             "applications": [
                 "Structural frames and supports",
                 "Automotive body panels",
@@ -108,30 +112,25 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",  # Face-Centered Cubic
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 3.60, "b": 3.60, "c": 3.60, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    # CORNER ATOMS (8 corners - shared with adjacent cells)
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    
-                    # FACE CENTER ATOMS (6 faces - shared with adjacent cells)
-                    {"element": "Fe", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Fe", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Fe", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Fe", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Fe", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Fe", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Fe"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,  # (8 corners × 1/8) + (6 faces × 1/2) = 4
                 "description": "Face-Centered Cubic: Atoms at cube corners and face centers"
             },
+            "temperature_curves": {
+                "youngs_modulus": {"temperature": [20, 100, 200, 300, 400, 500, 600],
+                                   "values": [193, 187, 180, 172, 165, 157, 149]},
+                "yield_strength": {"temperature": [20, 100, 200, 300, 400, 500, 600],
+                                   "values": [215, 170, 144, 130, 120, 112, 103]},
+                "thermal_conductivity": {"temperature": [20, 100, 200, 300, 500],
+                                         "values": [16.2, 16.6, 17.9, 19.0, 21.5]}
+            },
+            "property_ranges": {
+                "yield_strength": {"min": 205, "typical": 215, "max": 310},
+                "tensile_strength": {"min": 480, "typical": 505, "max": 620}
+            },
             "applications": [
                 "Food processing equipment",
                 "Chemical containers",
@@ -182,30 +181,23 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 4.05, "b": 4.05, "c": 4.05, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    # CORNER ATOMS
-                    {"element": "Al", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Al", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Al", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Al", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Al", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Al", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Al", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Al", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    
-                    # FACE CENTER ATOMS
-                    {"element": "Al", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Al", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Al", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Al", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Al", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Al", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Al"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
                 "description": "Face-Centered Cubic: Close-packed structure with high ductility"
             },
+            "temperature_curves": {  # T6 temper, after 10 000 h at temperature
+                "youngs_modulus": {"temperature": [20, 100, 200, 300],
+                                   "values": [68.9, 66.5, 62.6, 54.5]},
+                "yield_strength": {"temperature": [24, 100, 150, 205, 260, 315, 370],
+                                   "values": [276, 262, 214, 103, 34, 19, 12]}
+            },
+            "property_ranges": {  # T6 temper
+                "yield_strength": {"min": 240, "typical": 276, "max": 300},
+                "tensile_strength": {"min": 260, "typical": 310, "max": 330}
+            },
             "applications": [
                 "Aircraft fittings",
                 "Bicycle frames",
@@ -256,20 +248,17 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",  # Hexagonal Close-Packed
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.95, "b": 2.95, "c": 4.68, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    # BASE PLANE ATOMS (6 atoms in hexagonal arrangement)
-                    {"element": "Ti", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Ti", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Ti", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Ti"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
                 "description": "Hexagonal Close-Packed: ABAB stacking sequence"
             },
+            "property_ranges": {
+                "yield_strength": {"min": 795, "typical": 828, "max": 950},
+                "cost_index": {"distribution": "uniform", "min": 14, "max": 25}
+            },
             "applications": [
                 "Aerospace components",
                 "Medical implants and prosthetics",
@@ -297,6 +286,7 @@ def load_verified_mechanical_materials():
             "class": "semiconductor",
             "category": "semiconductor",
             "composition": {"Si": 1.0},
+            "hardness_scale": "HV",
             "properties": {
                 "density": 2.33,
                 "youngs_modulus": 112,
@@ -320,19 +310,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "Diamond Cubic",
                 "space_group": "Fd-3m",
                 "lattice_parameters": {"a": 5.43, "b": 5.43, "c": 5.43, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    # FCC POSITIONS (like FCC but with 2 atoms per lattice point)
-                    {"element": "Si", "x": 0.0, "y": 0.0, "z": 0.0, "type": "fcc_corner"},
-                    {"element": "Si", "x": 0.5, "y": 0.5, "z": 0.0, "type": "fcc_face"},
-                    {"element": "Si", "x": 0.5, "y": 0.0, "z": 0.5, "type": "fcc_face"},
-                    {"element": "Si", "x": 0.0, "y": 0.5, "z": 0.5, "type": "fcc_face"},
-                    
-                    # INTERNAL POSITIONS (offset by 1/4,1/4,1/4)
-                    {"element": "Si", "x": 0.25, "y": 0.25, "z": 0.25, "type": "internal"},
-                    {"element": "Si", "x": 0.75, "y": 0.75, "z": 0.25, "type": "internal"},
-                    {"element": "Si", "x": 0.75, "y": 0.25, "z": 0.75, "type": "internal"},
-                    {"element": "Si", "x": 0.25, "y": 0.75, "z": 0.75, "type": "internal"}
-                ],
+                "prototype": "Diamond Cubic",
+                "species": {"A": "Si"},
                 "coordination_number": 4,
                 "atomic_packing_factor": 0.34,
                 "atoms_per_unit_cell": 8,
@@ -391,17 +370,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 3.51, "b": 3.51, "c": 3.51, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Li", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Li", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Li", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Li", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Li", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Li", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Li", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Li", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Li", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Li"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -457,17 +427,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 4.29, "b": 4.29, "c": 4.29, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Na", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Na", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Na", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Na", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Na", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Na", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Na", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Na", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Na", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Na"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -523,17 +484,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 5.23, "b": 5.23, "c": 5.23, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "K", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "K", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "K", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "K", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "K", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "K", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "K", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "K", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "K", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "K"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -590,14 +542,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.29, "b": 2.29, "c": 3.58, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "Be", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Be", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Be", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Be", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Be", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Be", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Be"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
@@ -653,14 +599,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 3.21, "b": 3.21, "c": 5.21, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "Mg", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Mg", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Mg", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Mg", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Mg", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Mg", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Mg"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
@@ -716,22 +656,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 5.59, "b": 5.59, "c": 5.59, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Ca", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ca", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ca", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ca", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ca", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ca", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ca", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ca", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ca", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Ca", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ca", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Ca", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Ca", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ca", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Ca"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -788,14 +714,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.95, "b": 2.95, "c": 4.68, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "Ti", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Ti", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Ti", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Ti", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Ti"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
@@ -851,17 +771,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 2.88, "b": 2.88, "c": 2.88, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Cr", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cr", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cr", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cr", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cr", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cr", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cr", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cr", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cr", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Cr"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -917,17 +828,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 8.91, "b": 8.91, "c": 8.91, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Mn", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mn", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mn", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mn", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mn", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mn", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mn", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mn", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mn", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Mn"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -983,22 +885,16 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 2.87, "b": 2.87, "c": 2.87, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Fe", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Fe"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
                 "description": "Body-Centered Cubic: Alpha iron at room temperature"
             },
+            "diffusion": {
+                "C": {"D0": 2.3e-5, "Q": 148, "phase": "austenite"}
+            },
             "applications": [
                 "Structural steel",
                 "Machinery and tools",
@@ -1049,14 +945,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.51, "b": 2.51, "c": 4.07, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "Co", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Co", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Co", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Co", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Co", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Co", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Co"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
@@ -1112,22 +1002,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 3.52, "b": 3.52, "c": 3.52, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Ni", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ni", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ni", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ni", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ni", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ni", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ni", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ni", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ni", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Ni", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ni", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Ni", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Ni", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ni", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Ni"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1183,22 +1059,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 3.61, "b": 3.61, "c": 3.61, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Cu", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cu", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cu", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cu", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cu", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Cu", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cu", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cu", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Cu", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Cu", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Cu", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Cu", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Cu", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Cu", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Cu"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1254,14 +1116,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "HCP",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.66, "b": 2.66, "c": 4.95, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "Zn", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "Zn", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "Zn", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "Zn", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Zn", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "Zn", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "HCP",
+                "species": {"A": "Zn"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 6,
@@ -1317,17 +1173,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 3.15, "b": 3.15, "c": 3.15, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Mo", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mo", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mo", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mo", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mo", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Mo", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mo", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mo", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Mo", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "Mo"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -1383,22 +1230,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 4.09, "b": 4.09, "c": 4.09, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Ag", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ag", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ag", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ag", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ag", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Ag", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ag", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ag", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Ag", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Ag", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ag", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Ag", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Ag", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Ag", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Ag"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1454,17 +1287,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "BCC",
                 "space_group": "Im-3m",
                 "lattice_parameters": {"a": 3.16, "b": 3.16, "c": 3.16, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "W", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "W", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "W", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "W", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "W", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "W", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "W", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "W", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "W", "x": 0.5, "y": 0.5, "z": 0.5, "type": "body_center"}
-                ],
+                "prototype": "BCC",
+                "species": {"A": "W"},
                 "coordination_number": 8,
                 "atomic_packing_factor": 0.68,
                 "atoms_per_unit_cell": 2,
@@ -1520,22 +1344,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 3.92, "b": 3.92, "c": 3.92, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Pt", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pt", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pt", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pt", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pt", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pt", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pt", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pt", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pt", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Pt", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Pt", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Pt", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Pt", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Pt", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Pt"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1591,22 +1401,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 4.08, "b": 4.08, "c": 4.08, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Au", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Au", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Au", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Au", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Au", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Au", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Au", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Au", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Au", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Au", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Au", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Au", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Au", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Au", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Au"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1662,22 +1458,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "FCC",
                 "space_group": "Fm-3m",
                 "lattice_parameters": {"a": 4.95, "b": 4.95, "c": 4.95, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Pb", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pb", "x": 1.0, "y": 0.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pb", "x": 0.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pb", "x": 0.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pb", "x": 1.0, "y": 1.0, "z": 0.0, "type": "corner"},
-                    {"element": "Pb", "x": 1.0, "y": 0.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pb", "x": 0.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pb", "x": 1.0, "y": 1.0, "z": 1.0, "type": "corner"},
-                    {"element": "Pb", "x": 0.5, "y": 0.5, "z": 0.0, "type": "face_center"},
-                    {"element": "Pb", "x": 0.5, "y": 0.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Pb", "x": 0.0, "y": 0.5, "z": 0.5, "type": "face_center"},
-                    {"element": "Pb", "x": 0.5, "y": 0.5, "z": 1.0, "type": "face_center"},
-                    {"element": "Pb", "x": 0.5, "y": 1.0, "z": 0.5, "type": "face_center"},
-                    {"element": "Pb", "x": 1.0, "y": 0.5, "z": 0.5, "type": "face_center"}
-                ],
+                "prototype": "FCC",
+                "species": {"A": "Pb"},
                 "coordination_number": 12,
                 "atomic_packing_factor": 0.74,
                 "atoms_per_unit_cell": 4,
@@ -1711,6 +1493,7 @@ def load_verified_mechanical_materials():
             "class": "semiconductor",
             "category": "metalloid",
             "composition": {"Ge": 1.0},
+            "hardness_scale": "HV",
             "properties": {
                 "density": 5.32,
                 "youngs_modulus": 103,
@@ -1734,16 +1517,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "Diamond Cubic",
                 "space_group": "Fd-3m",
                 "lattice_parameters": {"a": 5.66, "b": 5.66, "c": 5.66, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "Ge", "x": 0.0, "y": 0.0, "z": 0.0, "type": "fcc_corner"},
-                    {"element": "Ge", "x": 0.5, "y": 0.5, "z": 0.0, "type": "fcc_face"},
-                    {"element": "Ge", "x": 0.5, "y": 0.0, "z": 0.5, "type": "fcc_face"},
-                    {"element": "Ge", "x": 0.0, "y": 0.5, "z": 0.5, "type": "fcc_face"},
-                    {"element": "Ge", "x": 0.25, "y": 0.25, "z": 0.25, "type": "internal"},
-                    {"element": "Ge", "x": 0.75, "y": 0.75, "z": 0.25, "type": "internal"},
-                    {"element": "Ge", "x": 0.75, "y": 0.25, "z": 0.75, "type": "internal"},
-                    {"element": "Ge", "x": 0.25, "y": 0.75, "z": 0.75, "type": "internal"}
-                ],
+                "prototype": "Diamond Cubic",
+                "species": {"A": "Ge"},
                 "coordination_number": 4,
                 "atomic_packing_factor": 0.34,
                 "atoms_per_unit_cell": 8,
@@ -1777,6 +1552,7 @@ def load_verified_mechanical_materials():
             "class": "non_metal",
             "category": "non_metal",
             "composition": {"C": 1.0},
+            "hardness_scale": "HV",
             "properties": {
                 "density": 3.51,
                 "youngs_modulus": 1050,
@@ -1800,16 +1576,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "Diamond Cubic",
                 "space_group": "Fd-3m",
                 "lattice_parameters": {"a": 3.57, "b": 3.57, "c": 3.57, "alpha": 90, "beta": 90, "gamma": 90},
-                "atomic_positions": [
-                    {"element": "C", "x": 0.0, "y": 0.0, "z": 0.0, "type": "fcc_corner"},
-                    {"element": "C", "x": 0.5, "y": 0.5, "z": 0.0, "type": "fcc_face"},
-                    {"element": "C", "x": 0.5, "y": 0.0, "z": 0.5, "type": "fcc_face"},
-                    {"element": "C", "x": 0.0, "y": 0.5, "z": 0.5, "type": "fcc_face"},
-                    {"element": "C", "x": 0.25, "y": 0.25, "z": 0.25, "type": "internal"},
-                    {"element": "C", "x": 0.75, "y": 0.75, "z": 0.25, "type": "internal"},
-                    {"element": "C", "x": 0.75, "y": 0.25, "z": 0.75, "type": "internal"},
-                    {"element": "C", "x": 0.25, "y": 0.75, "z": 0.75, "type": "internal"}
-                ],
+                "prototype": "Diamond Cubic",
+                "species": {"A": "C"},
                 "coordination_number": 4,
                 "atomic_packing_factor": 0.34,
                 "atoms_per_unit_cell": 8,
@@ -1865,14 +1633,8 @@ def load_verified_mechanical_materials():
                 "structure_type": "Hexagonal",
                 "space_group": "P6₃/mmc",
                 "lattice_parameters": {"a": 2.46, "b": 2.46, "c": 6.70, "alpha": 90, "beta": 90, "gamma": 120},
-                "atomic_positions": [
-                    {"element": "C", "x": 0.333, "y": 0.667, "z": 0.25, "type": "base_plane"},
-                    {"element": "C", "x": 0.667, "y": 0.333, "z": 0.25, "type": "base_plane"},
-                    {"element": "C", "x": 0.000, "y": 0.000, "z": 0.25, "type": "base_plane"},
-                    {"element": "C", "x": 0.333, "y": 0.667, "z": 0.75, "type": "mid_plane"},
-                    {"element": "C", "x": 0.667, "y": 0.333, "z": 0.75, "type": "mid_plane"},
-                    {"element": "C", "x": 0.000, "y": 0.000, "z": 0.75, "type": "mid_plane"}
-                ],
+                "prototype": "Graphite",
+                "species": {"A": "C"},
                 "coordination_number": 3,
                 "atomic_packing_factor": 0.17,
                 "atoms_per_unit_cell": 4,
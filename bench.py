@@ -0,0 +1,352 @@
+"""
+Benchmark Suite
+Times the loader, figure builders, comparison charts, figure JSON size and
+search/validation hot paths on the real catalog and on synthetic catalogs
+scaled to 1k/10k/100k materials. Results are written as JSON and compared
+against a stored baseline.
+
+Usage:
+    python bench.py                                  # full run, writes bench_results.json
+    python bench.py --sizes 1000 --only search       # subset
+    python bench.py --save-baseline                  # store as bench_baseline.json
+    python bench.py --baseline bench_baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from Solbase import load_verified_mechanical_materials
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+SELECTION_SIZES = (2, 10, 50, 200, 1000)
+SIMILARITY_MAX_SIZE = 5_000  # N × N matrices; larger catalogs are capped
+FATIGUE_MAX_SIZE = 10_000  # against a 10⁵-block spectrum
+RAINFLOW_SAMPLES = 10_000_000
+QUENCH_MAX_SIZE = 10_000  # 500 implicit steps on 41 nodes each
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_BASELINE = "bench_baseline.json"
+
+Result = Tuple[str, Dict[str, float]]
+
+# =============================================================================
+# SYNTHETIC CATALOGS
+# =============================================================================
+
+def synthetic_catalog(size: int, seed: int = 0) -> Dict[str, Dict]:
+    """
+    Catalog of `size` materials cloned round-robin from Solbase with properties
+    jittered by ±10%. Nested structures are shared with the source records.
+    """
+    rng = random.Random(seed)
+    base = list(load_verified_mechanical_materials().items())
+    catalog = {}
+    for i in range(size):
+        key, record = base[i % len(base)]
+        clone = dict(record)
+        clone["name"] = f"{record['name']} #{i}"
+        clone["properties"] = {
+            prop: value * rng.uniform(0.9, 1.1) if isinstance(value, (int, float)) else value
+            for prop, value in record["properties"].items()
+        }
+        catalog[f"{key}_{i}"] = clone
+    return catalog
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+def time_call(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """Median/min wall time of fn() in ms (auto-scales loops for fast functions)"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - started) / loops)
+    return {"ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000}
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def bench_loader(sizes, repeat) -> Iterator[Result]:
+    from store import load_materials
+
+    yield "loader.solbase", time_call(load_verified_mechanical_materials, repeat)
+    yield "loader.store", time_call(load_materials, repeat)
+
+
+def bench_crystal_plots(sizes, repeat) -> Iterator[Result]:
+    from solair import create_crystal_structure_plot
+
+    materials = load_verified_mechanical_materials()
+
+    def build_all():
+        return [create_crystal_structure_plot(m["crystal_structure"], m["name"]) for m in materials.values()]
+
+    timing = time_call(build_all, repeat, min_time=0)
+    timing["per_material_ms"] = timing["ms"] / len(materials)
+    yield "render.crystal_plot.all", timing
+
+    figures = build_all()
+    payload = [fig.to_json() for fig in figures]
+    json_timing = time_call(lambda: [fig.to_json() for fig in figures], repeat, min_time=0)
+    json_timing["bytes"] = sum(len(p.encode("utf-8")) for p in payload)
+    json_timing["bytes_per_material"] = json_timing["bytes"] / len(figures)
+    yield "figure_json.crystal_plot.all", json_timing
+
+
+def bench_comparisons(sizes, repeat) -> Iterator[Result]:
+    from database import MaterialsTable
+    from solair import RADAR, create_mechanical_comparison_plot, create_physical_comparison_plot
+
+    table = MaterialsTable(synthetic_catalog(max(SELECTION_SIZES)))
+    builders = {
+        "mechanical": lambda keys: create_mechanical_comparison_plot(table, keys),
+        "physical": lambda keys: create_physical_comparison_plot(table, keys),
+        "radar": lambda keys: create_mechanical_comparison_plot(table, keys, "log", RADAR),
+    }
+
+    for selection_size in SELECTION_SIZES:
+        selected = table.keys[:selection_size]
+        for label, builder in builders.items():
+            yield (f"compare.{label}.{selection_size}",
+                   time_call(lambda: builder(selected), repeat, min_time=0))
+            fig = builder(selected)
+            timing = time_call(fig.to_json, repeat, min_time=0)
+            timing["bytes"] = len(fig.to_json().encode("utf-8"))
+            yield f"figure_json.compare.{label}.{selection_size}", timing
+
+
+def bench_search(sizes, repeat) -> Iterator[Result]:
+    import query
+
+    ranges = [query.parse_filter("density<8"), query.parse_filter("yield_strength>=100")]
+    for size in sizes:
+        catalog = synthetic_catalog(size)
+        yield f"search.filter.{size}", time_call(lambda: query.filter_materials(catalog, ranges=ranges), repeat, min_time=0)
+        yield f"search.rank.{size}", time_call(
+            lambda: query.rank_materials(catalog, "specific_stiffness", limit=20), repeat, min_time=0)
+        yield f"search.text.{size}", time_call(
+            lambda: query.filter_materials(catalog, search="steel"), repeat, min_time=0)
+
+
+def bench_validation(sizes, repeat) -> Iterator[Result]:
+    import schema
+
+    schema.validate_record({})  # compile outside the timed region
+    for size in sizes:
+        catalog = synthetic_catalog(size)
+        items = list(catalog.items())
+        yield f"validate.serial.{size}", time_call(lambda: schema.validate_records(items), min(repeat, 3), min_time=0)
+
+
+def bench_columns(sizes, repeat) -> Iterator[Result]:
+    from database import MaterialsTable
+
+    for size in sizes:
+        catalog = synthetic_catalog(size)
+        yield f"columns.build.{size}", time_call(lambda: MaterialsTable(catalog).columns(), repeat, min_time=0)
+
+
+def bench_similarity(sizes, repeat) -> Iterator[Result]:
+    from comparison import PROPERTY_SETS
+    from database import MaterialsTable
+    from similarity import average_linkage, feature_matrix, pairwise_distances
+
+    properties = PROPERTY_SETS["mechanical"] + PROPERTY_SETS["physical"]
+    for size in sizes:
+        size = min(size, SIMILARITY_MAX_SIZE)
+        table = MaterialsTable(synthetic_catalog(size))
+        features = feature_matrix(table, table.keys, properties)
+        distances = pairwise_distances(features)
+        yield f"similarity.distances.{size}", time_call(lambda: pairwise_distances(features), min(repeat, 3), min_time=0)
+        yield f"similarity.linkage.{size}", time_call(lambda: average_linkage(distances), min(repeat, 3), min_time=0)
+
+
+def bench_sizing(sizes, repeat) -> Iterator[Result]:
+    from database import MaterialsTable
+    from sizing import CANTILEVER, TORSION, LoadCase, size_sections
+
+    beam = LoadCase(CANTILEVER, 1000.0, 1.0, allowable=0.005)
+    shaft = LoadCase(TORSION, 500.0, 1.0, allowable=0.02)
+    for size in sizes:
+        table = MaterialsTable(synthetic_catalog(size))
+        yield f"sizing.beam.{size}", time_call(lambda: size_sections(table, beam), repeat)
+        yield f"sizing.shaft.{size}", time_call(lambda: size_sections(table, shaft), repeat)
+
+
+def bench_fatigue(sizes, repeat) -> Iterator[Result]:
+    import numpy as np
+    from database import MaterialsTable
+    from fatigue import LoadSpectrum, SNCurves, miner_damage
+
+    rng = np.random.default_rng(0)
+    spectrum = LoadSpectrum(rng.uniform(10, 300, 100_000), rng.uniform(-50, 200, 100_000),
+                            rng.integers(1, 1000, 100_000))
+    for size in sizes:
+        size = min(size, FATIGUE_MAX_SIZE)
+        curves = SNCurves(MaterialsTable(synthetic_catalog(size)), endurance_ratio=0.45)
+        yield f"fatigue.goodman.{size}x100k", time_call(lambda: miner_damage(curves, spectrum), min(repeat, 3), min_time=0)
+
+
+def bench_rainflow(sizes, repeat) -> Iterator[Result]:
+    import numpy as np
+    from cycle_counting import RainflowCounter
+
+    rng = np.random.default_rng(0)
+    history = 100 * np.sin(np.arange(RAINFLOW_SAMPLES) / 500) + rng.normal(size=RAINFLOW_SAMPLES)
+
+    def count():
+        counter = RainflowCounter(0.5)
+        for chunk in np.array_split(history, 10):
+            counter.update(chunk)
+        return counter.finish()
+
+    yield f"rainflow.{RAINFLOW_SAMPLES}", time_call(count, min(repeat, 3), min_time=0)
+
+
+def bench_quench(sizes, repeat) -> Iterator[Result]:
+    import quench
+    from database import MaterialsTable
+
+    case = quench.QuenchCase(quench.CYLINDER, 0.02, 850.0, 25.0, quench.QUENCHANTS["water"], 300.0)
+    for size in sizes:
+        size = min(size, QUENCH_MAX_SIZE)
+        table = MaterialsTable(synthetic_catalog(size))
+
+        def run_uncached():
+            quench._cache.clear()
+            return quench.simulate_quench(table, case)
+
+        yield f"quench.cylinder.{size}", time_call(run_uncached, min(repeat, 3), min_time=0)
+
+
+def bench_stress_strain(sizes, repeat) -> Iterator[Result]:
+    from database import MaterialsTable
+    from stress_strain import stress_strain_curves
+
+    for size in sizes:
+        table = MaterialsTable(synthetic_catalog(size))
+        yield f"stress_strain.{size}", time_call(lambda: stress_strain_curves(table), min(repeat, 3), min_time=0)
+
+
+def bench_downsample(sizes, repeat) -> Iterator[Result]:
+    import numpy as np
+    from downsample import MINMAX, decimate, point_budget
+
+    rng = np.random.default_rng(0)
+    x = np.arange(RAINFLOW_SAMPLES, dtype=np.float64)
+    y = 100 * np.sin(x / 500) + rng.normal(size=RAINFLOW_SAMPLES)
+    budget = point_budget()
+    yield f"downsample.lttb.{RAINFLOW_SAMPLES}", time_call(lambda: decimate(x, y, budget), repeat)
+    yield f"downsample.minmax.{RAINFLOW_SAMPLES}", time_call(lambda: decimate(x, y, budget, MINMAX), repeat)
+
+
+BENCHMARKS = {
+    "loader": bench_loader,
+    "render": bench_crystal_plots,
+    "compare": bench_comparisons,
+    "search": bench_search,
+    "validate": bench_validation,
+    "columns": bench_columns,
+    "similarity": bench_similarity,
+    "sizing": bench_sizing,
+    "fatigue": bench_fatigue,
+    "rainflow": bench_rainflow,
+    "quench": bench_quench,
+    "stress_strain": bench_stress_strain,
+    "downsample": bench_downsample,
+}
+
+# =============================================================================
+# RESULTS AND BASELINES
+# =============================================================================
+
+def run(sizes=DEFAULT_SIZES, only: Optional[List[str]] = None, repeat: int = 5, verbose: bool = True) -> Dict:
+    results = {}
+    for group, bench in BENCHMARKS.items():
+        if only and group not in only:
+            continue
+        for name, timing in bench(sizes, repeat):
+            results[name] = timing
+            if verbose:
+                extra = f"  {timing['bytes']:>10,} B" if "bytes" in timing else ""
+                print(f"{name:<45} {timing['ms']:>12.3f} ms{extra}")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Benchmarks whose median time (or payload size) grew by more than `threshold`"""
+    regressions = []
+    for name, before in baseline.get("results", {}).items():
+        after = current["results"].get(name)
+        if after is None:
+            continue
+        for metric in ("ms", "bytes"):
+            if before.get(metric) and metric in after and after[metric] > before[metric] * (1 + threshold):
+                regressions.append(f"{name} {metric}: {before[metric]:.3f} -> {after[metric]:.3f} "
+                                   f"(+{after[metric] / before[metric] - 1:.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the MEMD benchmark suite")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="synthetic catalog sizes (comma-separated)")
+    parser.add_argument("--only", help=f"comma-separated groups: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = +20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"also write {DEFAULT_BASELINE}")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    only = args.only.split(",") if args.only else None
+    current = run(sizes, only, args.repeat)
+
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(current, fh, indent=2)
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            regressions = compare(current, json.load(fh), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
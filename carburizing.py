@@ -0,0 +1,187 @@
+"""
+Carburizing
+Carbon diffusion into a steel surface held at a carbon potential, with
+Arrhenius diffusivity from a record's "diffusion" data:
+
+    D(T) = D0 exp(-Q / R T)
+
+For a constant surface carbon Cs over a core of C0 the profile is the
+error-function solution
+
+    C(x, t) = Cs - (Cs - C0) erf(x / 2√(D t))
+
+so the depth at which carbon falls to the case carbon is 2 z √(D t), with z
+fixed by the three compositions. A whole (temperature × time) process window
+is therefore one broadcast. Schedules whose temperature or carbon potential
+change (boost-diffuse cycles) are solved with an implicit finite-difference
+scheme instead. Compositions are wt% C, depths mm, times hours,
+temperatures °C.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+GAS_CONSTANT = 8.314  # J/mol·K
+CASE_CARBON = 0.40    # wt% C, roughly 50 HRC after quenching
+
+
+@dataclass(frozen=True)
+class DiffusionData:
+    """Arrhenius parameters of one solute: D0 (m²/s), Q (kJ/mol)"""
+    D0: float
+    Q: float
+
+    def diffusivity(self, temperature) -> np.ndarray:
+        """D (m²/s) at temperature(s) in °C"""
+        kelvin = np.asarray(temperature, dtype=np.float64) + 273.15
+        return self.D0 * np.exp(-self.Q * 1e3 / (GAS_CONSTANT * kelvin))
+
+
+def diffusion_data(record: Dict, solute: str = "C") -> Optional[DiffusionData]:
+    """A material's diffusion parameters for a solute, or None when it lists none"""
+    data = (record.get("diffusion") or {}).get(solute)
+    if not data:
+        return None
+    return DiffusionData(float(data["D0"]), float(data["Q"]))
+
+
+def erf(x) -> np.ndarray:
+    """Vectorized error function (Abramowitz & Stegun 7.1.26, |error| < 1.5e-7)"""
+    x = np.asarray(x, dtype=np.float64)
+    t = 1.0 / (1.0 + 0.3275911 * np.abs(x))
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    return np.sign(x) * (1.0 - poly * np.exp(-x * x))
+
+
+def _erfinv(y: float) -> float:
+    """Inverse error function of one value in [0, 1) (bisection on math.erf)"""
+    low, high = 0.0, 6.0
+    for _ in range(60):
+        middle = 0.5 * (low + high)
+        if math.erf(middle) < y:
+            low = middle
+        else:
+            high = middle
+    return 0.5 * (low + high)
+
+
+# =============================================================================
+# ERROR-FUNCTION SOLUTION
+# =============================================================================
+
+def carbon_profile(data: DiffusionData, depth, hours, temperature, surface: float, core: float) -> np.ndarray:
+    """Carbon (wt%) at depth (mm) after hours at temperature; arguments broadcast"""
+    depth = np.asarray(depth, dtype=np.float64) * 1e-3
+    seconds = np.asarray(hours, dtype=np.float64) * 3600.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        argument = depth / (2.0 * np.sqrt(data.diffusivity(temperature) * seconds))
+    return surface - (surface - core) * erf(np.nan_to_num(argument, nan=np.inf))
+
+
+def case_depth(data: DiffusionData, hours, temperature, surface: float, core: float,
+               case_carbon: float = CASE_CARBON) -> np.ndarray:
+    """Depth (mm) at which carbon falls to case_carbon; hours and temperature broadcast"""
+    if not core < case_carbon < surface:
+        raise ValueError("Case carbon must lie between the core and surface carbon")
+    z = _erfinv((surface - case_carbon) / (surface - core))
+    seconds = np.asarray(hours, dtype=np.float64) * 3600.0
+    return 2.0 * z * np.sqrt(data.diffusivity(temperature) * seconds) * 1e3
+
+
+@dataclass
+class ProcessWindow:
+    """Case depth over a grid of temperatures (rows) and times (columns)"""
+    temperatures: np.ndarray
+    hours: np.ndarray
+    depth: np.ndarray
+    surface: float
+    core: float
+    case_carbon: float
+
+    def time_for(self, depth: float) -> np.ndarray:
+        """Hours needed for a case depth at each temperature (depth grows as √t)"""
+        rate = self.depth[:, -1] / np.sqrt(self.hours[-1])
+        with np.errstate(divide="ignore"):
+            return (depth / rate) ** 2
+
+
+def process_window(data: DiffusionData, temperatures: Sequence[float], hours: Sequence[float],
+                   surface: float, core: float, case_carbon: float = CASE_CARBON) -> ProcessWindow:
+    """Case depth for every (temperature, time) pair in one call"""
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+    hours = np.asarray(hours, dtype=np.float64)
+    depth = case_depth(data, hours[None, :], temperatures[:, None], surface, core, case_carbon)
+    return ProcessWindow(temperatures, hours, depth, surface, core, case_carbon)
+
+
+# =============================================================================
+# FINITE-DIFFERENCE SCHEDULES
+# =============================================================================
+
+@dataclass(frozen=True)
+class CarburizingStep:
+    """One stage of a schedule: hours at temperature (°C) under a carbon potential (wt%)"""
+    hours: float
+    temperature: float
+    carbon_potential: float
+
+    def __post_init__(self):
+        if self.hours <= 0:
+            raise ValueError("Step duration must be positive")
+        if self.carbon_potential < 0:
+            raise ValueError("Carbon potential cannot be negative")
+
+
+def diffuse(data: DiffusionData, schedule: Sequence[CarburizingStep], core: float,
+            depth: float = 3.0, nodes: int = 151, time_step: float = 60.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (depths mm, profiles) after each step of a schedule
+    profiles is (steps × nodes) in wt% C. The surface node is held at the step's
+    carbon potential and the inner boundary (at `depth` mm) has no flux.
+    Backward Euler; each step's matrix is constant, so it is inverted once and
+    every time step is one matrix-vector product.
+    """
+    if not schedule:
+        raise ValueError("The schedule has no steps")
+    depths = np.linspace(0.0, depth, nodes)
+    dx = depths[1] * 1e-3
+    carbon = np.full(nodes, float(core))
+    profiles = np.empty((len(schedule), nodes))
+    for k, step in enumerate(schedule):
+        count = max(1, int(round(step.hours * 3600.0 / time_step)))
+        ratio = float(data.diffusivity(step.temperature)) * (step.hours * 3600.0 / count) / dx ** 2
+        # Unknowns are nodes 1..n-1; node 0 is fixed at the carbon potential
+        size = nodes - 1
+        matrix = np.zeros((size, size))
+        index = np.arange(size)
+        matrix[index, index] = 1.0 + 2.0 * ratio
+        matrix[index[1:], index[:-1]] = -ratio
+        matrix[index[:-1], index[1:]] = -ratio
+        matrix[-1, -2] = -2.0 * ratio   # mirror node beyond the zero-flux boundary
+        inverse = np.linalg.inv(matrix)
+        boundary = np.zeros(size)
+        boundary[0] = ratio * step.carbon_potential
+        carbon[0] = step.carbon_potential
+        interior = carbon[1:]
+        for _ in range(count):
+            interior = inverse @ (interior + boundary)
+        carbon[1:] = interior
+        profiles[k] = carbon
+    return depths, profiles
+
+
+def profile_case_depth(depths: np.ndarray, profiles: np.ndarray, case_carbon: float = CASE_CARBON) -> np.ndarray:
+    """Depth (mm) where each profile first falls to case_carbon (0 if the surface is below it)"""
+    profiles = np.atleast_2d(profiles)
+    below = profiles <= case_carbon
+    first = np.argmax(below, axis=1)
+    rows = np.arange(len(profiles))
+    before = np.maximum(first - 1, 0)
+    c0, c1 = profiles[rows, before], profiles[rows, first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(c0 > c1, (c0 - case_carbon) / (c0 - c1), 0.0)
+    result = depths[before] + share * (depths[first] - depths[before])
+    return np.where(below.any(axis=1), result, np.nan)
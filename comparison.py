@@ -0,0 +1,125 @@
+"""
+Normalized Multi-Material Comparison
+Puts properties with different units (MPa, GPa, %, g/cm³...) on one common
+scale so any number of materials can be compared in a single chart.
+All normalizations work column-wise on the (materials × properties) matrix.
+
+    min-max   (x - min) / (max - min)            -> [0, 1]
+    log       min-max of log10(x)                -> [0, 1], for spans of decades
+    z-score   (x - mean) / std                   -> standard deviations
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from database import MaterialsTable
+from units import SI, property_label
+
+NORMALIZATIONS = ("min-max", "log", "z-score")
+
+PROPERTY_SETS: Dict[str, List[str]] = {
+    "mechanical": ["yield_strength", "tensile_strength", "youngs_modulus", "hardness", "elongation"],
+    "physical": ["density", "thermal_conductivity", "thermal_expansion", "melting_point"],
+}
+
+
+# =============================================================================
+# NORMALIZATION
+# =============================================================================
+
+def normalize(matrix: np.ndarray, method: str = "min-max") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Normalize every column of a (materials × properties) matrix
+    Returns (normalized, offset, scale) with normalized = (f(x) - offset) / scale,
+    where f is log10 for "log" and the identity otherwise. NaN stays NaN;
+    constant columns get scale 1.
+    """
+    if method not in NORMALIZATIONS:
+        raise ValueError(f"Unknown normalization '{method}' (expected one of {', '.join(NORMALIZATIONS)})")
+
+    values = np.asarray(matrix, dtype=np.float64)
+    if method == "log":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(values > 0, np.log10(np.where(values > 0, values, 1.0)), np.nan)
+
+    n_props = values.shape[1]
+    present = ~np.isnan(values).all(axis=0)
+    offset = np.full(n_props, np.nan)
+    scale = np.ones(n_props)
+    if present.any():
+        columns = values[:, present]
+        if method == "z-score":
+            offset[present] = np.nanmean(columns, axis=0)
+            spread = np.nanstd(columns, axis=0)
+        else:
+            offset[present] = np.nanmin(columns, axis=0)
+            spread = np.nanmax(columns, axis=0) - offset[present]
+        scale[present] = np.where(spread > 0, spread, 1.0)
+
+    return (values - offset) / scale, offset, scale
+
+
+def denormalize(normalized: np.ndarray, method: str, offset: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Raw property values for normalized positions (inverse of normalize)"""
+    values = np.asarray(normalized, dtype=np.float64) * scale + offset
+    return 10.0 ** values if method == "log" else values
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+@dataclass
+class Comparison:
+    """Selected materials with raw and normalized property matrices"""
+    keys: List[str]
+    names: List[str]
+    properties: List[str]
+    method: str
+    system: str
+    raw: np.ndarray
+    normalized: np.ndarray
+    offset: np.ndarray
+    scale: np.ndarray
+
+    @property
+    def labels(self) -> List[str]:
+        return [property_label(prop, self.system) for prop in self.properties]
+
+    def axis_ticks(self, column: int, count: int = 5) -> Tuple[np.ndarray, List[str]]:
+        """Evenly spaced tick positions on one normalized axis with raw-value labels"""
+        values = self.normalized[:, column]
+        if np.isnan(values).all():
+            return np.empty(0), []
+        ticks = np.linspace(np.nanmin(values), np.nanmax(values), count)
+        raw = denormalize(ticks, self.method, self.offset[column], self.scale[column])
+        return ticks, [f"{value:.3g}" for value in raw]
+
+
+def compare(table: MaterialsTable, keys: Sequence[str], properties: Sequence[str],
+            method: str = "min-max", system: str = SI, temperature: Optional[float] = None) -> Comparison:
+    """
+    Normalize the selected materials over the given properties in one pass
+    Raw values are in the unit system's display units, evaluated at
+    `temperature` (°C) when given. Properties missing for every selected
+    material are dropped.
+    """
+    keys = list(keys)
+    raw = table.matrix(properties, system, temperature)[table.positions(keys)]
+    present = ~np.isnan(raw).all(axis=0) if len(keys) else np.zeros(len(properties), dtype=bool)
+    properties = [prop for prop, keep in zip(properties, present) if keep]
+    raw = raw[:, present]
+    normalized, offset, scale = normalize(raw, method)
+    return Comparison(
+        keys=keys,
+        names=[table.materials[key]["name"] for key in keys],
+        properties=properties,
+        method=method,
+        system=system,
+        raw=raw,
+        normalized=normalized,
+        offset=offset,
+        scale=scale,
+    )
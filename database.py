@@ -0,0 +1,239 @@
+"""
+Columnar Materials Table
+Numeric properties of the whole catalog as contiguous NumPy columns, and the
+immutable MaterialsDatabase shared by every app session
+"""
+
+import threading
+from types import MappingProxyType
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from hardness import VICKERS, convert_hardness, native_scale
+from schema import PROPERTY_SCHEMA
+from store import content_version, load_materials
+from temperature import CurveIndex, Temperatures
+from thermal import DERIVED_PROPERTIES
+from units import SI, convert
+
+PROPERTY_FIELDS = list(PROPERTY_SCHEMA.keys())
+PROPERTY_UNITS = {prop: node.unit for prop, node in PROPERTY_SCHEMA.items()}
+PROPERTY_UNITS["hardness"] = VICKERS  # records keep their native scale, columns are Vickers
+
+# Columns evaluated "at T" kept per table (least recently used are dropped)
+TEMPERATURE_CACHE_SIZE = 256
+
+
+class MaterialsTable:
+    """Row access to material records plus cached float64 property columns"""
+
+    def __init__(self, materials: Dict[str, Dict]):
+        self.materials = materials
+        self.keys: List[str] = list(materials.keys())
+        self.index: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+        self._columns: Dict[str, np.ndarray] = {}
+        self._converted: Dict[Tuple[str, str], np.ndarray] = {}
+        self._curves: Dict[str, CurveIndex] = {}
+        self._hardness_scales: Optional[np.ndarray] = None
+        self._at: "OrderedDict[Tuple[str, float, str], np.ndarray]" = OrderedDict()
+        self._at_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def column(self, prop: str) -> np.ndarray:
+        """
+        Contiguous float64 column for one property (NaN where missing)
+        Names in thermal.DERIVED_PROPERTIES are virtual columns computed from
+        their inputs.
+        """
+        column = self._columns.get(prop)
+        if column is None and prop in DERIVED_PROPERTIES:
+            inputs = {name: self.column(name) for name in DERIVED_PROPERTIES[prop].inputs}
+            column = self._columns[prop] = self._derived(prop, inputs)
+        elif column is None:
+            column = np.fromiter(
+                (_as_float(self.materials[key]["properties"].get(prop)) for key in self.keys),
+                dtype=np.float64,
+                count=len(self.keys),
+            )
+            if prop == "hardness":
+                # Records keep their native scale; the column is Vickers for every material
+                column = convert_hardness(column, self.hardness_scales, VICKERS)
+            column.flags.writeable = False
+            self._columns[prop] = column
+        return column
+
+    @property
+    def hardness_scales(self) -> np.ndarray:
+        """Native hardness scale of every material (hardness.py names)"""
+        if self._hardness_scales is None:
+            self._hardness_scales = np.array([native_scale(self.materials[key]) for key in self.keys])
+        return self._hardness_scales
+
+    def hardness(self, scale: str = VICKERS) -> np.ndarray:
+        """Hardness of every material on one scale (NaN outside its range); cached per scale"""
+        if scale == VICKERS:
+            return self.column("hardness")
+        column = self._converted.get((scale, "hardness"))
+        if column is None:
+            column = self._converted[(scale, "hardness")] = _read_only(
+                convert_hardness(self.column("hardness"), VICKERS, scale))
+        return column
+
+    def curve(self, prop: str) -> CurveIndex:
+        """Packed temperature tables of one property (built on first use)"""
+        index = self._curves.get(prop)
+        if index is None:
+            index = self._curves[prop] = CurveIndex(prop, self.materials, self.keys, self.column(prop))
+        return index
+
+    def column_at(self, prop: str, temperature: Optional[float]) -> np.ndarray:
+        """Property column at a temperature in °C (None = room-temperature scalars)"""
+        return self.column_in(prop, SI, temperature)
+
+    def column_over(self, prop: str, temperatures: Temperatures) -> np.ndarray:
+        """(materials × temperatures) matrix of one property (not cached)"""
+        if prop in DERIVED_PROPERTIES:
+            return self._derived(prop, {name: self.column_over(name, temperatures)
+                                        for name in DERIVED_PROPERTIES[prop].inputs})
+        return self.curve(prop).evaluate(np.atleast_1d(temperatures))
+
+    def column_in(self, prop: str, system: str = SI, temperature: Optional[float] = None) -> np.ndarray:
+        """
+        Property column in a unit system's display unit, optionally at a
+        temperature; each variant is computed once and cached. Virtual
+        columns have a single (SI) unit.
+        """
+        if prop in DERIVED_PROPERTIES:
+            system = SI
+        if temperature is None:
+            if system == SI:
+                return self.column(prop)
+            column = self._converted.get((system, prop))
+            if column is None:
+                column = self._converted[(system, prop)] = _read_only(convert(self.column(prop), prop, system))
+            return column
+
+        cache_key = (prop, float(temperature), system)
+        with self._at_lock:
+            column = self._at.get(cache_key)
+            if column is not None:
+                self._at.move_to_end(cache_key)
+                return column
+        if prop in DERIVED_PROPERTIES:
+            inputs = DERIVED_PROPERTIES[prop].inputs
+            column = self._derived(prop, {name: self.column_in(name, SI, temperature) for name in inputs})
+        elif system == SI:
+            index = self.curve(prop)
+            column = _read_only(index.evaluate(temperature)) if len(index) else self.column(prop)
+        else:
+            column = _read_only(convert(self.column_in(prop, SI, temperature), prop, system))
+        with self._at_lock:
+            self._at[cache_key] = column
+            while len(self._at) > TEMPERATURE_CACHE_SIZE:
+                self._at.popitem(last=False)
+        return column
+
+    def columns(self, props: Optional[Iterable[str]] = None, system: str = SI,
+                temperature: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Property columns keyed by property name"""
+        return {prop: self.column_in(prop, system, temperature) for prop in (props or PROPERTY_FIELDS)}
+
+    def matrix(self, props: Iterable[str], system: str = SI, temperature: Optional[float] = None) -> np.ndarray:
+        """(materials × properties) float64 matrix"""
+        props = list(props)
+        if not props:
+            return np.empty((len(self.keys), 0))
+        return np.column_stack([self.column_in(prop, system, temperature) for prop in props])
+
+    def values(self, key: str, props: Optional[Iterable[str]] = None, system: str = SI,
+               temperature: Optional[float] = None) -> Dict[str, float]:
+        """One material's properties in a unit system, read from the cached columns"""
+        row = self.index[key]
+        return {prop: float(self.column_in(prop, system, temperature)[row]) for prop in (props or PROPERTY_FIELDS)}
+
+    @staticmethod
+    def _derived(prop: str, inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            column = np.asarray(DERIVED_PROPERTIES[prop].formula(inputs), dtype=np.float64)
+        return _read_only(np.where(np.isfinite(column), column, np.nan))
+
+    def positions(self, keys: Iterable[str]) -> np.ndarray:
+        """Row indices for a sequence of material keys"""
+        return np.fromiter((self.index[key] for key in keys), dtype=np.intp)
+
+
+def _read_only(values) -> np.ndarray:
+    column = np.asarray(values, dtype=np.float64)
+    column.flags.writeable = False
+    return column
+
+
+def _as_float(value) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return np.nan
+
+
+# =============================================================================
+# SHARED IMMUTABLE DATABASE
+# =============================================================================
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain dict / list copy of a frozen value (for APIs that reject mappingproxy and tuple)"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
+
+
+class MaterialsDatabase(MaterialsTable):
+    """
+    Read-only catalog plus derived indexes, built once per process and shared
+    by every session. Records are frozen so no session can mutate them.
+    """
+
+    def __init__(self, materials: Dict[str, Dict]):
+        self.version = content_version(materials)
+        super().__init__(MappingProxyType({key: freeze(record) for key, record in materials.items()}))
+
+        by_category: Dict[str, List[str]] = {}
+        name_to_key: Dict[str, str] = {}
+        for key, material in self.materials.items():
+            by_category.setdefault(material["category"], []).append(key)
+            name_to_key.setdefault(material["name"], key)
+
+        self.categories: Tuple[str, ...] = tuple(by_category)
+        self.by_category: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {category: tuple(keys) for category, keys in by_category.items()}
+        )
+        self.name_to_key: Mapping[str, str] = MappingProxyType(name_to_key)
+        self.names: Tuple[str, ...] = tuple(name_to_key)
+
+
+_shared: Dict[Optional[str], MaterialsDatabase] = {}
+_shared_lock = threading.Lock()
+
+
+def get_database(store_path: Optional[str] = None) -> MaterialsDatabase:
+    """Process-wide MaterialsDatabase for a store (built on first use)"""
+    database = _shared.get(store_path)
+    if database is None:
+        with _shared_lock:
+            database = _shared.get(store_path)
+            if database is None:
+                database = _shared[store_path] = MaterialsDatabase(load_materials(store_path))
+    return database
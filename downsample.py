@@ -0,0 +1,213 @@
+"""
+Line Downsampling
+Reduces dense line traces to a point budget before they are serialized into
+a figure, so the payload stays bounded however long the data is.
+
+    lttb     Largest-Triangle-Three-Buckets: per bucket keeps the point that
+             forms the largest triangle with its neighbours' selections
+             (best visual shape for smooth curves)
+    minmax   keeps the minimum and maximum of every bucket, so no peak is lost
+             (load histories, noisy signals)
+
+The budget follows the chart width: POINTS_PER_PIXEL points per horizontal
+pixel, since more cannot be drawn. `decimate_figure` applies this to every
+line trace of a Plotly figure (NaN gaps between curves are kept).
+`stream_window` min-max reduces one window of a chunked history while it
+streams, so zooming into a window re-reads it at full budget without loading
+the whole series.
+"""
+
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_CHART_WIDTH = 1200   # px, a wide-layout chart
+POINTS_PER_PIXEL = 2
+# Traces at or below this many points are never reduced
+MIN_POINTS = 500
+# Points every reduced curve keeps (its ends and, for minmax, one bucket's extremes)
+CURVE_POINTS = 4
+LTTB = "lttb"
+MINMAX = "minmax"
+METHODS = (LTTB, MINMAX)
+
+
+def point_budget(width_px: Optional[float] = None) -> int:
+    """Points worth sending for a chart width in pixels"""
+    return max(MIN_POINTS, int(POINTS_PER_PIXEL * (width_px or DEFAULT_CHART_WIDTH)))
+
+
+# =============================================================================
+# INDEX SELECTION
+# =============================================================================
+
+def minmax_indices(y: np.ndarray, buckets: int) -> np.ndarray:
+    """Sorted indices of the minimum and maximum of each of `buckets` equal buckets"""
+    n = len(y)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.empty(buckets * size)
+    padded[:n] = y
+    padded[n:] = np.nan
+    blocks = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    low = offsets + np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1)
+    high = offsets + np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1)
+    return np.unique(np.concatenate([low, high, [0, n - 1]]))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection of `threshold` points (first and
+    last always kept). Bucket averages are computed for all buckets at once;
+    only the choice inside each bucket, which depends on the previous pick,
+    runs per bucket.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.intp)
+    starts, stops = edges[:-1], edges[1:]
+    counts = stops - starts
+    # Average of the following bucket (the last point for the final bucket)
+    mean_x = np.append(np.add.reduceat(x[1:n - 1], starts - 1) / counts, x[-1])[1:]
+    mean_y = np.append(np.add.reduceat(y[1:n - 1], starts - 1) / counts, y[-1])[1:]
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for k, (start, stop) in enumerate(zip(starts, stops)):
+        ax, ay = x[previous], y[previous]
+        # Twice the triangle area with the previous pick and the next bucket's average
+        area = np.abs((ax - mean_x[k]) * (y[start:stop] - ay) - (ax - x[start:stop]) * (mean_y[k] - ay))
+        previous = start + int(np.argmax(area))
+        selected[k + 1] = previous
+    return selected
+
+
+def decimate(x, y, budget: int, method: str = LTTB) -> np.ndarray:
+    """
+    Indices of at most `budget` points of a line (x ascending within each
+    curve), the NaN gaps included. NaN in y separates curves; one NaN is kept
+    between curves and each curve gets CURVE_POINTS plus a share of the rest
+    of the budget proportional to its length. When there are more curves
+    than the budget can show, only the longest ones that fit are kept.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}' (expected one of {', '.join(METHODS)})")
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= budget:
+        return np.arange(n)
+    finite = ~(np.isnan(y) | np.isnan(x))
+    # Runs of finite points: (start, stop) pairs
+    change = np.diff(np.concatenate([[False], finite, [False]]).astype(np.int8))
+    runs = np.column_stack([np.flatnonzero(change == 1), np.flatnonzero(change == -1)])
+    if not len(runs):
+        return np.empty(0, dtype=np.intp)
+    lengths = runs[:, 1] - runs[:, 0]
+    # Fewest points of a curve plus its gap
+    cost = np.minimum(lengths, CURVE_POINTS) + (runs[:, 1] < n)
+    if cost.sum() > budget:
+        order = np.argsort(-lengths, kind="stable")
+        fits = np.cumsum(cost[order]) <= budget
+        fits[0] = True
+        keep = np.sort(order[fits])
+        runs, lengths, cost = runs[keep], lengths[keep], cost[keep]
+    spare = max(0, budget - int(cost.sum()))
+    total = int(lengths.sum())
+    pieces = []
+    for (start, stop), length in zip(runs, lengths):
+        share = min(length, CURVE_POINTS) + spare * length // total
+        if method == LTTB:
+            picked = lttb_indices(x[start:stop], y[start:stop], share)
+        else:
+            # Bucket extremes plus the first and last point
+            picked = minmax_indices(y[start:stop], max(1, (share - 2) // 2))
+        pieces.append(start + picked)
+        if stop < n:
+            pieces.append(np.array([stop]))   # the NaN gap after the curve
+    return np.concatenate(pieces)
+
+
+# =============================================================================
+# FIGURES AND STREAMS
+# =============================================================================
+
+# Per-point trace attributes that must follow the selected indices
+_POINT_ATTRIBUTES = ("text", "hovertext", "customdata")
+
+
+def decimate_figure(fig, budget: Optional[int] = None, method: str = LTTB) -> int:
+    """
+    Reduce every line trace of a Plotly figure longer than the budget in
+    place; returns the number of points removed
+    """
+    budget = budget or point_budget(fig.layout.width)
+    removed = 0
+    for trace in fig.data:
+        if trace.type not in ("scatter", "scattergl") or "lines" not in (trace.mode or "lines"):
+            continue
+        if trace.x is None or trace.y is None or len(trace.y) <= budget:
+            continue
+        x, y = np.asarray(trace.x, dtype=np.float64), np.asarray(trace.y, dtype=np.float64)
+        keep = decimate(x, y, budget, method)
+        updates = {"x": x[keep], "y": y[keep]}
+        for name in _POINT_ATTRIBUTES:
+            values = getattr(trace, name, None)
+            if values is not None and not isinstance(values, str) and len(values) == len(y):
+                updates[name] = np.asarray(values, dtype=object)[keep]
+        trace.update(updates)
+        removed += len(y) - len(keep)
+    return removed
+
+
+def stream_window(chunks: Iterable, start: int, stop: int, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (sample positions, values) of the min and max of `buckets` equal buckets
+    over samples [start, stop) of a chunked series, read in one pass with
+    only one chunk in memory
+    """
+    if stop <= start:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    buckets = max(1, min(buckets, stop - start))
+    low_value = np.full(buckets, np.inf)
+    high_value = np.full(buckets, -np.inf)
+    low_at = np.zeros(buckets, dtype=np.int64)
+    high_at = np.zeros(buckets, dtype=np.int64)
+    offset = 0
+    for chunk in chunks:
+        values = np.asarray(chunk, dtype=np.float64).ravel()
+        first, last = max(start, offset), min(stop, offset + len(values))
+        if first < last:
+            part = values[first - offset:last - offset]
+            positions = np.arange(first, last)
+            bucket = (positions - start) * buckets // (stop - start)
+            finite = ~np.isnan(part)
+            part, positions, bucket = part[finite], positions[finite], bucket[finite]
+            # Bucket numbers ascend, so each bucket is one contiguous run of the chunk
+            if len(part):
+                edges = np.flatnonzero(np.diff(bucket)) + 1
+                heads = np.concatenate([[0], edges])
+                ids = bucket[heads]
+                run = np.repeat(np.arange(len(heads)), np.diff(np.append(heads, len(part))))
+                order = np.lexsort((part, run))
+                lows = order[np.searchsorted(run[order], np.arange(len(heads)))]
+                highs = order[np.searchsorted(run[order], np.arange(len(heads)), side="right") - 1]
+                better = part[lows] < low_value[ids]
+                low_value[ids[better]], low_at[ids[better]] = part[lows][better], positions[lows][better]
+                better = part[highs] > high_value[ids]
+                high_value[ids[better]], high_at[ids[better]] = part[highs][better], positions[highs][better]
+        offset += len(values)
+        if offset >= stop:
+            break
+    filled = np.isfinite(low_value)
+    at = np.concatenate([low_at[filled], high_at[filled]])
+    values = np.concatenate([low_value[filled], high_value[filled]])
+    order = np.argsort(at, kind="stable")
+    at, values = at[order], values[order]
+    unique = np.concatenate([[True], np.diff(at) != 0]) if len(at) else np.empty(0, dtype=bool)
+    return at[unique], values[unique]
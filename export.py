@@ -0,0 +1,195 @@
+"""
+Arrow / Parquet Export
+Exports the materials database for pandas, Polars and DuckDB. Numeric
+properties become contiguous float64 columns (handed to Arrow without copying),
+composition and crystal structure become list/struct columns.
+
+Usage:
+    python export.py materials.parquet
+    python export.py materials.arrow --format arrow --batch-size 50000
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, Iterator, List, Optional
+
+from database import PROPERTY_FIELDS, PROPERTY_UNITS, MaterialsTable, thaw
+from prototypes import get_atomic_positions
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("Arrow/Parquet export requires pyarrow (pip install pyarrow)") from exc
+    return pa
+
+
+# =============================================================================
+# ARROW SCHEMA
+# =============================================================================
+
+def arrow_schema():
+    """Arrow schema of an exported materials table"""
+    pa = _pyarrow()
+    atom = pa.struct([
+        ("element", pa.string()),
+        ("x", pa.float64()),
+        ("y", pa.float64()),
+        ("z", pa.float64()),
+        ("type", pa.string()),
+    ])
+    lattice = pa.struct([(name, pa.float64()) for name in ("a", "b", "c", "alpha", "beta", "gamma")])
+    crystal = pa.struct([
+        ("crystal_system", pa.string()),
+        ("structure_type", pa.string()),
+        ("prototype", pa.string()),
+        ("space_group", pa.string()),
+        ("lattice_parameters", lattice),
+        ("atomic_positions", pa.list_(atom)),
+        ("coordination_number", pa.int32()),
+        ("atomic_packing_factor", pa.float64()),
+        ("atoms_per_unit_cell", pa.float64()),
+        ("description", pa.string()),
+    ])
+    composition = pa.list_(pa.struct([("element", pa.string()), ("fraction", pa.float64())]))
+
+    fields = [
+        pa.field("key", pa.string(), nullable=False),
+        pa.field("name", pa.string()),
+        pa.field("class", pa.string()),
+        pa.field("category", pa.string()),
+    ]
+    fields += [
+        pa.field(prop, pa.float64(), metadata={"unit": PROPERTY_UNITS[prop]})
+        for prop in PROPERTY_FIELDS
+    ]
+    fields += [
+        pa.field("composition", composition),
+        pa.field("crystal_structure", crystal),
+        pa.field("applications", pa.list_(pa.string())),
+        pa.field("characteristics", pa.list_(pa.string())),
+        pa.field("educational_insights", pa.list_(pa.string())),
+        pa.field("sources", pa.list_(pa.string())),
+    ]
+    return pa.schema(fields, metadata={"source": "MEMD materials database"})
+
+
+def _crystal_row(crystal: Optional[Dict]) -> Optional[Dict]:
+    if not crystal:
+        return None
+    row = {name: crystal.get(name) for name in (
+        "crystal_system", "structure_type", "prototype", "space_group", "coordination_number",
+        "atomic_packing_factor", "atoms_per_unit_cell", "description",
+    )}
+    row["lattice_parameters"] = crystal.get("lattice_parameters")
+    row["atomic_positions"] = get_atomic_positions(crystal)
+    return row
+
+
+# =============================================================================
+# RECORD BATCHES
+# =============================================================================
+
+def iter_record_batches(table: MaterialsTable, batch_size: int = 10000) -> Iterator:
+    """
+    Yield Arrow record batches covering the whole table
+    Numeric columns are zero-copy slices of the table's NumPy columns
+    """
+    pa = _pyarrow()
+    schema = arrow_schema()
+    numeric = {prop: pa.array(column, type=pa.float64()) for prop, column in table.columns().items()}
+
+    for start in range(0, len(table), batch_size):
+        keys = table.keys[start:start + batch_size]
+        # Records of the shared database are frozen; pyarrow only converts dicts and lists
+        records = [thaw(table.materials[key]) for key in keys]
+        arrays = [
+            pa.array(keys, pa.string()),
+            pa.array([r.get("name") for r in records], pa.string()),
+            pa.array([r.get("class") for r in records], pa.string()),
+            pa.array([r.get("category") for r in records], pa.string()),
+        ]
+        arrays += [numeric[prop].slice(start, len(keys)) for prop in PROPERTY_FIELDS]
+        arrays += [
+            pa.array(
+                [[{"element": e, "fraction": f} for e, f in r.get("composition", {}).items()] for r in records],
+                schema.field("composition").type,
+            ),
+            pa.array([_crystal_row(r.get("crystal_structure")) for r in records],
+                     schema.field("crystal_structure").type),
+        ]
+        for list_field in ("applications", "characteristics", "educational_insights", "sources"):
+            arrays.append(pa.array([r.get(list_field, []) for r in records], pa.list_(pa.string())))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_arrow_table(table: Optional[MaterialsTable] = None):
+    """Whole catalog as a single pyarrow.Table"""
+    pa = _pyarrow()
+    if table is None:
+        table = _load_table()
+    return pa.Table.from_batches(list(iter_record_batches(table, batch_size=max(len(table), 1))),
+                                 schema=arrow_schema())
+
+
+def write_parquet(path: str, table: Optional[MaterialsTable] = None, batch_size: int = 10000,
+                  compression: str = "zstd") -> int:
+    """Stream the catalog into one Parquet file; returns the number of rows"""
+    import pyarrow.parquet as pq
+
+    if table is None:
+        table = _load_table()
+    rows = 0
+    with pq.ParquetWriter(path, arrow_schema(), compression=compression) as writer:
+        for batch in iter_record_batches(table, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def write_arrow(path: str, table: Optional[MaterialsTable] = None, batch_size: int = 10000) -> int:
+    """Stream the catalog into one Arrow IPC (Feather v2) file; returns the number of rows"""
+    pa = _pyarrow()
+    if table is None:
+        table = _load_table()
+    rows = 0
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, arrow_schema()) as writer:
+        for batch in iter_record_batches(table, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def _load_table(store_path: Optional[str] = None) -> MaterialsTable:
+    from store import load_materials
+    return MaterialsTable(load_materials(store_path))
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+WRITERS = {"parquet": write_parquet, "arrow": write_arrow}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export the MEMD materials database to Arrow or Parquet")
+    parser.add_argument("output", help="output file")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="default: from extension (parquet)")
+    parser.add_argument("--store", help="store file to export together with Solbase")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "arrow" if os.path.splitext(args.output)[1].lower() in (".arrow", ".feather", ".ipc") else "parquet"
+
+    rows = WRITERS[fmt](args.output, _load_table(args.store), batch_size=args.batch_size)
+    print(f"Wrote {rows} materials to {args.output} ({fmt})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
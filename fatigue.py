@@ -0,0 +1,343 @@
+"""
+Fatigue Life Estimation
+Stress-life screening of every material against a constant-amplitude load or
+a load spectrum (blocks of amplitude, mean and cycle count).
+
+    S-N line (Basquin)    σ_ar = A N^b through (10³, 0.9 σ_uts) and (10⁶, fatigue_strength)
+    Goodman               σ_ar = σ_a / (1 - σ_m / σ_uts)
+    Gerber                σ_ar = σ_a / (1 - (σ_m / σ_uts)²)
+    Miner                 D = Σ n_i / N_i,  life = 1 / D spectrum passes
+
+Iron- and titanium-based materials have an endurance limit at 10⁶ cycles
+(amplitudes below fatigue_strength do no damage); the others follow the
+Basquin line indefinitely. Compressive means get no benefit. Stresses are in
+MPa.
+
+Damage is a (materials × blocks) computation done in float32 chunks in the
+log domain, reduced with one matrix-vector product per chunk, so memory
+stays bounded and 10k materials × 10⁵ blocks runs in seconds.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from database import MaterialsTable
+
+METHODS = ("goodman", "gerber", "none")
+
+LOW_CYCLE = 1e3
+LOW_CYCLE_FRACTION = 0.9
+ENDURANCE_CYCLES = 1e6
+# Base elements whose S-N curves flatten at the endurance limit
+ENDURANCE_ELEMENTS = ("Fe", "Ti")
+
+# (materials × blocks) chunk: float32 work buffers that stay in cache
+CHUNK_BLOCKS = 8192
+CHUNK_ELEMENTS = 131_072
+# ln of the smallest damage per cycle kept; anything below is dropped rather
+# than computed as a (slow) float32 denormal
+LOG_DAMAGE_FLOOR = -80.0
+
+
+# =============================================================================
+# S-N CURVES
+# =============================================================================
+
+class SNCurves:
+    """
+    Basquin S-N lines of the selected materials as arrays
+    Materials without tensile or fatigue strength get NaN unless
+    endurance_ratio is given, in which case a missing fatigue strength is
+    estimated as endurance_ratio × tensile strength.
+    """
+
+    def __init__(self, table: MaterialsTable, keys: Optional[Sequence[str]] = None,
+                 temperature: Optional[float] = None, endurance_ratio: Optional[float] = None):
+        self.keys = list(keys) if keys is not None else table.keys
+        rows = table.positions(self.keys)
+        ultimate = table.column_at("tensile_strength", temperature)[rows]
+        endurance = table.column_at("fatigue_strength", temperature)[rows]
+        if endurance_ratio is not None:
+            endurance = np.where(endurance > 0, endurance, endurance_ratio * ultimate)
+        valid = (ultimate > 0) & (endurance > 0) & (endurance < LOW_CYCLE_FRACTION * ultimate)
+
+        self.ultimate = np.where(valid, ultimate, np.nan)
+        self.endurance = np.where(valid, endurance, np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.exponent = np.log(self.endurance / (LOW_CYCLE_FRACTION * self.ultimate)) / np.log(ENDURANCE_CYCLES / LOW_CYCLE)
+        self.coefficient = LOW_CYCLE_FRACTION * self.ultimate / LOW_CYCLE ** self.exponent
+        self.knee = np.array([_has_endurance_limit(table.materials[key]) for key in self.keys], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def per_unit(self, scale) -> "SNCurves":
+        """
+        The same lines expressed in load units worth `scale` MPa each (a float
+        or one value per material, e.g. E for strain input)
+        """
+        curves = copy.copy(self)
+        curves.ultimate = self.ultimate / scale
+        curves.endurance = self.endurance / scale
+        curves.coefficient = self.coefficient / scale
+        return curves
+
+    def strength_at(self, cycles: float) -> np.ndarray:
+        """Fully reversed amplitude each material survives for `cycles`"""
+        strength = self.coefficient * cycles ** self.exponent
+        if cycles >= ENDURANCE_CYCLES:
+            strength = np.where(self.knee, self.endurance, strength)
+        return strength
+
+    def cycles_at(self, amplitude: np.ndarray) -> np.ndarray:
+        """Cycles to failure at a fully reversed amplitude (inf below an endurance limit)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cycles = (np.asarray(amplitude, dtype=np.float64) / self.coefficient) ** (1.0 / self.exponent)
+        return np.where(self.knee & (amplitude <= self.endurance), np.inf, cycles)
+
+
+def _has_endurance_limit(record) -> bool:
+    composition = record.get("composition") or {}
+    return any(composition.get(element, 0.0) >= 0.5 for element in ENDURANCE_ELEMENTS)
+
+
+def equivalent_amplitude(amplitude, mean, ultimate, method: str = "goodman"):
+    """Fully reversed amplitude with the same life (broadcasts; inf once σ_m ≥ σ_uts)"""
+    if method not in METHODS:
+        raise ValueError(f"Unknown mean-stress correction '{method}' (expected one of {', '.join(METHODS)})")
+    amplitude = np.asarray(amplitude, dtype=np.float64)
+    if method == "none":
+        return amplitude
+    ratio = np.maximum(mean, 0.0) / ultimate
+    factor = 1.0 - (ratio if method == "goodman" else ratio ** 2)
+    with np.errstate(divide="ignore"):
+        return np.where(factor > 0, amplitude / np.where(factor > 0, factor, 1.0), np.inf)
+
+
+# =============================================================================
+# LOAD SPECTRA
+# =============================================================================
+
+@dataclass
+class LoadSpectrum:
+    """Load blocks: amplitude and mean stress (MPa) with cycle counts"""
+    amplitude: np.ndarray
+    mean: np.ndarray
+    counts: np.ndarray
+
+    def __post_init__(self):
+        self.amplitude = np.abs(np.asarray(self.amplitude, dtype=np.float64).ravel())
+        self.mean = np.broadcast_to(np.asarray(self.mean, dtype=np.float64), self.amplitude.shape).copy()
+        self.counts = np.broadcast_to(np.asarray(self.counts, dtype=np.float64), self.amplitude.shape).copy()
+
+    @classmethod
+    def constant(cls, amplitude: float, mean: float = 0.0, cycles: float = ENDURANCE_CYCLES) -> "LoadSpectrum":
+        return cls(np.array([amplitude]), np.array([mean]), np.array([cycles]))
+
+    def __len__(self) -> int:
+        return len(self.amplitude)
+
+    @property
+    def cycles(self) -> float:
+        return float(self.counts.sum())
+
+    def compact(self) -> "LoadSpectrum":
+        """Identical (amplitude, mean) blocks merged, zero-count and zero-amplitude blocks dropped"""
+        keep = (self.counts > 0) & (self.amplitude > 0)
+        pairs = np.column_stack([self.amplitude[keep], self.mean[keep]])
+        unique, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=self.counts[keep], minlength=len(unique))
+        return LoadSpectrum(unique[:, 0], unique[:, 1], counts)
+
+
+# =============================================================================
+# DAMAGE
+# =============================================================================
+
+def miner_damage(curves: SNCurves, spectrum: LoadSpectrum, method: str = "goodman",
+                 knee: bool = True) -> np.ndarray:
+    """
+    Miner damage of one spectrum pass for every material
+    With knee=False the endurance limits are ignored (elementary Miner).
+    A mean stress at or above the tensile strength gives infinite damage.
+    """
+    damage, elementary = _miner(curves, spectrum, method, elementary=not knee)
+    return elementary if not knee else damage
+
+
+def _miner(curves: SNCurves, spectrum: LoadSpectrum, method: str, elementary: bool = False):
+    """(damage, elementary damage or None) in one pass over the blocks"""
+    equivalent_amplitude(0.0, 0.0, 1.0, method)  # validates method
+    spectrum = spectrum.compact()
+    damage = np.where(np.isnan(curves.coefficient), np.nan, 0.0)
+    if method != "none" and len(spectrum):
+        # Mean stress at or above the tensile strength: fails on the first cycle
+        damage[spectrum.mean.max() >= curves.ultimate] = np.inf
+    plain = damage.copy() if elementary else None
+
+    # Only materials with a finite, non-trivial result go through the chunks
+    # (NaN and -inf inputs send the float32 log onto its slow path)
+    active = np.flatnonzero(damage == 0.0)
+    if len(spectrum) and len(active):
+        slope = -1.0 / curves.exponent[active]
+        result = _accumulate(
+            slope,
+            np.log(curves.coefficient[active]) * slope,
+            np.where(curves.knee[active], -np.log(ENDURANCE_CYCLES), LOG_DAMAGE_FLOOR),
+            curves.ultimate[active],
+            spectrum, method, elementary,
+        )
+        damage[active] = result[0]
+        if plain is not None:
+            plain[active] = result[1]
+    return damage, plain
+
+
+def _split(values: np.ndarray):
+    """float32 (high, low) parts whose sum is a float64 array to ~1e-14 relative"""
+    high = values.astype(np.float32)
+    return high, (values - high).astype(np.float32)
+
+
+def _accumulate(slope: np.ndarray, offset: np.ndarray, cutoff: np.ndarray, ultimate: np.ndarray,
+                spectrum: LoadSpectrum, method: str, elementary: bool):
+    """
+    Σ n_i / N_i per material over (material, block) chunks, with and without
+    the endurance cutoff. ln(damage per cycle) = slope (ln σ_a - ln f) - offset
+    with slope = -1/b and offset = slope ln A.
+
+    ln f is taken as ln(σ_uts - σ_m) (+ ln(σ_uts + σ_m) for Gerber) less a per
+    material ln σ_uts folded into offset. The difference is formed from split
+    float32 parts, so it stays exact as σ_m nears σ_uts, where 1 - σ_m/σ_uts
+    would cancel in float32.
+    """
+    m = len(slope)
+    damage = np.zeros(m)
+    plain = np.zeros(m) if elementary else None
+    log_amplitude = np.log(spectrum.amplitude).astype(np.float32)
+    mean = np.maximum(spectrum.mean, 0.0)
+    counts = spectrum.counts.astype(np.float32)
+    corrected = method != "none" and bool(mean.any())
+    if corrected:
+        offset = offset - (1 if method == "goodman" else 2) * slope * np.log(ultimate)
+    ultimate_high, ultimate_low = _split(ultimate)
+    mean_high, mean_low = _split(mean)
+    slope, offset, cutoff = slope.astype(np.float32), offset.astype(np.float32), cutoff.astype(np.float32)
+
+    n_blocks = len(spectrum)
+    block_chunk = min(n_blocks, CHUNK_BLOCKS)
+    material_chunk = max(1, CHUNK_ELEMENTS // block_chunk)
+    buffer = np.empty((min(m, material_chunk), block_chunk), dtype=np.float32)
+    scratch = np.empty_like(buffer)
+    low = np.empty_like(buffer)
+    keep = np.empty(buffer.shape, dtype=bool)
+
+    with np.errstate(divide="ignore", over="ignore"):
+        for b0 in range(0, n_blocks, block_chunk):
+            b1 = min(b0 + block_chunk, n_blocks)
+            for m0 in range(0, m, material_chunk):
+                m1 = min(m0 + material_chunk, m)
+                shape = (m1 - m0, b1 - b0)
+                x = buffer[:shape[0], :shape[1]]
+                if corrected:
+                    # ln(σ_uts - σ_m): the high parts subtract exactly near σ_m = σ_uts
+                    f = scratch[:shape[0], :shape[1]]
+                    g = low[:shape[0], :shape[1]]
+                    np.subtract(ultimate_high[m0:m1, None], mean_high[None, b0:b1], out=f)
+                    np.subtract(ultimate_low[m0:m1, None], mean_low[None, b0:b1], out=g)
+                    f += g
+                    np.log(f, out=f)
+                    if method == "gerber":
+                        np.add(ultimate_high[m0:m1, None], mean_high[None, b0:b1], out=g)
+                        np.log(g, out=g)
+                        f += g
+                    np.subtract(log_amplitude[None, b0:b1], f, out=x)
+                else:
+                    np.copyto(x, np.broadcast_to(log_amplitude[None, b0:b1], shape))
+                x *= slope[m0:m1, None]
+                x -= offset[m0:m1, None]
+                mask = keep[:shape[0], :shape[1]]
+                np.greater_equal(x, cutoff[m0:m1, None], out=mask)
+                np.maximum(x, LOG_DAMAGE_FLOOR, out=x)
+                np.exp(x, out=x)
+                if plain is not None:
+                    plain[m0:m1] += x @ counts[b0:b1]
+                np.multiply(x, mask, out=x)
+                damage[m0:m1] += x @ counts[b0:b1]
+    return damage, plain
+
+
+# =============================================================================
+# LIFE AND SAFETY FACTOR
+# =============================================================================
+
+@dataclass
+class FatigueResult:
+    """Damage, life and stress safety factor of every material for one spectrum"""
+    keys: List[str]
+    names: List[str]
+    method: str
+    cycles_per_pass: float
+    damage: np.ndarray           # per spectrum pass
+    life: np.ndarray             # spectrum passes to failure
+    safety_factor: np.ndarray    # on stress, for the design passes
+
+    @property
+    def life_cycles(self) -> np.ndarray:
+        return self.life * self.cycles_per_pass
+
+    def order(self) -> np.ndarray:
+        """Rows from the safest to the least safe, materials without data last"""
+        return np.lexsort((-np.nan_to_num(self.safety_factor, nan=-np.inf), np.isnan(self.safety_factor)))
+
+
+def _single_block_safety(curves: SNCurves, amplitude: float, mean: float, cycles: float, method: str) -> np.ndarray:
+    """Closed-form stress factor of one block against the strength at `cycles`"""
+    strength = curves.strength_at(cycles)
+    mean = max(mean, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "none" or mean == 0.0:
+            return strength / amplitude
+        if method == "goodman":
+            return 1.0 / (amplitude / strength + mean / curves.ultimate)
+        # Gerber: n²(σ_m/σ_uts)² + n σ_a/S = 1
+        ratio = curves.ultimate / mean
+        return ratio ** 2 * amplitude / (2 * strength) * (-1 + np.sqrt(1 + (2 * mean * strength / (curves.ultimate * amplitude)) ** 2))
+
+
+def fatigue_life(table: MaterialsTable, spectrum: LoadSpectrum, method: str = "goodman",
+                 keys: Optional[Sequence[str]] = None, design_passes: float = 1.0,
+                 temperature: Optional[float] = None, endurance_ratio: Optional[float] = None,
+                 stress_scale=None) -> FatigueResult:
+    """
+    Miner life of every material under repeated passes of a spectrum
+    The safety factor is on stress: closed-form for a single block; for a
+    spectrum, the factor that brings the elementary-Miner damage of
+    design_passes to 1 along each material's Basquin slope. stress_scale
+    gives MPa per spectrum unit when the spectrum is not in MPa.
+    """
+    curves = SNCurves(table, keys, temperature, endurance_ratio)
+    if stress_scale is not None:
+        curves = curves.per_unit(stress_scale)
+    compact = spectrum.compact()
+    damage, elementary = _miner(curves, compact, method, elementary=len(compact) > 1)
+    if len(compact) == 1:
+        safety = _single_block_safety(curves, compact.amplitude[0], compact.mean[0],
+                                      compact.counts[0] * design_passes, method)
+    else:
+        with np.errstate(divide="ignore"):
+            safety = (elementary * design_passes) ** curves.exponent
+    with np.errstate(divide="ignore"):
+        life = 1.0 / damage
+    return FatigueResult(
+        keys=curves.keys,
+        names=[table.materials[key]["name"] for key in curves.keys],
+        method=method,
+        cycles_per_pass=spectrum.cycles,
+        damage=damage,
+        life=life,
+        safety_factor=safety,
+    )
@@ -0,0 +1,136 @@
+"""
+Hardness Scales
+Registry of the hardness scales a record can be measured on, and vectorized
+conversion between them through Vickers (HV), which spans every material in
+the catalog from lead to diamond.
+
+Each record stores `hardness` on its native scale, named by the record's
+"hardness_scale" field (Brinell when absent). Conversions interpolate
+piecewise-linearly in the ASTM E140 tables for non-austenitic steels, so
+for other alloys they are approximate. A value outside a scale's range
+converts to NaN. Below the table, Brinell is taken as a fixed fraction of
+Vickers, the ratio at the table's soft end.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+BRINELL = "HB"
+VICKERS = "HV"
+ROCKWELL_C = "HRC"
+ROCKWELL_B = "HRB"
+DEFAULT_SCALE = BRINELL
+
+
+@dataclass(frozen=True)
+class HardnessScale:
+    """A hardness test and how its numbers are shown"""
+    label: str
+    fmt: str = ".0f"
+
+
+HARDNESS_SCALES: Dict[str, HardnessScale] = {
+    BRINELL: HardnessScale("Brinell"),
+    VICKERS: HardnessScale("Vickers"),
+    ROCKWELL_C: HardnessScale("Rockwell C", ".1f"),
+    ROCKWELL_B: HardnessScale("Rockwell B", ".1f"),
+}
+
+# Unit spellings of each scale (importer columns such as "Hardness (BHN)")
+_ALIASES = {"hb": BRINELL, "bhn": BRINELL, "hbw": BRINELL, "hbs": BRINELL, "brinell": BRINELL,
+            "hv": VICKERS, "vickers": VICKERS, "hrc": ROCKWELL_C, "hrb": ROCKWELL_B}
+
+# Abridged from ASTM E140 Tables 1 and 2 (non-austenitic steels): HV, HB, HRC, HRB
+_E140 = np.array([
+    (100, 95, np.nan, 55), (107, 102, np.nan, 60), (116, 110, np.nan, 65), (125, 119, np.nan, 70),
+    (130, 124, np.nan, 72), (135, 128, np.nan, 74), (139, 132, np.nan, 76), (144, 137, np.nan, 78),
+    (150, 142, np.nan, 80), (156, 148, np.nan, 82), (162, 154, np.nan, 84), (169, 161, np.nan, 86),
+    (176, 167, np.nan, 88), (185, 176, np.nan, 90), (195, 185, np.nan, 92), (205, 195, np.nan, 94),
+    (216, 205, np.nan, 96), (228, 217, np.nan, 98), (238, 226, 20, np.nan), (240, 228, np.nan, 100),
+    (248, 237, 22, np.nan), (260, 247, 24, np.nan), (272, 258, 26, np.nan), (286, 271, 28, np.nan),
+    (302, 286, 30, np.nan), (318, 301, 32, np.nan), (336, 319, 34, np.nan), (354, 336, 36, np.nan),
+    (372, 353, 38, np.nan), (392, 371, 40, np.nan), (412, 390, 42, np.nan), (434, 409, 44, np.nan),
+    (458, 432, 46, np.nan), (484, 455, 48, np.nan), (513, 481, 50, np.nan), (544, 512, 52, np.nan),
+    (577, 543, 54, np.nan), (613, 577, 56, np.nan), (653, 615, 58, np.nan), (697, 654, 60, np.nan),
+    (746, 688, 62, np.nan), (800, 722, 64, np.nan), (832, 739, 65, np.nan), (865, np.nan, 66, np.nan),
+    (900, np.nan, 67, np.nan), (940, np.nan, 68, np.nan),
+])
+_COLUMNS = {VICKERS: 0, BRINELL: 1, ROCKWELL_C: 2, ROCKWELL_B: 3}
+# HB / HV of soft metals (below the table)
+SOFT_BRINELL_RATIO = 0.95
+
+
+def _table(scale: str):
+    """(HV, scale value) rows where the scale is defined, both increasing"""
+    column = _E140[:, _COLUMNS[scale]]
+    defined = ~np.isnan(column)
+    return _E140[defined, 0], column[defined]
+
+
+_TABLES = {scale: _table(scale) for scale in (BRINELL, ROCKWELL_C, ROCKWELL_B)}
+
+
+def scale_name(unit: Optional[str]) -> Optional[str]:
+    """Registry name of a hardness unit spelling ("BHN" -> "HB"), None if unknown"""
+    if not unit:
+        return None
+    return _ALIASES.get(unit.strip().lower().replace(" ", ""))
+
+
+def native_scale(record: Dict) -> str:
+    return record.get("hardness_scale") or DEFAULT_SCALE
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+def to_vickers(values, scale: str) -> np.ndarray:
+    """HV of values on a scale (NaN outside its range)"""
+    values = np.asarray(values, dtype=np.float64)
+    if scale == VICKERS:
+        return values
+    hv, native = _TABLES[scale]
+    converted = np.interp(values, native, hv, left=np.nan, right=np.nan)
+    if scale == BRINELL:
+        converted = np.where(values < native[0], values / SOFT_BRINELL_RATIO, converted)
+    return converted
+
+
+def from_vickers(hv, scale: str) -> np.ndarray:
+    """Values on a scale from HV (NaN outside its range)"""
+    hv = np.asarray(hv, dtype=np.float64)
+    if scale == VICKERS:
+        return hv
+    table_hv, native = _TABLES[scale]
+    converted = np.interp(hv, table_hv, native, left=np.nan, right=np.nan)
+    if scale == BRINELL:
+        converted = np.where(hv < table_hv[0], hv * SOFT_BRINELL_RATIO, converted)
+    return converted
+
+
+def convert_hardness(values, from_scale, to_scale: str) -> np.ndarray:
+    """
+    Convert hardness values to one scale
+    from_scale is one scale name or an array of names, one per value (a whole
+    catalog); each distinct scale is converted as one array operation.
+    """
+    if to_scale not in HARDNESS_SCALES:
+        raise ValueError(f"Unknown hardness scale '{to_scale}' (expected one of {', '.join(HARDNESS_SCALES)})")
+    values = np.asarray(values, dtype=np.float64)
+    if isinstance(from_scale, str):
+        return from_vickers(to_vickers(values, from_scale), to_scale)
+    from_scale = np.asarray(from_scale)
+    hv = np.full(values.shape, np.nan)
+    for scale in np.unique(from_scale):
+        rows = from_scale == scale
+        hv[rows] = to_vickers(values[rows], str(scale))
+    return from_vickers(hv, to_scale)
+
+
+def format_hardness(value: Optional[float], scale: str) -> str:
+    if value is None or value != value:
+        return "—"
+    return f"{value:{HARDNESS_SCALES[scale].fmt}} {scale}"
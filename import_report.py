@@ -0,0 +1,129 @@
+"""
+Import-Time Report
+Runs `python -X importtime` on a module in a fresh interpreter and reports
+the cumulative cost of every import, so cold-start regressions are visible.
+
+Usage:
+    python import_report.py                        # solair cold start
+    python import_report.py solair plotly.graph_objects pandas
+    python import_report.py --json import_times.json
+    python import_report.py --baseline import_times.json --threshold 0.25
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+_LINE = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s*)(?P<name>\S+)")
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(module: str, python: str = sys.executable) -> List[Dict]:
+    """
+    Import `module` in a fresh interpreter and return one entry per imported
+    module: name, depth, self_us, cumulative_us (in import order)
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            entries.append({
+                "name": match.group("name"),
+                "depth": (len(match.group("indent")) - 1) // 2,
+                "self_us": int(match.group("self")),
+                "cumulative_us": int(match.group("cumulative")),
+            })
+    return entries
+
+
+def summarize(module: str, entries: List[Dict], top: int = 20) -> Dict:
+    """Total cost, top-level imports by cumulative time and per-package self time"""
+    roots = [e for e in entries if e["depth"] == 0]
+    packages: Dict[str, int] = {}
+    for entry in entries:
+        package = entry["name"].split(".")[0]
+        packages[package] = packages.get(package, 0) + entry["self_us"]
+
+    target = next((e for e in roots if e["name"] == module), None)
+    return {
+        "module": module,
+        "total_ms": sum(e["cumulative_us"] for e in roots) / 1000,
+        "module_ms": target["cumulative_us"] / 1000 if target else 0.0,
+        "modules_imported": len(entries),
+        "top_imports": [
+            {"name": e["name"], "cumulative_ms": e["cumulative_us"] / 1000, "depth": e["depth"]}
+            for e in sorted(entries, key=lambda e: e["cumulative_us"], reverse=True)[:top]
+        ],
+        "packages": {
+            name: us / 1000
+            for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+    }
+
+
+def print_summary(summary: Dict, out=sys.stdout):
+    out.write(f"\n== import {summary['module']}: {summary['module_ms']:.1f} ms "
+              f"({summary['modules_imported']} modules, {summary['total_ms']:.1f} ms incl. interpreter site) ==\n")
+    out.write("Cumulative (ms)  Module\n")
+    for entry in summary["top_imports"]:
+        out.write(f"{entry['cumulative_ms']:>15.1f}  {'  ' * entry['depth']}{entry['name']}\n")
+    out.write("Self time by package (ms)\n")
+    for name, ms in summary["packages"].items():
+        out.write(f"{ms:>15.1f}  {name}\n")
+
+
+def compare(summaries: List[Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Regression messages for modules slower than baseline by more than `threshold`"""
+    regressions = []
+    for summary in summaries:
+        previous = baseline.get(summary["module"])
+        if not previous or not previous.get("module_ms"):
+            continue
+        ratio = summary["module_ms"] / previous["module_ms"] - 1
+        if ratio > threshold:
+            regressions.append(f"{summary['module']}: {previous['module_ms']:.1f} ms -> "
+                               f"{summary['module_ms']:.1f} ms (+{ratio:.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report per-module import cost")
+    parser.add_argument("modules", nargs="*", default=["solair"])
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", help="write summaries to this JSON file")
+    parser.add_argument("--baseline", help="JSON file from a previous --json run")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = +25%%)")
+    args = parser.parse_args(argv)
+
+    summaries = []
+    for module in args.modules:
+        summary = summarize(module, measure(module), top=args.top)
+        print_summary(summary)
+        summaries.append(summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump({s["module"]: s for s in summaries}, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            regressions = compare(summaries, json.load(fh), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,484 @@
+"""
+Streaming Bulk Importer
+Reads external material catalogs (CSV, JSON Lines, Parquet) chunk by chunk,
+maps columns onto the template record shape, coerces units and appends the
+accepted records to the active store.
+
+Usage:
+    python importer.py grades.csv --chunk-size 5000 --rejects rejects.jsonl
+    python importer.py grades.parquet --map mapping.json --resume
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import schema
+import store
+from hardness import scale_name
+from Solbase import load_verified_mechanical_materials
+from template import get_material_template
+from units import PROPERTY_DIMENSIONS, UnitError, normalize_unit, to_canonical
+
+# =============================================================================
+# RECORD SHAPE
+# =============================================================================
+
+TEMPLATE_RECORD = next(iter(get_material_template().values()))
+PROPERTY_FIELDS = list(TEMPLATE_RECORD["properties"].keys())
+TEXT_FIELDS = ["name", "class", "category"]
+LIST_FIELDS = ["applications", "characteristics", "educational_insights", "sources"]
+KEY_COLUMNS = ["key", "material_key", "id"]
+
+_HEADER_UNIT = re.compile(r"^(?P<name>.*?)\s*[\[(](?P<unit>[^\])]*)[\])]\s*$")
+
+
+class RowRejected(ValueError):
+    """Raised when a source row cannot be turned into a valid record"""
+
+
+# =============================================================================
+# SOURCE READERS
+# =============================================================================
+
+def detect_format(path: str) -> str:
+    """Guess the source format from the file extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".csv", ".tsv", ".txt"):
+        return "csv"
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    raise ValueError(f"Cannot detect catalog format for '{path}'; pass --format")
+
+
+def _chunked(rows: Iterator[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_csv_chunks(path: str, chunk_size: int, skip_rows: int = 0) -> Iterator[List[Dict]]:
+    """Yield lists of row dicts from a CSV file"""
+    delimiter = "\t" if path.lower().endswith(".tsv") else ","
+    with open(path, "r", encoding="utf-8-sig", newline="") as fh:
+        rows = itertools.islice(csv.DictReader(fh, delimiter=delimiter), skip_rows, None)
+        yield from _chunked(rows, chunk_size)
+
+
+def iter_jsonl_chunks(path: str, chunk_size: int, skip_rows: int = 0) -> Iterator[List[Dict]]:
+    """Yield lists of row dicts from a JSON Lines file"""
+    with open(path, "r", encoding="utf-8") as fh:
+        lines = (line for line in fh if line.strip())
+        rows = (json.loads(line) for line in itertools.islice(lines, skip_rows, None))
+        yield from _chunked(rows, chunk_size)
+
+
+def iter_parquet_chunks(path: str, chunk_size: int, skip_rows: int = 0) -> Iterator[List[Dict]]:
+    """Yield lists of row dicts from a Parquet file, one record batch at a time"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet import requires pyarrow (pip install pyarrow)") from exc
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        if skip_rows >= batch.num_rows:
+            skip_rows -= batch.num_rows
+            continue
+        if skip_rows:
+            batch = batch.slice(skip_rows)
+            skip_rows = 0
+        yield batch.to_pylist()
+
+
+READERS = {
+    "csv": iter_csv_chunks,
+    "jsonl": iter_jsonl_chunks,
+    "parquet": iter_parquet_chunks,
+}
+
+# =============================================================================
+# COLUMN MAPPING AND UNIT COERCION
+# =============================================================================
+
+def _normalize_name(name: str) -> str:
+    name = name.strip().lower().replace("'", "").replace("’", "")
+    return re.sub(r"[\s\-]+", "_", name)
+
+
+def convert_value(value: float, prop: str, unit: Optional[str]) -> float:
+    """Convert a property value from `unit` into the canonical template unit"""
+    try:
+        return to_canonical(value, prop, unit)
+    except UnitError as exc:
+        raise RowRejected(str(exc)) from None
+
+
+def flatten_row(row: Dict, prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts (JSON Lines / Parquet structs) into dotted column names"""
+    flat = {}
+    for column, value in row.items():
+        name = f"{prefix}{column}"
+        if isinstance(value, dict):
+            flat.update(flatten_row(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def resolve_column(column: str, column_map: Dict[str, str], units: Dict[str, str]) -> Tuple[str, str, Optional[str]]:
+    """
+    Resolve a source column to (kind, target, unit)
+    kind is one of: key, text, list, property, composition, nested, ignore
+    """
+    unit = units.get(column)
+    target = column_map.get(column)
+    if target is None:
+        match = _HEADER_UNIT.match(column)
+        if match:
+            target = match.group("name")
+            unit = unit or match.group("unit")
+        else:
+            target = column
+        if not target.startswith(("composition.", "composition_", "comp_")):
+            target = ".".join(_normalize_name(part) for part in target.split("."))
+
+    if target.startswith("properties."):
+        target = target[len("properties."):]
+    for prefix in ("composition.", "composition_", "comp_"):
+        if target.startswith(prefix):
+            return "composition", target[len(prefix):], unit
+
+    if target in KEY_COLUMNS:
+        return "key", "key", None
+    if target in TEXT_FIELDS:
+        return "text", target, None
+    if target in LIST_FIELDS:
+        return "list", target, None
+    if target in PROPERTY_DIMENSIONS:
+        return "property", target, unit
+    if "." in target and target.split(".", 1)[0] in TEMPLATE_RECORD:
+        return "nested", target, None
+    return "ignore", target, None
+
+
+class ColumnPlan:
+    """Column-to-record mapping compiled once per source header"""
+
+    def __init__(self, columns: List[str], column_map: Dict[str, str], units: Dict[str, str]):
+        self.entries = [(column,) + resolve_column(column, column_map, units) for column in columns]
+        self.ignored = [column for column, kind, _, _ in self.entries if kind == "ignore"]
+
+    def build_record(self, row: Dict[str, Any]) -> Tuple[str, Dict]:
+        """Turn one flattened source row into (material_key, record)"""
+        key = None
+        record = {"properties": {}, "composition": {}}
+
+        for column, kind, target, unit in self.entries:
+            value = row.get(column)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+
+            if kind == "key":
+                key = str(value).strip()
+            elif kind == "text":
+                record[target] = str(value).strip()
+            elif kind == "list":
+                record[target] = _coerce_list(value)
+            elif kind == "property":
+                number = _coerce_float(value, target)
+                if target == "hardness" and scale_name(unit):
+                    # Hardness scales are not unit conversions: keep the value, record its scale
+                    record["hardness_scale"] = scale_name(unit)
+                    record["properties"][target] = number
+                else:
+                    record["properties"][target] = convert_value(number, target, unit)
+            elif kind == "composition":
+                fraction = _coerce_float(value, f"composition {target}")
+                if unit and normalize_unit(unit) in ("%", "wt%", "at%"):
+                    fraction /= 100.0
+                record["composition"][target] = fraction
+            elif kind == "nested":
+                _set_path(record, target, _coerce_scalar(value))
+
+        if not record.get("name"):
+            raise RowRejected("missing name")
+        if not key:
+            key = slugify(record["name"])
+        return key, record
+
+
+def _coerce_float(value: Any, label: str) -> float:
+    if isinstance(value, bool):
+        raise RowRejected(f"non-numeric value for {label}: {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip().replace(",", ""))
+    except ValueError:
+        raise RowRejected(f"non-numeric value for {label}: {value!r}") from None
+
+
+def _coerce_list(value: Any) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    text = str(value).strip()
+    if text.startswith("["):
+        try:
+            return [str(item) for item in json.loads(text)]
+        except ValueError:
+            pass
+    return [item.strip() for item in text.split(";") if item.strip()]
+
+
+def _coerce_scalar(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return float(value) if any(c in value for c in ".eE") else int(value)
+        except ValueError:
+            return value.strip()
+    return value
+
+
+def _set_path(record: Dict, path: str, value: Any):
+    parts = path.split(".")
+    node = record
+    for part in parts[:-1]:
+        node = node.setdefault(part, {})
+    node[parts[-1]] = value
+
+
+def slugify(name: str) -> str:
+    """Build a material key from a display name ("AISI 4140 Steel" -> "aisi_4140_steel")"""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def check_record(record: Dict):
+    """Fill template defaults and validate against the material schema"""
+    record.setdefault("class", TEMPLATE_RECORD["class"])
+    record.setdefault("category", "imported")
+    for list_field in LIST_FIELDS:
+        record.setdefault(list_field, [])
+
+    errors = schema.errors_only(schema.validate_record(record))
+    if errors:
+        _, path, message = errors[0]
+        raise RowRejected(f"{path}: {message}")
+
+
+# =============================================================================
+# IMPORT PIPELINE
+# =============================================================================
+
+@dataclass
+class ImportReport:
+    """Summary of one import run"""
+    source: str
+    rows_read: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    resumed_from: int = 0
+    elapsed: float = 0.0
+    reject_reasons: Counter = field(default_factory=Counter)
+    ignored_columns: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"Source: {self.source}",
+            f"Rows read: {self.rows_read} (resumed from row {self.resumed_from})",
+            f"Accepted: {self.accepted} • Rejected: {self.rejected}",
+            f"Throughput: {self.rows_per_sec:,.0f} rows/sec over {self.elapsed:.2f} s",
+        ]
+        if self.ignored_columns:
+            lines.append(f"Ignored columns: {', '.join(self.ignored_columns)}")
+        for reason, count in self.reject_reasons.most_common(10):
+            lines.append(f"  {count} × {reason}")
+        return "\n".join(lines)
+
+
+def checkpoint_path(source: str, store_path: str) -> str:
+    """Checkpoint file tracking how far an import of `source` into `store_path` got"""
+    digest = hashlib.sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:12]
+    return f"{store_path}.import-{digest}.json"
+
+
+def _source_signature(source: str) -> Dict[str, Any]:
+    stat = os.stat(source)
+    return {"source": os.path.abspath(source), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _read_checkpoint(path: str, signature: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        state = json.load(fh)
+    if any(state.get(name) != value for name, value in signature.items()):
+        return None
+    return state
+
+
+def _write_checkpoint(path: str, state: Dict[str, Any]):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+    os.replace(tmp_path, path)
+
+
+def import_catalog(
+    source: str,
+    fmt: Optional[str] = None,
+    store_path: Optional[str] = None,
+    column_map: Optional[Dict[str, str]] = None,
+    units: Optional[Dict[str, str]] = None,
+    chunk_size: int = 5000,
+    resume: bool = False,
+    rejects_path: Optional[str] = None,
+    allow_override: bool = False,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """
+    Stream `source` into the active store chunk by chunk
+
+    Only one chunk is held in memory at a time. After every chunk the accepted
+    records are appended to the store and a checkpoint is written, so a failed
+    run can be continued with resume=True. Replaying the last chunk after a
+    crash is harmless because later store entries replace earlier ones.
+    """
+    fmt = fmt or detect_format(source)
+    if fmt not in READERS:
+        raise ValueError(f"Unsupported catalog format: {fmt}")
+    store_path = store.get_store_path(store_path)
+    column_map = column_map or {}
+    units = units or {}
+    protected_keys = set() if allow_override else set(load_verified_mechanical_materials())
+
+    signature = _source_signature(source)
+    ckpt_path = checkpoint_path(source, store_path)
+    state = _read_checkpoint(ckpt_path, signature) if resume else None
+
+    report = ImportReport(source=source)
+    if state:
+        report.resumed_from = report.rows_read = state["rows_read"]
+        report.accepted = state["accepted"]
+        report.rejected = state["rejected"]
+        report.reject_reasons.update(state.get("reject_reasons", {}))
+
+    rejects_fh = None
+    plans: Dict[Tuple[str, ...], ColumnPlan] = {}
+    started = time.perf_counter() - (state["elapsed"] if state else 0.0)
+
+    try:
+        if rejects_path:
+            rejects_fh = open(rejects_path, "a" if state else "w", encoding="utf-8")
+        for chunk in READERS[fmt](source, chunk_size, skip_rows=report.rows_read):
+            accepted = []
+            for row in chunk:
+                report.rows_read += 1
+                flat = flatten_row(row)
+                header = tuple(flat)
+                plan = plans.get(header)
+                if plan is None:
+                    plan = plans[header] = ColumnPlan(list(header), column_map, units)
+                    report.ignored_columns = sorted(set(report.ignored_columns) | set(plan.ignored))
+                try:
+                    key, record = plan.build_record(flat)
+                    if key in protected_keys:
+                        raise RowRejected(f"key '{key}' collides with a verified material")
+                    check_record(record)
+                except RowRejected as exc:
+                    report.rejected += 1
+                    report.reject_reasons[str(exc).split(":")[0]] += 1
+                    if rejects_fh:
+                        rejects_fh.write(json.dumps({"row": report.rows_read, "reason": str(exc), "data": row}, default=str))
+                        rejects_fh.write("\n")
+                    continue
+                accepted.append((key, record))
+
+            report.accepted += store.append_records(accepted, store_path)
+            report.elapsed = time.perf_counter() - started
+            if rejects_fh:
+                rejects_fh.flush()
+            _write_checkpoint(ckpt_path, dict(
+                signature,
+                rows_read=report.rows_read,
+                accepted=report.accepted,
+                rejected=report.rejected,
+                reject_reasons=dict(report.reject_reasons),
+                elapsed=report.elapsed,
+            ))
+            if progress:
+                progress(report)
+    finally:
+        if rejects_fh:
+            rejects_fh.close()
+
+    report.elapsed = time.perf_counter() - started
+    # An empty or header-only source never writes a checkpoint
+    if os.path.exists(ckpt_path):
+        os.remove(ckpt_path)
+    return report
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream an external material catalog into the MEMD store")
+    parser.add_argument("source", help="CSV, JSON Lines or Parquet file")
+    parser.add_argument("--format", choices=sorted(READERS), help="source format (default: from extension)")
+    parser.add_argument("--store", help=f"store file (default: ${store.STORE_ENV_VAR} or {store.DEFAULT_STORE_PATH})")
+    parser.add_argument("--map", dest="mapping", help='JSON file: {"columns": {src: target}, "units": {src: unit}}')
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--resume", action="store_true", help="continue from the last checkpoint")
+    parser.add_argument("--rejects", help="write rejected rows to this JSON Lines file")
+    parser.add_argument("--allow-override", action="store_true", help="allow replacing verified materials")
+    args = parser.parse_args(argv)
+
+    column_map, units = {}, {}
+    if args.mapping:
+        with open(args.mapping, "r", encoding="utf-8") as fh:
+            mapping = json.load(fh)
+        column_map = mapping.get("columns", {})
+        units = mapping.get("units", {})
+
+    def show_progress(report: ImportReport):
+        print(f"\r{report.rows_read:,} rows • {report.accepted:,} accepted • "
+              f"{report.rejected:,} rejected • {report.rows_per_sec:,.0f} rows/sec", end="", file=sys.stderr)
+
+    report = import_catalog(
+        args.source,
+        fmt=args.format,
+        store_path=args.store,
+        column_map=column_map,
+        units=units,
+        chunk_size=args.chunk_size,
+        resume=args.resume,
+        rejects_path=args.rejects,
+        allow_override=args.allow_override,
+        progress=show_progress,
+    )
+    print(file=sys.stderr)
+    print(report.summary())
+    return 0 if report.accepted or not report.rows_read else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
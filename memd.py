@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+MEMD Command Line
+Fast-start queries for scripted material selection. Imports only the data
+layer (store, query) — never streamlit, plotly, pandas or numpy.
+
+Usage:
+    memd.py list --category carbon_steel --filter "density<8" --format csv
+    memd.py rank specific_stiffness --limit 5
+    memd.py rank yield_strength --at 500          # properties evaluated at 500 °C
+    memd.py show aisi_1020 --format json
+    memd.py indices
+
+Set MEMD_TIMING=1 to print import/load/query timings to stderr.
+"""
+
+import time
+
+_T0 = time.perf_counter()
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+import query
+from store import load_materials
+
+_T_IMPORT = time.perf_counter()
+
+BASE_FIELDS = ["key", "name", "class", "category"]
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def _rows_for(materials: Dict[str, Dict], keys: List[str], fields: List[str], extra: Optional[Dict] = None) -> List[Dict]:
+    rows = []
+    for key in keys:
+        material = materials[key]
+        props = material.get("properties", {})
+        row = {}
+        for field in fields:
+            if field == "key":
+                row[field] = key
+            elif field in material and not isinstance(material[field], (dict, list)):
+                row[field] = material[field]
+            else:
+                value = query.property_value(props, field)
+                row[field] = "" if value is None else value
+        if extra:
+            row.update(extra[key])
+        rows.append(row)
+    return rows
+
+
+def write_rows(rows: List[Dict], fmt: str, out=sys.stdout):
+    if fmt == "json":
+        json.dump(rows, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+        return
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    cells = [[_format_cell(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    out.write("  ".join(c.ljust(w) for c, w in zip(columns, widths)).rstrip() + "\n")
+    for r in cells:
+        out.write("  ".join(v.ljust(w) for v, w in zip(r, widths)).rstrip() + "\n")
+
+
+def _format_cell(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+def _flatten(record: Dict, prefix: str = "") -> Dict[str, object]:
+    flat = {}
+    for name, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{name}."))
+        elif isinstance(value, list):
+            flat[f"{prefix}{name}"] = "; ".join(str(v) for v in value if not isinstance(v, dict))
+        else:
+            flat[f"{prefix}{name}"] = value
+    return flat
+
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+
+def _selected_keys(materials: Dict[str, Dict], args) -> List[str]:
+    return query.filter_materials(
+        materials,
+        ranges=[query.parse_filter(f) for f in args.filter],
+        category=args.category,
+        material_class=args.material_class,
+        search=args.search,
+    )
+
+
+def cmd_list(materials, args) -> int:
+    keys = _selected_keys(materials, args)
+    fields = BASE_FIELDS + [f for f in (args.fields.split(",") if args.fields else []) if f]
+    write_rows(_rows_for(materials, keys, fields), args.format)
+    return 0
+
+
+def cmd_rank(materials, args) -> int:
+    keys = _selected_keys(materials, args)
+    ranked = query.rank_materials(materials, args.index, keys=keys, descending=not args.asc, limit=args.limit)
+    extra = {key: {"value": value} for key, value in ranked}
+    fields = ["key", "name"] + [f for f in (args.fields.split(",") if args.fields else []) if f]
+    write_rows(_rows_for(materials, [key for key, _ in ranked], fields, extra), args.format)
+    return 0
+
+
+def cmd_show(materials, args) -> int:
+    material = materials.get(args.key)
+    if material is None:
+        print(f"memd: unknown material '{args.key}'", file=sys.stderr)
+        return 2
+    record = dict(material, key=args.key)
+    if args.format == "csv":
+        write_rows([_flatten(record)], "csv")
+    else:
+        json.dump(record, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+def cmd_indices(materials, args) -> int:
+    rows = [{"index": name, "expression": expr, "description": desc}
+            for name, (expr, desc) in query.NAMED_INDICES.items()]
+    write_rows(rows, args.format)
+    return 0
+
+
+def cmd_categories(materials, args) -> int:
+    counts: Dict[str, int] = {}
+    for material in materials.values():
+        counts[material.get("category", "")] = counts.get(material.get("category", ""), 0) + 1
+    write_rows([{"category": c, "materials": n} for c, n in sorted(counts.items())], args.format)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="memd", description="Query the MEMD materials database")
+    parser.add_argument("--store", help="store file merged with Solbase (default: $MEMD_STORE)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_selection(p, formats=("table", "json", "csv")):
+        p.add_argument("--category")
+        p.add_argument("--class", dest="material_class")
+        p.add_argument("-q", "--search", help="substring of key or name")
+        p.add_argument("--filter", action="append", default=[], help='e.g. "density<5" or "yield_strength=200..400"')
+        p.add_argument("--fields", help="extra comma-separated property columns")
+        p.add_argument("--format", choices=formats, default="table")
+        p.add_argument("--at", type=float, metavar="°C", help="evaluate temperature tables at this temperature")
+
+    p = sub.add_parser("list", help="list materials matching filters")
+    add_selection(p)
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("rank", help="rank materials by a performance index")
+    p.add_argument("index", help="named index or expression such as youngs_modulus^1/2/density")
+    p.add_argument("--limit", type=int)
+    p.add_argument("--asc", action="store_true", help="lowest first")
+    add_selection(p)
+    p.set_defaults(func=cmd_rank)
+
+    p = sub.add_parser("show", help="dump one material")
+    p.add_argument("key")
+    p.add_argument("--format", choices=("json", "csv"), default="json")
+    p.add_argument("--at", type=float, metavar="°C", help="evaluate temperature tables at this temperature")
+    p.set_defaults(func=cmd_show)
+
+    p = sub.add_parser("indices", help="list named performance indices")
+    p.add_argument("--format", choices=("table", "json", "csv"), default="table")
+    p.set_defaults(func=cmd_indices)
+
+    p = sub.add_parser("categories", help="list categories with material counts")
+    p.add_argument("--format", choices=("table", "json", "csv"), default="table")
+    p.set_defaults(func=cmd_categories)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    t_load = time.perf_counter()
+    materials = load_materials(args.store)
+    if getattr(args, "at", None) is not None:
+        # NumPy is only needed (and imported) for temperature evaluation
+        from database import MaterialsTable
+        from temperature import materials_at
+        materials = materials_at(MaterialsTable(materials), args.at)
+    t_query = time.perf_counter()
+    try:
+        status = args.func(materials, args)
+    except query.QueryError as exc:
+        print(f"memd: {exc}", file=sys.stderr)
+        status = 2
+    except BrokenPipeError:
+        status = 0
+
+    if os.environ.get("MEMD_TIMING"):
+        done = time.perf_counter()
+        print(f"memd timing: import {(_T_IMPORT - _T0) * 1000:.1f} ms • load {(t_query - t_load) * 1000:.1f} ms • "
+              f"query {(done - t_query) * 1000:.1f} ms", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
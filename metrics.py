@@ -0,0 +1,312 @@
+"""
+Rerun Instrumentation
+Lightweight timing spans for the Streamlit app: wall time, allocated blocks
+(plus traced bytes when tracemalloc is on) and payload bytes per span,
+collected per rerun and aggregated process-wide for OpenMetrics export.
+
+Also measures per-session memory against a budget, excluding the database
+that every session shares.
+
+Environment:
+    MEMD_METRICS_FILE         write OpenMetrics text here after every rerun
+    MEMD_TRACE_ALLOC=1        start tracemalloc so spans also report bytes
+    MEMD_SESSION_BUDGET_KB    per-session memory budget (default 256)
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+METRICS_FILE_ENV = "MEMD_METRICS_FILE"
+TRACE_ALLOC_ENV = "MEMD_TRACE_ALLOC"
+SESSION_BUDGET_ENV = "MEMD_SESSION_BUDGET_KB"
+SESSION_MEMORY_BUDGET = int(os.environ.get(SESSION_BUDGET_ENV, "256")) * 1024
+PREFIX = "memd"
+
+# Histogram buckets for span durations (seconds)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Span:
+    __slots__ = ("name", "depth", "seconds", "alloc_blocks", "alloc_bytes", "payload_bytes")
+
+    def __init__(self, name: str, depth: int):
+        self.name = name
+        self.depth = depth
+        self.seconds = 0.0
+        self.alloc_blocks = 0
+        self.alloc_bytes: Optional[int] = None
+        self.payload_bytes = 0
+
+    def as_dict(self) -> Dict:
+        return {
+            "span": "  " * self.depth + self.name,
+            "ms": round(self.seconds * 1000, 2),
+            "alloc_blocks": self.alloc_blocks,
+            "alloc_kb": None if self.alloc_bytes is None else round(self.alloc_bytes / 1024, 1),
+            "payload_kb": round(self.payload_bytes / 1024, 1),
+        }
+
+
+class _Aggregate:
+    __slots__ = ("count", "seconds", "buckets", "alloc_blocks", "alloc_bytes", "payload_bytes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.alloc_blocks = 0
+        self.alloc_bytes = 0
+        self.payload_bytes = 0
+
+
+_local = threading.local()
+_lock = threading.Lock()
+_aggregates: Dict[str, _Aggregate] = {}
+_reruns = 0
+
+if os.environ.get(TRACE_ALLOC_ENV) and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+def _state():
+    if not hasattr(_local, "spans"):
+        _local.spans = []
+        _local.stack = []
+        _local.track_payload = False
+    return _local
+
+
+# =============================================================================
+# SPANS
+# =============================================================================
+
+def start_rerun(track_payload: bool = False):
+    """Begin a new rerun on this thread (session); previous spans are discarded"""
+    state = _state()
+    state.spans = []
+    state.stack = []
+    state.track_payload = track_payload or bool(os.environ.get(METRICS_FILE_ENV))
+
+
+def tracking_payload() -> bool:
+    """Whether callers should measure payload sizes (costs an extra serialization)"""
+    return _state().track_payload
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span]:
+    """Time a block; nested spans are recorded with their depth"""
+    state = _state()
+    current = Span(name, len(state.stack))
+    state.spans.append(current)
+    state.stack.append(current)
+    tracing = tracemalloc.is_tracing()
+    blocks_before = sys.getallocatedblocks()
+    bytes_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.seconds = time.perf_counter() - started
+        current.alloc_blocks = sys.getallocatedblocks() - blocks_before
+        if tracing:
+            current.alloc_bytes = tracemalloc.get_traced_memory()[0] - bytes_before
+        state.stack.pop()
+        _record(current)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator form of span(); defaults to the function name"""
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def add_payload(num_bytes: int):
+    """Attribute payload bytes to every open span (innermost up to "run")"""
+    for open_span in _state().stack:
+        open_span.payload_bytes += num_bytes
+
+
+def rerun_spans() -> List[Span]:
+    """Spans recorded so far in this thread's current rerun"""
+    return list(_state().spans)
+
+
+def _record(current: Span):
+    with _lock:
+        aggregate = _aggregates.get(current.name)
+        if aggregate is None:
+            aggregate = _aggregates[current.name] = _Aggregate()
+        aggregate.count += 1
+        aggregate.seconds += current.seconds
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if current.seconds <= bound:
+                aggregate.buckets[i] += 1
+        aggregate.alloc_blocks += max(current.alloc_blocks, 0)
+        aggregate.alloc_bytes += max(current.alloc_bytes or 0, 0)
+        aggregate.payload_bytes += current.payload_bytes
+
+
+def finish_rerun():
+    """Close the rerun and export OpenMetrics if MEMD_METRICS_FILE is set"""
+    global _reruns
+    with _lock:
+        _reruns += 1
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        write_openmetrics(path)
+
+
+# =============================================================================
+# OPENMETRICS EXPORT
+# =============================================================================
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def openmetrics_text() -> str:
+    """Aggregated span metrics in OpenMetrics text exposition format"""
+    with _lock:
+        snapshot = {name: (agg.count, agg.seconds, list(agg.buckets), agg.alloc_blocks, agg.alloc_bytes, agg.payload_bytes)
+                    for name, agg in sorted(_aggregates.items())}
+        reruns = _reruns
+
+    lines = [
+        f"# TYPE {PREFIX}_reruns counter",
+        f"# HELP {PREFIX}_reruns Completed Streamlit reruns.",
+        f"{PREFIX}_reruns_total {reruns}",
+        f"# TYPE {PREFIX}_span_duration_seconds histogram",
+        f"# UNIT {PREFIX}_span_duration_seconds seconds",
+        f"# HELP {PREFIX}_span_duration_seconds Wall time per instrumented span.",
+    ]
+    for name, (count, seconds, buckets, _, _, _) in snapshot.items():
+        label = _label(name)
+        for bound, bucket_count in zip(DURATION_BUCKETS, buckets):
+            lines.append(f'{PREFIX}_span_duration_seconds_bucket{{span="{label}",le="{bound}"}} {bucket_count}')
+        lines.append(f'{PREFIX}_span_duration_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+        lines.append(f'{PREFIX}_span_duration_seconds_count{{span="{label}"}} {count}')
+        lines.append(f'{PREFIX}_span_duration_seconds_sum{{span="{label}"}} {seconds:.9f}')
+
+    counters = (
+        ("span_alloc_blocks", "Memory blocks allocated inside spans (net).", "", 3),
+        ("span_alloc_bytes", "Traced bytes allocated inside spans (net, tracemalloc).", "bytes", 4),
+        ("span_payload_bytes", "Serialized payload bytes produced inside spans.", "bytes", 5),
+    )
+    for metric, help_text, unit, position in counters:
+        lines.append(f"# TYPE {PREFIX}_{metric} counter")
+        if unit:
+            lines.append(f"# UNIT {PREFIX}_{metric} {unit}")
+        lines.append(f"# HELP {PREFIX}_{metric} {help_text}")
+        for name, values in snapshot.items():
+            lines.append(f'{PREFIX}_{metric}_total{{span="{_label(name)}"}} {values[position]}')
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_openmetrics(path: str):
+    """Atomically write the OpenMetrics text file (safe for a scraper to read)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        fh.write(openmetrics_text())
+    os.replace(tmp_path, path)
+
+
+# =============================================================================
+# SESSION MEMORY
+# =============================================================================
+
+def deep_sizeof(obj: Any, exclude: Optional[Set[int]] = None) -> int:
+    """
+    Approximate bytes reachable from obj, counting each object once
+    Objects whose id() is in exclude (and everything below them) are skipped;
+    NumPy arrays count their buffer via nbytes.
+    """
+    seen: Set[int] = set(exclude or ())
+    total = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+        nbytes = getattr(current, "nbytes", None)
+        if isinstance(nbytes, int) and getattr(current, "base", None) is None:
+            total += nbytes
+            continue
+        if isinstance(current, (str, bytes, bytearray, int, float, bool)) or current is None:
+            continue
+        if hasattr(current, "items"):
+            try:
+                for key, value in current.items():
+                    pending.append(key)
+                    pending.append(value)
+            except Exception:
+                pass
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+    return total
+
+
+def _shared_ids(shared: Any) -> Set[int]:
+    ids: Set[int] = set()
+    pending = [shared]
+    while pending:
+        current = pending.pop()
+        if id(current) in ids or isinstance(current, (str, int, float, bool, type)) or current is None:
+            continue
+        ids.add(id(current))
+        if hasattr(current, "items"):
+            for key, value in current.items():
+                pending.append(value)
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+    return ids
+
+
+def session_memory(session_state: Any, *owners: Any, shared: Any = None,
+                   budget: int = SESSION_MEMORY_BUDGET) -> Dict:
+    """
+    Bytes held by one session (its session_state plus per-session objects such
+    as the app instance) compared to the budget. Anything reachable from
+    shared is excluded from the session and reported separately.
+    """
+    exclude = _shared_ids(shared) if shared is not None else set()
+    try:
+        state = {key: session_state[key] for key in session_state}
+    except TypeError:
+        state = dict(session_state)
+    session_bytes = deep_sizeof([state, *owners], exclude)
+    return {
+        "session_bytes": session_bytes,
+        "shared_bytes": deep_sizeof(shared) if shared is not None else 0,
+        "budget_bytes": budget,
+        "over_budget": session_bytes > budget,
+    }
+
+
+def reset():
+    """Drop all aggregated metrics (tests and benchmarks)"""
+    global _reruns
+    with _lock:
+        _aggregates.clear()
+        _reruns = 0
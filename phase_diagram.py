@@ -0,0 +1,198 @@
+"""
+Fe–Fe₃C Phase Diagram
+The metastable iron–cementite diagram with its phase boundaries as
+piecewise-linear curves C(T) through the standard invariant points:
+
+    peritectic   1495 °C   δ 0.09 + L 0.53 -> γ 0.17
+    eutectic     1148 °C   L 4.30 -> γ 2.11 + Fe₃C 6.67   (ledeburite)
+    eutectoid     727 °C   γ 0.76 -> α 0.022 + Fe₃C 6.67  (pearlite)
+
+Compositions are wt% C, temperatures °C. Every point of a (composition ×
+temperature) grid is classified, and its lever-rule phase fractions and
+phase compositions computed, in one vectorized pass; grids are cached so
+interactive lookups only index precomputed arrays.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+CEMENTITE = 6.67
+EUTECTOID = (0.76, 727.0)
+EUTECTIC = (4.30, 1148.0)
+PERITECTIC = (0.17, 1495.0)
+MAX_AUSTENITE = 2.11
+MAX_FERRITE = 0.022
+
+# Boundary curves as (temperature, composition) points, temperature ascending
+BOUNDARIES: Dict[str, Tuple[Tuple[float, float], ...]] = {
+    "liquidus": ((1148.0, 4.30), (1495.0, 0.53), (1538.0, 0.0)),
+    "cementite_liquidus": ((1148.0, 4.30), (1227.0, CEMENTITE)),
+    "delta_solidus": ((1495.0, 0.09), (1538.0, 0.0)),
+    "delta_solvus": ((1394.0, 0.0), (1495.0, 0.09)),
+    "austenite_delta": ((1394.0, 0.0), (1495.0, 0.17)),
+    "austenite_solidus": ((1148.0, MAX_AUSTENITE), (1495.0, 0.17)),
+    "acm": ((727.0, 0.76), (1148.0, MAX_AUSTENITE)),
+    "a3": ((727.0, 0.76), (912.0, 0.0)),
+    "ferrite_solvus": ((727.0, MAX_FERRITE), (912.0, 0.0)),
+    "ferrite_cementite": ((0.0, 0.005), (727.0, MAX_FERRITE)),
+}
+
+# Phase fields: (label, first phase, second phase or None)
+REGIONS: List[Tuple[str, str, str]] = [
+    ("L", "L", None),
+    ("L + δ", "δ", "L"),
+    ("δ", "δ", None),
+    ("δ + γ", "δ", "γ"),
+    ("L + γ", "γ", "L"),
+    ("γ", "γ", None),
+    ("L + Fe₃C", "L", "Fe₃C"),
+    ("γ + Fe₃C", "γ", "Fe₃C"),
+    ("α + γ", "α", "γ"),
+    ("α", "α", None),
+    ("α + Fe₃C", "α", "Fe₃C"),
+]
+(LIQUID, LIQUID_DELTA, DELTA, DELTA_GAMMA, LIQUID_GAMMA, GAMMA, LIQUID_CEMENTITE,
+ GAMMA_CEMENTITE, ALPHA_GAMMA, ALPHA, ALPHA_CEMENTITE) = range(len(REGIONS))
+
+
+def boundary(name: str, temperature) -> np.ndarray:
+    """Composition of a boundary at the given temperature(s) (clamped at its ends)"""
+    points = np.array(BOUNDARIES[name])
+    return np.interp(temperature, points[:, 0], points[:, 1])
+
+
+# =============================================================================
+# PHASE GRID
+# =============================================================================
+
+@dataclass
+class PhaseGrid:
+    """
+    Phase field and lever-rule result at every (temperature, composition) node
+    Arrays are (temperatures × compositions). For a two-phase field `first`
+    and `second` are the compositions of its phases and `fraction` the mass
+    fraction of the second one; single-phase nodes have fraction 0.
+    """
+    compositions: np.ndarray
+    temperatures: np.ndarray
+    region: np.ndarray
+    first: np.ndarray
+    second: np.ndarray
+    fraction: np.ndarray
+
+    def index(self, carbon: float, temperature: float) -> Tuple[int, int]:
+        """Nearest grid node of a point"""
+        column = int(np.clip(np.rint((carbon - self.compositions[0]) / (self.compositions[1] - self.compositions[0])),
+                             0, len(self.compositions) - 1))
+        row = int(np.clip(np.rint((temperature - self.temperatures[0]) / (self.temperatures[1] - self.temperatures[0])),
+                          0, len(self.temperatures) - 1))
+        return row, column
+
+    def lookup(self, carbon: float, temperature: float) -> Dict:
+        """Phases, their compositions and mass fractions at the nearest node"""
+        row, column = self.index(carbon, temperature)
+        label, phase_a, phase_b = REGIONS[self.region[row, column]]
+        fraction = float(self.fraction[row, column])
+        phases = [{"phase": phase_a, "carbon": float(self.first[row, column]), "fraction": 1.0 - fraction}]
+        if phase_b is not None:
+            phases.append({"phase": phase_b, "carbon": float(self.second[row, column]), "fraction": fraction})
+        return {
+            "carbon": float(self.compositions[column]),
+            "temperature": float(self.temperatures[row]),
+            "region": label,
+            "phases": phases,
+        }
+
+
+def classify(carbon: np.ndarray, temperature: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (region, first, second, fraction) for broadcastable carbon/temperature arrays
+    Tie-lines are horizontal, so each field's phase compositions are its two
+    bounding curves evaluated at the temperature.
+    """
+    c = np.asarray(carbon, dtype=np.float64)
+    t = np.asarray(temperature, dtype=np.float64)
+    c, t = np.broadcast_arrays(c, t)
+    b = {name: boundary(name, t) for name in BOUNDARIES}
+    liquid_high = np.where(t >= 1227.0, CEMENTITE, b["cementite_liquidus"])
+    above_eutectic = t > EUTECTIC[1]
+    above_peritectic = t > PERITECTIC[1]
+    above_a1 = t > EUTECTOID[1]
+    below_a3 = t <= 912.0
+
+    # (condition, region, first-phase composition, second-phase composition); first match wins
+    fields = [
+        (above_peritectic & (t < 1538.0) & (c <= b["delta_solidus"]), DELTA, c, c),
+        (above_peritectic & (c < b["liquidus"]), LIQUID_DELTA, b["delta_solidus"], b["liquidus"]),
+        (~above_peritectic & (t > 1394.0) & (c <= b["delta_solvus"]), DELTA, c, c),
+        (~above_peritectic & (t > 1394.0) & (c < b["austenite_delta"]), DELTA_GAMMA, b["delta_solvus"], b["austenite_delta"]),
+        (above_eutectic & ~above_peritectic & (c <= b["austenite_solidus"]), GAMMA, c, c),
+        (above_eutectic & ~above_peritectic & (c < b["liquidus"]), LIQUID_GAMMA, b["austenite_solidus"], b["liquidus"]),
+        (above_eutectic & (c <= liquid_high), LIQUID, c, c),
+        (above_eutectic, LIQUID_CEMENTITE, liquid_high, np.full_like(c, CEMENTITE)),
+        (above_a1 & below_a3 & (c <= b["ferrite_solvus"]), ALPHA, c, c),
+        (above_a1 & below_a3 & (c < b["a3"]), ALPHA_GAMMA, b["ferrite_solvus"], b["a3"]),
+        (above_a1 & (c <= b["acm"]), GAMMA, c, c),
+        (above_a1, GAMMA_CEMENTITE, b["acm"], np.full_like(c, CEMENTITE)),
+        (c <= b["ferrite_cementite"], ALPHA, c, c),
+    ]
+    conditions = [condition for condition, *_ in fields]
+    region = np.select(conditions, [code for _, code, _, _ in fields], ALPHA_CEMENTITE).astype(np.int8)
+    first = np.select(conditions, [low for _, _, low, _ in fields], b["ferrite_cementite"])
+    second = np.select(conditions, [high for _, _, _, high in fields], CEMENTITE)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(second > first, (c - first) / (second - first), 0.0)
+    fraction = np.clip(fraction, 0.0, 1.0)
+    return region, first, second, fraction
+
+
+@lru_cache(maxsize=8)
+def phase_grid(carbon_step: float = 0.01, temperature_step: float = 1.0,
+               t_min: float = 400.0, t_max: float = 1600.0) -> PhaseGrid:
+    """The whole diagram sampled on a grid (cached; arrays are read-only)"""
+    compositions = np.round(np.arange(0.0, CEMENTITE + carbon_step / 2, carbon_step), 6)
+    temperatures = np.arange(t_min, t_max + temperature_step / 2, temperature_step)
+    arrays = classify(compositions[None, :], temperatures[:, None])
+    for array in arrays:
+        array.flags.writeable = False
+    return PhaseGrid(compositions, temperatures, *arrays)
+
+
+# =============================================================================
+# MICROCONSTITUENTS
+# =============================================================================
+
+def microconstituents(carbon) -> Dict[str, np.ndarray]:
+    """
+    Mass fractions of the room-temperature microconstituents after slow
+    (equilibrium) cooling: proeutectoid ferrite or cementite and pearlite for
+    steels; primary austenite (now pearlite), primary cementite and
+    transformed ledeburite for cast irons
+    """
+    c = np.asarray(carbon, dtype=np.float64)
+    eutectoid, eutectic = EUTECTOID[0], EUTECTIC[0]
+    steel = c < MAX_AUSTENITE
+    with np.errstate(divide="ignore", invalid="ignore"):
+        proeutectoid_ferrite = np.where(steel & (c < eutectoid), (eutectoid - c) / (eutectoid - MAX_FERRITE), 0.0)
+        proeutectoid_cementite = np.where(steel & (c > eutectoid), (c - eutectoid) / (CEMENTITE - eutectoid), 0.0)
+        primary_austenite = np.where(~steel & (c < eutectic), (eutectic - c) / (eutectic - MAX_AUSTENITE), 0.0)
+        primary_cementite = np.where(~steel & (c > eutectic), (c - eutectic) / (CEMENTITE - eutectic), 0.0)
+    proeutectoid_ferrite = np.clip(proeutectoid_ferrite, 0.0, 1.0)
+    pearlite = np.where(steel, 1.0 - proeutectoid_ferrite - proeutectoid_cementite, primary_austenite)
+    ledeburite = np.where(steel, 0.0, 1.0 - primary_austenite - primary_cementite)
+    return {
+        "proeutectoid ferrite": proeutectoid_ferrite,
+        "proeutectoid cementite": proeutectoid_cementite,
+        "pearlite": np.clip(pearlite, 0.0, 1.0),
+        "primary cementite": primary_cementite,
+        "transformed ledeburite": np.clip(ledeburite, 0.0, 1.0),
+    }
+
+
+def carbon_content(record) -> float:
+    """wt% C of a material record (0 when it lists no carbon)"""
+    return 100.0 * float((record.get("composition") or {}).get("C", 0.0))
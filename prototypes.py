@@ -0,0 +1,185 @@
+"""
+Crystal Structure Prototypes
+Shared unit-cell site tables (BCC, FCC, HCP, diamond cubic, graphite, ...).
+Materials reference a prototype by name plus their own lattice parameters
+and a species mapping instead of repeating atomic-position tables.
+
+    "crystal_structure": {
+        "structure_type": "BCC",
+        "prototype": "BCC",
+        "species": {"A": "Fe"},
+        "lattice_parameters": {...},
+        ...
+    }
+
+Standard library only at import time; NumPy is loaded when arrays are requested.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Site = Tuple[str, float, float, float, str]  # (sublattice, x, y, z, atom type)
+
+_CUBE_CORNERS = [
+    (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0),
+    (1.0, 1.0, 0.0), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0), (1.0, 1.0, 1.0),
+]
+_CUBE_FACES = [
+    (0.5, 0.5, 0.0), (0.5, 0.0, 0.5), (0.0, 0.5, 0.5),
+    (0.5, 0.5, 1.0), (0.5, 1.0, 0.5), (1.0, 0.5, 0.5),
+]
+_HEX_LAYERS = [
+    (0.333, 0.667, 0.25, "base_plane"), (0.667, 0.333, 0.25, "base_plane"), (0.000, 0.000, 0.25, "base_plane"),
+    (0.333, 0.667, 0.75, "mid_plane"), (0.667, 0.333, 0.75, "mid_plane"), (0.000, 0.000, 0.75, "mid_plane"),
+]
+
+
+class Prototype:
+    """Fractional site table shared by every material with this structure"""
+
+    def __init__(self, name: str, sites: Iterable[Site], description: str = ""):
+        self.name = name
+        self.sites: Tuple[Site, ...] = tuple(sites)
+        self.sublattices: Tuple[str, ...] = tuple(sorted({site[0] for site in self.sites}))
+        self.description = description
+        self._positions = None
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    @property
+    def positions(self):
+        """(n_sites × 3) read-only float64 array of fractional coordinates"""
+        if self._positions is None:
+            import numpy as np
+            positions = np.array([site[1:4] for site in self.sites], dtype=np.float64)
+            positions.flags.writeable = False
+            self._positions = positions
+        return self._positions
+
+    def elements(self, species: Dict[str, str]) -> Tuple[str, ...]:
+        """Element symbol of every site for a species mapping"""
+        try:
+            return tuple(species[site[0]] for site in self.sites)
+        except KeyError as exc:
+            raise KeyError(f"Prototype {self.name} needs species for sublattice {exc.args[0]}") from None
+
+
+PROTOTYPES: Dict[str, Prototype] = {}
+
+
+def register(prototype: Prototype) -> Prototype:
+    """Add a prototype to the registry"""
+    PROTOTYPES[prototype.name] = prototype
+    return prototype
+
+
+register(Prototype(
+    "BCC",
+    [("A",) + corner + ("corner",) for corner in _CUBE_CORNERS] + [("A", 0.5, 0.5, 0.5, "body_center")],
+    "Body-centered cubic (A2, W-type)",
+))
+register(Prototype(
+    "FCC",
+    [("A",) + corner + ("corner",) for corner in _CUBE_CORNERS] + [("A",) + face + ("face_center",) for face in _CUBE_FACES],
+    "Face-centered cubic (A1, Cu-type)",
+))
+register(Prototype(
+    "HCP",
+    [("A",) + layer for layer in _HEX_LAYERS],
+    "Hexagonal close-packed (A3, Mg-type)",
+))
+register(Prototype(
+    "Diamond Cubic",
+    [
+        ("A", 0.0, 0.0, 0.0, "fcc_corner"),
+        ("A", 0.5, 0.5, 0.0, "fcc_face"), ("A", 0.5, 0.0, 0.5, "fcc_face"), ("A", 0.0, 0.5, 0.5, "fcc_face"),
+        ("A", 0.25, 0.25, 0.25, "internal"), ("A", 0.75, 0.75, 0.25, "internal"),
+        ("A", 0.75, 0.25, 0.75, "internal"), ("A", 0.25, 0.75, 0.75, "internal"),
+    ],
+    "Diamond cubic (A4, C-type)",
+))
+register(Prototype(
+    "Graphite",
+    [("A",) + layer for layer in _HEX_LAYERS],
+    "Hexagonal graphite (A9), AB-stacked layers",
+))
+register(Prototype(
+    "B2",
+    [("A",) + corner + ("corner",) for corner in _CUBE_CORNERS] + [("B", 0.5, 0.5, 0.5, "body_center")],
+    "Ordered body-centered cubic (B2, CsCl-type)",
+))
+
+
+def get_prototype(name: str) -> Prototype:
+    try:
+        return PROTOTYPES[name]
+    except KeyError:
+        raise KeyError(f"Unknown crystal prototype '{name}'") from None
+
+
+# =============================================================================
+# MATERIALIZATION
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _atoms(prototype_name: str, species: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, float, float, float, str], ...]:
+    prototype = get_prototype(prototype_name)
+    elements = prototype.elements(dict(species))
+    return tuple((element,) + site[1:] for element, site in zip(elements, prototype.sites))
+
+
+def get_atomic_positions(crystal_data: Optional[Dict]) -> List[Dict]:
+    """
+    Atomic positions of a crystal_structure entry as a list of
+    {"element", "x", "y", "z", "type"} dicts. Explicit "atomic_positions"
+    (e.g. imported records) win; otherwise the prototype is materialized.
+    """
+    if not crystal_data:
+        return []
+    if crystal_data.get("atomic_positions"):
+        return crystal_data["atomic_positions"]
+    prototype_name = crystal_data.get("prototype")
+    if not prototype_name:
+        return []
+    species = tuple(sorted((crystal_data.get("species") or {}).items()))
+    return [
+        {"element": element, "x": x, "y": y, "z": z, "type": atom_type}
+        for element, x, y, z, atom_type in _atoms(prototype_name, species)
+    ]
+
+
+def with_atomic_positions(crystal_data: Dict) -> Dict:
+    """Copy of a crystal_structure entry with atomic_positions filled in"""
+    return dict(crystal_data, atomic_positions=get_atomic_positions(crystal_data))
+
+
+# =============================================================================
+# BATCHED STRUCTURE COMPUTATIONS
+# =============================================================================
+
+def group_by_prototype(materials: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Material keys grouped by prototype name (materials without one are skipped)"""
+    groups: Dict[str, List[str]] = {}
+    for key, material in materials.items():
+        name = (material.get("crystal_structure") or {}).get("prototype")
+        if name:
+            groups.setdefault(name, []).append(key)
+    return groups
+
+
+def lattice_lengths(materials: Dict[str, Dict], keys: Iterable[str]):
+    """(m × 3) array of lattice lengths a, b, c"""
+    import numpy as np
+    return np.array([
+        [materials[key]["crystal_structure"]["lattice_parameters"][axis] for axis in ("a", "b", "c")]
+        for key in keys
+    ], dtype=np.float64)
+
+
+def scaled_positions(prototype_name: str, lengths):
+    """
+    Absolute coordinates (Å) of every site for m materials sharing a prototype,
+    shape (m × n_sites × 3), using the same axis scaling as the 3D viewer
+    """
+    return lengths[:, None, :] * get_prototype(prototype_name).positions[None, :, :]
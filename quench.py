@@ -0,0 +1,281 @@
+"""
+Quench Simulator
+Transient heat conduction of a part plunged into a quenchant (or a furnace),
+from thermal_conductivity, specific_heat and density:
+
+    ρ c ∂T/∂t = (1/rᵐ) ∂/∂r (k rᵐ ∂T/∂r),   -k ∂T/∂r = h (T - T∞) at the surface
+
+with m = 0 for a plate (half-thickness), 1 for a long cylinder and 2 for a
+sphere (radius). Properties are taken at the mean of the start and quenchant
+temperatures and held constant. The equation is discretised with finite
+volumes and stepped with backward Euler (unconditionally stable). Every step
+solves one tridiagonal system per material. Its factorisation is computed
+once, and the Thomas sweeps are vectorized across the whole batch of
+materials.
+
+Two-dimensional parts - a rectangular bar or a finite cylinder - are the
+product of two one-dimensional solutions (exact for constant properties and
+the same h on every face), set with `half_length`.
+
+Batches are split into chunks that can run in a process pool. Results are
+cached by a hash of the numeric inputs, so repeated runs are free.
+"""
+
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from database import MaterialsTable
+
+PLATE = "plate"
+CYLINDER = "cylinder"
+SPHERE = "sphere"
+GEOMETRIES = (PLATE, CYLINDER, SPHERE)
+_SHAPE_EXPONENT = {PLATE: 0, CYLINDER: 1, SPHERE: 2}
+
+# Typical heat transfer coefficients (W/m²·K)
+QUENCHANTS = {
+    "still air": 15.0,
+    "forced air": 150.0,
+    "oil": 1500.0,
+    "water": 5000.0,
+    "brine": 10000.0,
+}
+
+# Histories are stored at most this many times (plus t = 0) and positions
+RECORDED_TIMES = 200
+RECORDED_POSITIONS = 11
+# Materials solved together; the batch is split further across a process pool
+CHUNK_MATERIALS = 4096
+CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class QuenchCase:
+    """
+    One quench or heating schedule
+    size is the half-thickness (plate) or radius (m). half_length adds a
+    second, plate-like direction: a bar (plate) or finite cylinder.
+    """
+    geometry: str
+    size: float
+    initial: float
+    ambient: float
+    htc: float
+    duration: float
+    steps: int = 500
+    nodes: int = 41
+    half_length: Optional[float] = None
+
+    def __post_init__(self):
+        if self.geometry not in GEOMETRIES:
+            raise ValueError(f"Unknown geometry '{self.geometry}' (expected one of {', '.join(GEOMETRIES)})")
+        if self.size <= 0 or self.htc <= 0 or self.duration <= 0:
+            raise ValueError("Size, heat transfer coefficient and duration must be positive")
+        if self.steps < 1 or self.nodes < 3:
+            raise ValueError("At least 1 time step and 3 nodes are required")
+        if self.half_length is not None:
+            if self.half_length <= 0:
+                raise ValueError("half_length must be positive")
+            if self.geometry == SPHERE:
+                raise ValueError("A sphere has no second direction")
+        if self.initial == self.ambient:
+            raise ValueError("Initial and quenchant temperatures are equal")
+
+    @property
+    def property_temperature(self) -> float:
+        """Temperature (°C) at which the properties are evaluated"""
+        return 0.5 * (self.initial + self.ambient)
+
+
+@dataclass
+class QuenchResult:
+    """Temperature histories of every material (NaN rows where data is missing)"""
+    keys: List[str]
+    names: List[str]
+    case: QuenchCase
+    times: np.ndarray           # s
+    positions: np.ndarray       # m from the centre (mid-plane for 2D parts), centre and surface included
+    temperatures: np.ndarray    # °C, (materials × times × positions)
+
+    @property
+    def centre(self) -> np.ndarray:
+        return self.temperatures[:, :, 0]
+
+    @property
+    def surface(self) -> np.ndarray:
+        return self.temperatures[:, :, -1]
+
+    def time_to(self, temperature: float, at: str = "centre") -> np.ndarray:
+        """First time (s) the centre or surface reaches a temperature (NaN if it never does)"""
+        history = getattr(self, at)
+        # Positive while the temperature is still on the starting side of the target
+        remaining = (history - temperature) * np.sign(self.case.initial - self.case.ambient)
+        reached = remaining <= 0
+        first = np.argmax(reached, axis=1)
+        rows = np.arange(len(history))
+        before = np.maximum(first - 1, 0)
+        r0, r1 = remaining[rows, before], remaining[rows, first]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(r0 > r1, r0 / (r0 - r1), 0.0)
+        t0, t1 = self.times[before], self.times[first]
+        return np.where(reached.any(axis=1), t0 + share * (t1 - t0), np.nan)
+
+
+# =============================================================================
+# SOLVER
+# =============================================================================
+
+def _grid(exponent: int, size: float, nodes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Node positions, control volumes, inner face areas (per unit rᵐ measure) and surface area"""
+    positions = np.linspace(0.0, size, nodes)
+    dr = positions[1]
+    low = np.maximum(positions - dr / 2, 0.0)
+    high = np.minimum(positions + dr / 2, size)
+    volumes = (high ** (exponent + 1) - low ** (exponent + 1)) / (exponent + 1)
+    faces = (positions[:-1] + dr / 2) ** exponent
+    return positions, volumes, faces, size ** exponent
+
+
+def _solve_chunk(args) -> np.ndarray:
+    """
+    Dimensionless excess temperature θ = (T - T∞)/(T₀ - T∞) for a chunk of materials
+    Returns (recorded times × recorded nodes × materials).
+    """
+    exponent, size, nodes, steps, dt, every, recorded, diffusivity, surface_coefficient = args
+    positions, volumes, faces, area = _grid(exponent, size, nodes)
+    dr = positions[1]
+    capacity = (volumes / dt)[:, None]
+    conductance = faces[:, None] * diffusivity[None, :] / dr
+
+    # Tridiagonal matrix (nodes × materials): lower, diagonal, upper
+    lower = np.zeros((nodes, len(diffusivity)))
+    upper = np.zeros_like(lower)
+    lower[1:] = -conductance
+    upper[:-1] = -conductance
+    diagonal = capacity - lower - upper
+    diagonal[-1] += area * surface_coefficient
+
+    # Thomas factorisation, once for all steps
+    inverse = np.empty_like(diagonal)
+    modified_upper = np.empty_like(upper)
+    inverse[0] = 1.0 / diagonal[0]
+    modified_upper[0] = upper[0] * inverse[0]
+    for i in range(1, nodes):
+        inverse[i] = 1.0 / (diagonal[i] - lower[i] * modified_upper[i - 1])
+        modified_upper[i] = upper[i] * inverse[i]
+
+    theta = np.ones_like(diagonal)
+    history = np.empty((steps // every + 1, len(recorded), len(diffusivity)))
+    history[0] = theta[recorded]
+    forward = np.empty_like(diagonal)
+    for step in range(1, steps + 1):
+        rhs = capacity * theta
+        forward[0] = rhs[0] * inverse[0]
+        for i in range(1, nodes):
+            forward[i] = (rhs[i] - lower[i] * forward[i - 1]) * inverse[i]
+        theta[-1] = forward[-1]
+        for i in range(nodes - 2, -1, -1):
+            theta[i] = forward[i] - modified_upper[i] * theta[i + 1]
+        if step % every == 0:
+            history[step // every] = theta[recorded]
+    return history
+
+
+def _recorded_nodes(nodes: int) -> np.ndarray:
+    return np.unique(np.linspace(0, nodes - 1, min(nodes, RECORDED_POSITIONS)).round().astype(np.intp))
+
+
+def _solve(exponent: int, size: float, case: QuenchCase, dt: float, every: int,
+           diffusivity: np.ndarray, surface_coefficient: np.ndarray, processes: int) -> np.ndarray:
+    """θ for every material as (materials × recorded times × recorded nodes), chunked over materials"""
+    recorded = _recorded_nodes(case.nodes)
+    if not len(diffusivity):
+        return np.empty((0, case.steps // every + 1, len(recorded)))
+    chunk = CHUNK_MATERIALS
+    if processes:
+        chunk = min(chunk, -(-len(diffusivity) // processes))
+    chunks = [
+        (exponent, size, case.nodes, case.steps, dt, every, recorded,
+         diffusivity[i:i + chunk], surface_coefficient[i:i + chunk])
+        for i in range(0, len(diffusivity), chunk)
+    ]
+    if processes and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            histories = list(pool.map(_solve_chunk, chunks))
+    else:
+        histories = [_solve_chunk(chunk) for chunk in chunks]
+    return np.concatenate(histories, axis=2).transpose(2, 0, 1)
+
+
+_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+
+def _digest(case: QuenchCase, diffusivity: np.ndarray, surface_coefficient: np.ndarray) -> str:
+    payload = repr(case).encode("utf-8") + diffusivity.tobytes() + surface_coefficient.tobytes()
+    return hashlib.sha1(payload).hexdigest()
+
+
+def quench_history(case: QuenchCase, diffusivity: np.ndarray, surface_coefficient: np.ndarray,
+                   processes: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (times, positions, θ[materials × times × positions]) from diffusivity (m²/s)
+    and h / (ρ c) (m/s) per material. Cached by a hash of the inputs; the
+    returned θ is read-only.
+    """
+    diffusivity = np.ascontiguousarray(diffusivity, dtype=np.float64)
+    surface_coefficient = np.ascontiguousarray(surface_coefficient, dtype=np.float64)
+    dt = case.duration / case.steps
+    every = max(1, case.steps // RECORDED_TIMES)
+    times = np.arange(case.steps // every + 1) * every * dt
+    positions = np.linspace(0.0, case.size, case.nodes)[_recorded_nodes(case.nodes)]
+
+    key = _digest(case, diffusivity, surface_coefficient)
+    theta = _cache.get(key)
+    if theta is None:
+        theta = _solve(_SHAPE_EXPONENT[case.geometry], case.size, case, dt, every,
+                       diffusivity, surface_coefficient, processes)
+        if case.half_length is not None:
+            # Mid-plane of the second direction: θ(r, 0, t) = θ_r(r, t) θ_z(0, t)
+            theta *= _solve(_SHAPE_EXPONENT[PLATE], case.half_length, case, dt, every,
+                            diffusivity, surface_coefficient, processes)[:, :, :1]
+        theta.flags.writeable = False
+        _cache[key] = theta
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return times, positions, theta
+
+
+def simulate_quench(table: MaterialsTable, case: QuenchCase, keys: Optional[Sequence[str]] = None,
+                    processes: int = 0) -> QuenchResult:
+    """
+    Cooling (or heating) curves of every material for one schedule
+    Materials missing conductivity, specific heat or density get NaN rows.
+    processes > 0 spreads chunks of materials across a process pool.
+    """
+    keys = list(keys) if keys is not None else table.keys
+    rows = table.positions(keys)
+    temperature = case.property_temperature
+    conductivity = table.column_at("thermal_conductivity", temperature)[rows]
+    heat_capacity = (table.column_at("density", temperature)[rows] * 1e3            # g/cm³ -> kg/m³
+                     * table.column_at("specific_heat", temperature)[rows])
+    valid = (conductivity > 0) & (heat_capacity > 0)
+
+    times, positions, theta = quench_history(case, conductivity[valid] / heat_capacity[valid],
+                                             case.htc / heat_capacity[valid], processes)
+    temperatures = np.full((len(keys), len(times), len(positions)), np.nan)
+    temperatures[valid] = case.ambient + (case.initial - case.ambient) * theta
+    return QuenchResult(
+        keys=keys,
+        names=[table.materials[key]["name"] for key in keys],
+        case=case,
+        times=times,
+        positions=positions,
+        temperatures=temperatures,
+    )
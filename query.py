@@ -0,0 +1,183 @@
+"""
+Material Queries
+Filtering, index ranking and pagination over the materials dict.
+Pure standard library so headless tools start fast.
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from thermal import DERIVED_PROPERTIES, derived_value
+
+# Ashby-style performance indices: name -> (expression, description)
+NAMED_INDICES = {
+    "specific_strength": ("yield_strength/density", "Strength-limited tie, minimum mass"),
+    "specific_stiffness": ("youngs_modulus/density", "Stiffness-limited tie, minimum mass"),
+    "beam_stiffness": ("youngs_modulus^0.5/density", "Stiffness-limited beam, minimum mass"),
+    "beam_strength": ("yield_strength^0.667/density", "Strength-limited beam, minimum mass"),
+    "panel_stiffness": ("youngs_modulus^0.333/density", "Stiffness-limited panel, minimum mass"),
+    "strength_per_cost": ("yield_strength/cost_index", "Strength-limited tie, minimum cost"),
+    "stiffness_per_cost": ("youngs_modulus/cost_index", "Stiffness-limited tie, minimum cost"),
+    "damage_tolerance": ("fracture_toughness/yield_strength", "Leak-before-break / flaw tolerance"),
+    "fatigue_ratio": ("fatigue_strength/tensile_strength", "Endurance ratio"),
+    "heat_spreading": ("thermal_conductivity/thermal_expansion", "Thermal distortion resistance"),
+    "thermal_shock": ("thermal_shock_resistance", "Sudden quench/heat without cracking"),
+    "thermal_shock_flux": ("thermal_shock_resistance_k", "Steady heat flux without cracking"),
+    "thermal_diffusivity": ("thermal_diffusivity", "Fast, uniform heating or cooling"),
+}
+
+Term = Tuple[str, float]  # (property, exponent)
+
+_TERM = re.compile(r"^\s*(?P<prop>[a-z_]+)\s*(?:\^\s*(?P<exp>-?[0-9.]+(?:/[0-9.]+)?))?\s*$")
+_FILTER = re.compile(r"^\s*(?P<prop>[a-z_]+)\s*(?P<op><=|>=|<|>|==|=)\s*(?P<value>\S+)\s*$")
+
+
+class QueryError(ValueError):
+    """Raised for malformed index expressions or filters"""
+
+
+# =============================================================================
+# INDEX EXPRESSIONS
+# =============================================================================
+
+def _parse_exponent(text: Optional[str]) -> float:
+    if not text:
+        return 1.0
+    if "/" in text:
+        num, den = text.split("/", 1)
+        return float(num) / float(den)
+    return float(text)
+
+
+def parse_index(expression: str) -> List[Term]:
+    """
+    Parse an index such as "specific_strength" or "youngs_modulus^1/2/density"
+    into (property, exponent) terms; '/' divides and '*' multiplies
+    """
+    expression = NAMED_INDICES.get(expression, (expression,))[0]
+    terms: List[Term] = []
+    sign = 1.0
+    for token in re.split(r"(\*|/(?![0-9.]))", expression):
+        if token == "*":
+            sign = 1.0
+        elif token == "/":
+            sign = -1.0
+        elif token.strip():
+            match = _TERM.match(token)
+            if not match:
+                raise QueryError(f"Cannot parse index term '{token.strip()}'")
+            try:
+                exponent = _parse_exponent(match.group("exp"))
+            except (ValueError, ZeroDivisionError):
+                raise QueryError(f"Bad exponent in '{token.strip()}'") from None
+            terms.append((match.group("prop"), sign * exponent))
+    if not terms:
+        raise QueryError("Empty index expression")
+    return terms
+
+
+def property_value(properties: Dict[str, float], prop: str) -> Optional[float]:
+    """A stored property, or a thermal.py derived one computed from its inputs"""
+    if prop in DERIVED_PROPERTIES and prop not in properties:
+        return derived_value(properties, prop)
+    return properties.get(prop)
+
+
+def evaluate_index(properties: Dict[str, float], terms: Sequence[Term]) -> Optional[float]:
+    """Index value for one material, or None when a property is missing/zero"""
+    value = 1.0
+    for prop, exponent in terms:
+        x = property_value(properties, prop)
+        if not isinstance(x, (int, float)) or x != x:
+            return None
+        if x <= 0 and (exponent < 0 or exponent != int(exponent)):
+            return None
+        try:
+            value *= x ** exponent
+        except OverflowError:
+            return None
+    return value if math.isfinite(value) else None
+
+
+# =============================================================================
+# FILTERS
+# =============================================================================
+
+def parse_filter(text: str) -> Tuple[str, float, float]:
+    """
+    Parse "density<5", "yield_strength>=300" or "density=2..5" into
+    (property, low, high) with inclusive bounds
+    """
+    match = _FILTER.match(text)
+    if not match:
+        raise QueryError(f"Cannot parse filter '{text}'")
+    prop, op, value = match.group("prop"), match.group("op"), match.group("value")
+    try:
+        if ".." in value:
+            low, high = value.split("..", 1)
+            return prop, float(low) if low else -math.inf, float(high) if high else math.inf
+        number = float(value)
+    except ValueError:
+        raise QueryError(f"Non-numeric bound in filter '{text}'") from None
+    if op in ("<", "<="):
+        return prop, -math.inf, math.nextafter(number, -math.inf) if op == "<" else number
+    if op in (">", ">="):
+        return prop, math.nextafter(number, math.inf) if op == ">" else number, math.inf
+    return prop, number, number
+
+
+def filter_materials(
+    materials: Dict[str, Dict],
+    ranges: Iterable[Tuple[str, float, float]] = (),
+    category: Optional[str] = None,
+    material_class: Optional[str] = None,
+    search: Optional[str] = None,
+    keys: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """Keys of materials matching every given criterion (in database order)"""
+    ranges = list(ranges)
+    needle = search.lower() if search else None
+    result = []
+    for key in (keys if keys is not None else materials):
+        material = materials[key]
+        if category and material.get("category") != category:
+            continue
+        if material_class and material.get("class") != material_class:
+            continue
+        if needle and needle not in key.lower() and needle not in material.get("name", "").lower():
+            continue
+        props = material.get("properties", {})
+        values = ((property_value(props, prop), low, high) for prop, low, high in ranges)
+        if any(not (isinstance(x, (int, float)) and low <= x <= high) for x, low, high in values):
+            continue
+        result.append(key)
+    return result
+
+
+def rank_materials(
+    materials: Dict[str, Dict],
+    index: str,
+    keys: Optional[Iterable[str]] = None,
+    descending: bool = True,
+    limit: Optional[int] = None,
+) -> List[Tuple[str, float]]:
+    """(key, index value) pairs sorted by the index; materials without a value are dropped"""
+    terms = parse_index(index)
+    scored = []
+    for key in (keys if keys is not None else materials):
+        value = evaluate_index(materials[key].get("properties", {}), terms)
+        if value is not None:
+            scored.append((key, value))
+    scored.sort(key=lambda item: item[1], reverse=descending)
+    return scored[:limit] if limit else scored
+
+
+def paginate(items: Sequence, page: int = 1, per_page: int = 50) -> Tuple[Sequence, Dict[str, int]]:
+    """Slice one page out of `items` and describe the pagination"""
+    per_page = max(1, per_page)
+    total = len(items)
+    pages = max(1, math.ceil(total / per_page))
+    page = min(max(1, page), pages)
+    start = (page - 1) * per_page
+    return items[start:start + per_page], {"page": page, "per_page": per_page, "total": total, "pages": pages}
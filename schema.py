@@ -0,0 +1,514 @@
+"""
+Material Record Schema
+Declarative description of a database record (see template.py) compiled into
+a single generated Python function for fast validation.
+
+Usage:
+    python schema.py                   # validate Solbase + the active store
+    python schema.py --processes 4     # validate across a process pool
+"""
+
+import abc
+import argparse
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from prototypes import PROTOTYPES, get_atomic_positions
+
+Issue = Tuple[str, str, str]  # (level, path, message)
+
+ERROR = "error"
+WARNING = "warning"
+
+# =============================================================================
+# SCHEMA NODES
+# =============================================================================
+
+class _CodeGen:
+    """Accumulates source lines and constants for the generated validator"""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._counter = 0
+
+    def var(self, prefix: str = "v") -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+
+
+def _path_expr(path: str) -> str:
+    """Paths may contain {name} placeholders filled in at validation time"""
+    return f"f{path!r}" if "{" in path else repr(path)
+
+
+class Node(abc.ABC):
+    type_label = "value"
+
+    @abc.abstractmethod
+    def emit(self, gen: _CodeGen, expr: str, path: str, indent: int):
+        """Append the checks of a value held in `expr` at `path`"""
+
+
+class String(Node):
+    type_label = "string"
+
+    def __init__(self, choices: Optional[Iterable[str]] = None, non_empty: bool = True):
+        self.choices = frozenset(choices) if choices else None
+        self.non_empty = non_empty
+
+    def emit(self, gen, expr, path, indent):
+        p = _path_expr(path)
+        gen.emit(indent, f"if type({expr}) is not str:")
+        gen.emit(indent + 1, f"append(('error', {p}, 'expected string, got ' + type({expr}).__name__))")
+        if self.non_empty:
+            gen.emit(indent, f"elif not {expr}.strip():")
+            gen.emit(indent + 1, f"append(('error', {p}, 'must not be empty'))")
+        if self.choices:
+            choices = gen.const(self.choices)
+            gen.emit(indent, f"elif {expr} not in {choices}:")
+            gen.emit(indent + 1, f"append(('warning', {p}, repr({expr}) + ' is not one of ' + ', '.join(sorted({choices}))))")
+
+
+class Number(Node):
+    type_label = "number"
+
+    def __init__(self, unit: str = "", minimum: float = -math.inf, maximum: float = math.inf,
+                 exclusive_minimum: bool = False, integer: bool = False):
+        self.unit = unit
+        self.minimum = minimum
+        self.maximum = maximum
+        self.exclusive_minimum = exclusive_minimum
+        self.integer = integer
+
+    def emit(self, gen, expr, path, indent):
+        p = _path_expr(path)
+        kinds = "(int,)" if self.integer else "(int, float)"
+        gen.emit(indent, f"if type({expr}) not in {kinds}:")
+        gen.emit(indent + 1, f"append(('error', {p}, 'expected {'integer' if self.integer else 'number'}, got ' + type({expr}).__name__))")
+        gen.emit(indent, f"elif {expr} != {expr}:")
+        gen.emit(indent + 1, f"append(('error', {p}, 'is NaN'))")
+
+        checks = []
+        if self.minimum != -math.inf:
+            checks.append(f"{expr} {'<=' if self.exclusive_minimum else '<'} {self.minimum!r}")
+        if self.maximum != math.inf:
+            checks.append(f"{expr} > {self.maximum!r}")
+        if checks:
+            low = "(" if self.exclusive_minimum else "["
+            bounds = f"{low}{self.minimum:g}, {self.maximum:g}]"
+            unit = f" {self.unit}" if self.unit else ""
+            gen.emit(indent, f"elif {' or '.join(checks)}:")
+            gen.emit(indent + 1, f"append(('error', {p}, repr({expr}) + '{unit} outside {bounds}'))")
+
+
+class ListOf(Node):
+    type_label = "list"
+
+    def __init__(self, item: Node):
+        self.item = item
+
+    def emit(self, gen, expr, path, indent):
+        p = _path_expr(path)
+        index, item = gen.var("i"), gen.var("item")
+        gen.emit(indent, f"if type({expr}) not in (list, tuple):")
+        gen.emit(indent + 1, f"append(('error', {p}, 'expected list, got ' + type({expr}).__name__))")
+        gen.emit(indent, "else:")
+        gen.emit(indent + 1, f"for {index}, {item} in enumerate({expr}):")
+        self.item.emit(gen, item, f"{path}[{{{index}}}]", indent + 2)
+
+
+class MapOf(Node):
+    """Mapping with free-form string keys (e.g. composition: element -> fraction)"""
+    type_label = "mapping"
+
+    def __init__(self, value: Node):
+        self.value = value
+
+    def emit(self, gen, expr, path, indent):
+        p = _path_expr(path)
+        key, value = gen.var("k"), gen.var("val")
+        gen.emit(indent, f"if type({expr}) is not dict:")
+        gen.emit(indent + 1, f"append(('error', {p}, 'expected mapping, got ' + type({expr}).__name__))")
+        gen.emit(indent, "else:")
+        gen.emit(indent + 1, f"for {key}, {value} in {expr}.items():")
+        self.value.emit(gen, value, f"{path}.{{{key}}}", indent + 2)
+
+
+class Record(Node):
+    """Mapping with named fields; unknown fields are allowed"""
+    type_label = "record"
+
+    def __init__(self, fields: Dict[str, Node], required: Iterable[str] = ()):
+        self.fields = fields
+        self.required = set(required)
+
+    def emit(self, gen, expr, path, indent):
+        p = _path_expr(path or "<record>")
+        gen.emit(indent, f"if type({expr}) is not dict:")
+        gen.emit(indent + 1, f"append(('error', {p}, 'expected mapping, got ' + type({expr}).__name__))")
+        gen.emit(indent, "else:")
+        get = gen.var("get")
+        gen.emit(indent + 1, f"{get} = {expr}.get")
+        for name, node in self.fields.items():
+            child_path = f"{path}.{name}" if path else name
+            value = gen.var()
+            gen.emit(indent + 1, f"{value} = {get}({name!r}, _MISSING)")
+            gen.emit(indent + 1, f"if {value} is _MISSING:")
+            if name in self.required:
+                gen.emit(indent + 2, f"append(('error', {_path_expr(child_path)}, 'is required'))")
+            else:
+                gen.emit(indent + 2, "pass")
+            gen.emit(indent + 1, "else:")
+            node.emit(gen, value, child_path, indent + 2)
+
+
+# =============================================================================
+# MATERIAL RECORD SCHEMA
+# =============================================================================
+
+PROPERTY_SCHEMA = {
+    "density": Number("g/cm³", 0, 30, exclusive_minimum=True),
+    "youngs_modulus": Number("GPa", 0, 1500),
+    "yield_strength": Number("MPa", 0, 1e4),
+    "tensile_strength": Number("MPa", 0, 1e4),
+    "elongation": Number("%", 0, 1000),
+    "reduction_area": Number("%", 0, 100),
+    "hardness": Number("", 0, 15000),  # on the record's hardness_scale
+    "thermal_conductivity": Number("W/m·K", 0, 5000),
+    "specific_heat": Number("J/kg·K", 0, 20000),
+    "thermal_expansion": Number("μm/m·K", -50, 500),
+    "melting_point": Number("°C", -273.15, 4500),
+    "electrical_resistivity": Number("Ω·m", 0, 1e20),
+    "poissons_ratio": Number("", -1, 0.5),
+    "fatigue_strength": Number("MPa", 0, 1e4),
+    "fracture_toughness": Number("MPa√m", 0, 500),
+    "cost_index": Number("", 0),
+}
+
+ATOM_SCHEMA = Record({
+    "element": String(),
+    "x": Number("", 0, 1),
+    "y": Number("", 0, 1),
+    "z": Number("", 0, 1),
+    "type": String(),
+}, required=["element", "x", "y", "z"])
+
+CRYSTAL_SCHEMA = Record({
+    "crystal_system": String(choices=["Cubic", "Hexagonal", "Tetragonal", "Orthorhombic",
+                                      "Rhombohedral", "Monoclinic", "Triclinic"]),
+    "structure_type": String(),
+    "space_group": String(),
+    "lattice_parameters": Record({
+        "a": Number("Å", 0, 100, exclusive_minimum=True),
+        "b": Number("Å", 0, 100, exclusive_minimum=True),
+        "c": Number("Å", 0, 100, exclusive_minimum=True),
+        "alpha": Number("°", 0, 180, exclusive_minimum=True),
+        "beta": Number("°", 0, 180, exclusive_minimum=True),
+        "gamma": Number("°", 0, 180, exclusive_minimum=True),
+    }, required=["a", "b", "c", "alpha", "beta", "gamma"]),
+    "atomic_positions": ListOf(ATOM_SCHEMA),
+    "prototype": String(),
+    "species": MapOf(String()),
+    "coordination_number": Number("", 0, 24, integer=True),
+    "atomic_packing_factor": Number("", 0, 1),
+    "atoms_per_unit_cell": Number("", 0, 1000, exclusive_minimum=True),
+    "description": String(),
+}, required=["crystal_system", "structure_type", "lattice_parameters"])
+
+# Property-vs-temperature table (temperature.py); values in the property's unit
+TEMPERATURE_CURVE_SCHEMA = Record({
+    "temperature": ListOf(Number("°C", -273.15, 5000)),
+    "values": ListOf(Number()),
+}, required=["temperature", "values"])
+
+# Spread of one property (uncertainty.py); bounds in the property's unit
+PROPERTY_RANGE_SCHEMA = Record({
+    "distribution": String(choices=["triangular", "uniform", "normal"]),
+    "min": Number(),
+    "typical": Number(),
+    "max": Number(),
+    "std": Number("", 0),
+})
+
+# Arrhenius diffusion of one solute (carburizing.py): D = D0 exp(-Q / RT)
+DIFFUSION_SCHEMA = Record({
+    "D0": Number("m²/s", 0, exclusive_minimum=True),
+    "Q": Number("kJ/mol", 0, 1000),
+    "phase": String(),
+}, required=["D0", "Q"])
+
+MATERIAL_SCHEMA = Record({
+    "name": String(),
+    "class": String(choices=["metal", "polymer", "ceramic", "composite", "semiconductor", "non_metal"]),
+    "category": String(),
+    "composition": MapOf(Number("mass fraction", 0, 1)),
+    "properties": Record(PROPERTY_SCHEMA, required=PROPERTY_SCHEMA.keys()),
+    "crystal_structure": CRYSTAL_SCHEMA,
+    "temperature_curves": MapOf(TEMPERATURE_CURVE_SCHEMA),
+    "property_ranges": MapOf(PROPERTY_RANGE_SCHEMA),
+    "diffusion": MapOf(DIFFUSION_SCHEMA),
+    "hardness_scale": String(choices=["HB", "HV", "HRC", "HRB"]),
+    "applications": ListOf(String()),
+    "characteristics": ListOf(String()),
+    "educational_insights": ListOf(String()),
+    "sources": ListOf(String()),
+    "heat_treatment": MapOf(String()),
+}, required=["name", "class", "category", "composition", "properties",
+             "applications", "characteristics", "educational_insights"])
+
+# =============================================================================
+# STRUCTURE CONSISTENCY RULES
+# =============================================================================
+
+def _check_composition_total(record: Dict) -> List[Issue]:
+    composition = record.get("composition")
+    if type(composition) is not dict or not composition:
+        return []
+    try:
+        total = math.fsum(composition.values())
+    except TypeError:
+        return []
+    if total > 1.01:
+        return [(ERROR, "composition", f"fractions sum to {total:.4f} (> 1)")]
+    if total < 0.9:
+        return [(WARNING, "composition", f"fractions sum to {total:.4f}; balance element missing?")]
+    return []
+
+
+def _numbers(*values) -> bool:
+    """Whether every operand of a cross-field rule is a real number (the type check reports the rest)"""
+    return all(type(value) in (int, float) for value in values)
+
+
+def _check_strengths(record: Dict) -> List[Issue]:
+    props = record.get("properties")
+    if type(props) is not dict:
+        return []
+    yield_strength, tensile = props.get("yield_strength"), props.get("tensile_strength")
+    if _numbers(yield_strength, tensile):
+        if tensile > 0 and yield_strength > tensile:
+            return [(WARNING, "properties.yield_strength",
+                     f"{yield_strength} MPa exceeds tensile strength {tensile} MPa")]
+    return []
+
+
+def _check_lattice(record: Dict) -> List[Issue]:
+    crystal = record.get("crystal_structure")
+    if type(crystal) is not dict or type(crystal.get("lattice_parameters")) is not dict:
+        return []
+    lat = crystal["lattice_parameters"]
+    try:
+        a, b, c = lat["a"], lat["b"], lat["c"]
+        alpha, beta, gamma = lat["alpha"], lat["beta"], lat["gamma"]
+    except KeyError:
+        return []
+
+    system = crystal.get("crystal_system")
+    issues = []
+    if not _numbers(a, b, c, alpha, beta, gamma):
+        system = None
+    if system == "Cubic" and not (math.isclose(a, b) and math.isclose(b, c) and alpha == beta == gamma == 90):
+        issues.append((ERROR, "crystal_structure.lattice_parameters", "cubic cell requires a = b = c and 90° angles"))
+    elif system == "Hexagonal" and not (math.isclose(a, b) and alpha == beta == 90 and gamma == 120):
+        issues.append((ERROR, "crystal_structure.lattice_parameters", "hexagonal cell requires a = b, α = β = 90°, γ = 120°"))
+
+    prototype = crystal.get("prototype")
+    if prototype is not None:
+        if prototype not in PROTOTYPES:
+            return issues + [(ERROR, "crystal_structure.prototype", f"unknown prototype {prototype!r}")]
+        species = crystal.get("species")
+        missing = [s for s in PROTOTYPES[prototype].sublattices if not isinstance(species, dict) or s not in species]
+        if missing:
+            return issues + [(ERROR, "crystal_structure.species", f"no element for sublattice {', '.join(missing)}")]
+
+    positions = get_atomic_positions(crystal)
+    if isinstance(positions, list):
+        elements = {atom.get("element") for atom in positions if isinstance(atom, dict)}
+        composition = record.get("composition") or {}
+        unknown = sorted(e for e in elements if e and composition and e not in composition)
+        if unknown:
+            issues.append((WARNING, "crystal_structure.atomic_positions",
+                           f"elements {', '.join(unknown)} not in composition"))
+    return issues
+
+
+def _check_temperature_curves(record: Dict) -> List[Issue]:
+    curves = record.get("temperature_curves")
+    if type(curves) is not dict:
+        return []
+    issues = []
+    for prop, curve in curves.items():
+        path = f"temperature_curves.{prop}"
+        if prop not in PROPERTY_SCHEMA:
+            issues.append((ERROR, path, "not a property"))
+            continue
+        if type(curve) is not dict:
+            continue
+        temps, values = curve.get("temperature"), curve.get("values")
+        if not isinstance(temps, list) or not isinstance(values, list):
+            continue
+        if not temps:
+            issues.append((ERROR, path, "empty table"))
+        elif len(temps) != len(values):
+            issues.append((ERROR, path, f"{len(temps)} temperatures but {len(values)} values"))
+        elif not _numbers(*temps):
+            continue
+        elif any(not (b > a) for a, b in zip(temps, temps[1:])):
+            issues.append((ERROR, f"{path}.temperature", "temperatures must be strictly increasing"))
+    return issues
+
+
+def _check_property_ranges(record: Dict) -> List[Issue]:
+    ranges = record.get("property_ranges")
+    if type(ranges) is not dict:
+        return []
+    props = record.get("properties") if type(record.get("properties")) is dict else {}
+    issues = []
+    for prop, spec in ranges.items():
+        path = f"property_ranges.{prop}"
+        if prop not in PROPERTY_SCHEMA:
+            issues.append((ERROR, path, "not a property"))
+            continue
+        if type(spec) is not dict:
+            continue
+        if spec.get("distribution") == "normal":
+            if "std" not in spec:
+                issues.append((ERROR, path, "normal distribution requires std"))
+            continue
+        low, high = spec.get("min"), spec.get("max")
+        if not isinstance(low, (int, float)) or not isinstance(high, (int, float)):
+            issues.append((ERROR, path, "requires min and max"))
+            continue
+        typical = spec.get("typical", props.get(prop))
+        if low > high:
+            issues.append((ERROR, path, f"min {low} exceeds max {high}"))
+        elif isinstance(typical, (int, float)) and not low <= typical <= high:
+            issues.append((WARNING, path, f"typical value {typical} outside [{low}, {high}]"))
+    return issues
+
+
+CONSISTENCY_RULES: List[Callable[[Dict], List[Issue]]] = [
+    _check_composition_total,
+    _check_strengths,
+    _check_lattice,
+    _check_temperature_curves,
+    _check_property_ranges,
+]
+
+# =============================================================================
+# COMPILATION AND VALIDATION
+# =============================================================================
+
+_MISSING = object()
+
+
+def compile_validator(schema: Record = MATERIAL_SCHEMA,
+                      rules: Iterable[Callable[[Dict], List[Issue]]] = CONSISTENCY_RULES) -> Callable[[Any], List[Issue]]:
+    """Compile a schema into one generated function returning a list of issues"""
+    gen = _CodeGen()
+    rule_names = [gen.const(rule) for rule in rules]
+    gen.emit(0, "def validate(record):")
+    gen.emit(1, "issues = []")
+    gen.emit(1, "append = issues.append")
+    schema.emit(gen, "record", "", 1)
+    gen.emit(1, "if type(record) is dict:")
+    for name in rule_names:
+        gen.emit(2, f"issues.extend({name}(record))")
+    if not rule_names:
+        gen.emit(2, "pass")
+    gen.emit(1, "return issues")
+
+    source = "\n".join(gen.lines)
+    namespace = dict(gen.constants, _MISSING=_MISSING)
+    exec(compile(source, "<material-schema>", "exec"), namespace)
+    validate = namespace["validate"]
+    validate.source = source
+    return validate
+
+
+_validator: Optional[Callable[[Any], List[Issue]]] = None
+
+
+def validate_record(record: Any) -> List[Issue]:
+    """Validate one record against MATERIAL_SCHEMA (validator compiled on first use)"""
+    global _validator
+    if _validator is None:
+        _validator = compile_validator()
+    return _validator(record)
+
+
+def errors_only(issues: List[Issue]) -> List[Issue]:
+    return [issue for issue in issues if issue[0] == ERROR]
+
+
+def _validate_chunk(items: List[Tuple[str, Any]]) -> List[Tuple[str, List[Issue]]]:
+    results = []
+    for key, record in items:
+        issues = validate_record(record)
+        if issues:
+            results.append((key, issues))
+    return results
+
+
+def validate_records(items: Iterable[Tuple[str, Any]], processes: int = 0,
+                     chunk_size: int = 5000) -> Dict[str, List[Issue]]:
+    """
+    Validate (material_key, record) pairs and return the issues of failing keys
+    processes > 0 spreads chunks across a process pool
+    """
+    items = list(items)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if processes and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(_validate_chunk, chunks)
+            return {key: issues for chunk in results for key, issues in chunk}
+    return {key: issues for chunk in chunks for key, issues in _validate_chunk(chunk)}
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate the MEMD materials database")
+    parser.add_argument("--store", help="store file to validate together with Solbase")
+    parser.add_argument("--processes", type=int, default=0, help="validate in a process pool")
+    parser.add_argument("--strict", action="store_true", help="treat warnings as errors")
+    parser.add_argument("--show-source", action="store_true", help="print the generated validator")
+    args = parser.parse_args(argv)
+
+    if args.show_source:
+        print(compile_validator().source)
+        return 0
+
+    from store import load_materials
+    materials = load_materials(args.store)
+
+    started = time.perf_counter()
+    failures = validate_records(materials.items(), processes=args.processes)
+    elapsed = time.perf_counter() - started
+
+    error_count = 0
+    for key, issues in failures.items():
+        for level, path, message in issues:
+            print(f"{key}: {level}: {path}: {message}")
+            if level == ERROR or args.strict:
+                error_count += 1
+    print(f"Validated {len(materials)} records in {elapsed:.3f} s • {error_count} errors", file=sys.stderr)
+    return 1 if error_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""
+Headless JSON API
+Asyncio HTTP/1.1 server over the materials database. Standard library only
+(no Streamlit/Plotly), with ETag revalidation, gzip and a response cache.
+
+Usage:
+    python server.py --port 8000
+
+Endpoints:
+    GET /health
+    GET /materials?category=&class=&q=&filter=density<5&sort=&order=&page=&per_page=&at=
+    GET /materials/{key}?at=
+    GET /materials/{key}/structure
+    GET /rank?index=specific_strength&order=desc&limit=&category=&filter=&at=
+    GET /indices
+
+at=<°C> evaluates properties with temperature tables at that temperature
+(loads NumPy on first use).
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import query
+from prototypes import with_atomic_positions
+from store import content_version, load_materials
+
+SUMMARY_FIELDS = ("name", "class", "category")
+GZIP_MIN_BYTES = 1024
+MAX_HEADER_BYTES = 16 * 1024
+MAX_TEMPERATURE_VIEWS = 32
+
+STATUS_TEXT = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 431: "Request Header Fields Too Large", 500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class CachedResponse:
+    """Serialized body plus its precomputed ETag and gzip variant"""
+    __slots__ = ("status", "body", "gzipped", "etag")
+
+    def __init__(self, status: int, payload, version: str):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = '"%s"' % hashlib.sha1(version.encode("ascii") + self.body).hexdigest()[:20]
+        self.gzipped = gzip.compress(self.body, compresslevel=6) if len(self.body) >= GZIP_MIN_BYTES else None
+
+
+# =============================================================================
+# API
+# =============================================================================
+
+class MaterialsAPI:
+    """Routes requests to JSON payloads; responses are cached per canonical URL"""
+
+    def __init__(self, materials: Dict[str, Dict], cache_size: int = 4096):
+        self.materials = materials
+        self.version = content_version(materials)
+        self.cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.cache_size = cache_size
+        self._table = None
+        self._at: "OrderedDict[float, Dict[str, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def respond(self, target: str) -> CachedResponse:
+        path, params = self._canonical(target)
+        cache_key = path + "?" + "&".join(f"{k}={v}" for k, values in params for v in values)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.cache.move_to_end(cache_key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        try:
+            payload = self.route(path, dict(params))
+            response = CachedResponse(200, payload, self.version)
+        except HTTPError as exc:
+            response = CachedResponse(exc.status, {"error": exc.message}, self.version)
+        except query.QueryError as exc:
+            response = CachedResponse(400, {"error": str(exc)}, self.version)
+        except Exception as exc:
+            # Not cached: the next request retries instead of replaying the failure
+            print(f"Error serving {target}: {type(exc).__name__}: {exc}", file=sys.stderr)
+            return CachedResponse(500, {"error": "Internal server error"}, self.version)
+
+        self.cache[cache_key] = response
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return response
+
+    @staticmethod
+    def _canonical(target: str) -> Tuple[str, List[Tuple[str, List[str]]]]:
+        parts = urlsplit(target)
+        path = unquote(parts.path).rstrip("/") or "/"
+        params = sorted(parse_qs(parts.query, keep_blank_values=False).items())
+        return path, params
+
+    def route(self, path: str, params: Dict[str, List[str]]):
+        segments = [s for s in path.split("/") if s]
+        if not segments:
+            return {"service": "MEMD materials API", "version": self.version, "materials": len(self.materials)}
+        if segments == ["health"]:
+            return {"status": "ok", "version": self.version, "materials": len(self.materials)}
+        if segments == ["indices"]:
+            return {name: {"expression": expr, "description": desc}
+                    for name, (expr, desc) in query.NAMED_INDICES.items()}
+        if segments == ["materials"]:
+            return self.list_materials(params)
+        if segments[0] == "materials" and len(segments) in (2, 3):
+            material = self._get(segments[1])
+            if len(segments) == 2:
+                material = self._materials_at(params)[segments[1]]
+                return dict(material, key=segments[1])
+            if segments[2] == "structure":
+                crystal = material.get("crystal_structure")
+                if not crystal:
+                    raise HTTPError(404, f"No crystal structure data for '{segments[1]}'")
+                return with_atomic_positions(crystal)
+        if segments == ["rank"]:
+            return self.rank(params)
+        raise HTTPError(404, f"Unknown endpoint '{path}'")
+
+    def _get(self, key: str) -> Dict:
+        material = self.materials.get(key)
+        if material is None:
+            raise HTTPError(404, f"Unknown material '{key}'")
+        return material
+
+    def _materials_at(self, params: Dict[str, List[str]]) -> Dict[str, Dict]:
+        """The catalog, or its properties evaluated at ?at=<°C>"""
+        text = _first(params, "at")
+        if text is None:
+            return self.materials
+        try:
+            temperature = float(text)
+        except ValueError:
+            raise HTTPError(400, f"Bad temperature '{text}'") from None
+        materials = self._at.get(temperature)
+        if materials is None:
+            from database import MaterialsTable
+            from temperature import materials_at
+            if self._table is None:
+                self._table = MaterialsTable(self.materials)
+            materials = self._at[temperature] = materials_at(self._table, temperature)
+            if len(self._at) > MAX_TEMPERATURE_VIEWS:
+                self._at.popitem(last=False)
+        return materials
+
+    def _filtered_keys(self, params: Dict[str, List[str]], materials: Dict[str, Dict]) -> List[str]:
+        return query.filter_materials(
+            materials,
+            ranges=[query.parse_filter(f) for f in params.get("filter", [])],
+            category=_first(params, "category"),
+            material_class=_first(params, "class"),
+            search=_first(params, "q"),
+        )
+
+    def _summary(self, key: str, materials: Dict[str, Dict]) -> Dict:
+        material = materials[key]
+        summary = {"key": key}
+        summary.update({name: material.get(name) for name in SUMMARY_FIELDS})
+        summary["properties"] = material.get("properties", {})
+        return summary
+
+    def list_materials(self, params: Dict[str, List[str]]):
+        materials = self._materials_at(params)
+        keys = self._filtered_keys(params, materials)
+        sort = _first(params, "sort")
+        if sort:
+            ranked = query.rank_materials(materials, sort, keys=keys,
+                                          descending=_first(params, "order", "asc") == "desc")
+            keys = [key for key, _ in ranked]
+        page, meta = query.paginate(keys, _int(params, "page", 1), min(_int(params, "per_page", 50), 500))
+        return dict(meta, items=[self._summary(key, materials) for key in page])
+
+    def rank(self, params: Dict[str, List[str]]):
+        index = _first(params, "index")
+        if not index:
+            raise HTTPError(400, "Missing 'index' parameter")
+        materials = self._materials_at(params)
+        ranked = query.rank_materials(
+            materials, index,
+            keys=self._filtered_keys(params, materials),
+            descending=_first(params, "order", "desc") != "asc",
+            limit=_int(params, "limit", 0) or None,
+        )
+        return {
+            "index": index,
+            "terms": query.parse_index(index),
+            "items": [{"rank": i + 1, "key": key, "name": self.materials[key].get("name"), "value": value}
+                      for i, (key, value) in enumerate(ranked)],
+        }
+
+
+def _first(params: Dict[str, List[str]], name: str, default: Optional[str] = None) -> Optional[str]:
+    values = params.get(name)
+    return values[0] if values else default
+
+
+def _int(params: Dict[str, List[str]], name: str, default: int) -> int:
+    value = _first(params, name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPError(400, f"'{name}' must be an integer") from None
+
+
+# =============================================================================
+# HTTP SERVER
+# =============================================================================
+
+async def _read_headers(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "Request headers too large")
+    lines = raw.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return method, target, headers
+
+
+def _build_response(api: MaterialsAPI, method: str, target: str, headers: Dict[str, str]) -> bytes:
+    if method not in ("GET", "HEAD"):
+        response = CachedResponse(405, {"error": f"Method {method} not allowed"}, api.version)
+    else:
+        response = api.respond(target)
+
+    extra = [f"ETag: {response.etag}", "Cache-Control: public, max-age=60", "Vary: Accept-Encoding"]
+    if_none_match = headers.get("if-none-match")
+    if response.status == 200 and if_none_match and response.etag in (t.strip() for t in if_none_match.split(",")):
+        return _head(304, 0, extra)
+
+    body = response.body
+    if response.gzipped is not None and "gzip" in headers.get("accept-encoding", ""):
+        body = response.gzipped
+        extra.append("Content-Encoding: gzip")
+    head = _head(response.status, len(body), ["Content-Type: application/json; charset=utf-8"] + extra)
+    return head if method == "HEAD" else head + body
+
+
+def _head(status: int, length: int, extra: List[str]) -> bytes:
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}", f"Content-Length: {length}"] + extra
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def make_handler(api: MaterialsAPI):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await _read_headers(reader)
+                except HTTPError as exc:
+                    error = CachedResponse(exc.status, {"error": exc.message}, api.version)
+                    writer.write(_head(exc.status, len(error.body), ["Content-Type: application/json; charset=utf-8",
+                                                                     "Connection: close"]) + error.body)
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                writer.write(_build_response(api, method, target, headers))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+    return handle
+
+
+async def serve(host: str, port: int, api: MaterialsAPI):
+    server = await asyncio.start_server(make_handler(api), host, port, limit=MAX_HEADER_BYTES)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"MEMD API serving {len(api.materials)} materials on {addresses}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the MEMD materials database as a JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--store", help="store file to serve together with Solbase")
+    parser.add_argument("--cache-size", type=int, default=4096, help="cached responses (LRU)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    api = MaterialsAPI(load_materials(args.store), cache_size=args.cache_size)
+    print(f"Loaded database in {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    try:
+        asyncio.run(serve(args.host, args.port, api))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+Material Similarity
+All-pairs distance matrices over selected properties (z-scored so units don't
+dominate) and optionally composition, plus average-linkage clustering to
+order a heatmap and draw its dendrogram. Pure NumPy; large selections are
+processed in row blocks so temporaries stay bounded.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from comparison import normalize
+from database import MaterialsTable
+
+METRICS = ("euclidean", "manhattan", "cosine")
+
+# Rows per block; keeps the (block × N × features) manhattan temporary small
+BLOCK_SIZE = 256
+
+
+# =============================================================================
+# FEATURES
+# =============================================================================
+
+def composition_matrix(table: MaterialsTable, keys: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """(materials × elements) mass fractions, elements sorted by symbol"""
+    elements = sorted({element for key in keys for element in table.materials[key].get("composition", {})})
+    column = {element: i for i, element in enumerate(elements)}
+    matrix = np.zeros((len(keys), len(elements)))
+    for row, key in enumerate(keys):
+        for element, fraction in table.materials[key].get("composition", {}).items():
+            matrix[row, column[element]] = fraction
+    return matrix, elements
+
+
+def feature_matrix(table: MaterialsTable, keys: Sequence[str], properties: Sequence[str],
+                   composition_weight: float = 0.0, temperature: Optional[float] = None) -> np.ndarray:
+    """
+    z-scored property columns (missing values at the mean, i.e. 0), optionally
+    followed by composition fractions scaled by composition_weight
+    """
+    raw = table.matrix(properties, temperature=temperature)[table.positions(keys)]
+    features, _, _ = normalize(raw, "z-score")
+    features = np.nan_to_num(features, nan=0.0)
+    if composition_weight > 0:
+        composition, _ = composition_matrix(table, keys)
+        features = np.hstack([features, composition_weight * composition])
+    return features
+
+
+# =============================================================================
+# DISTANCES
+# =============================================================================
+
+def pairwise_distances(features: np.ndarray, metric: str = "euclidean",
+                       block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """
+    (N × N) distance matrix between the rows of features
+    cosine returns 1 - cosine similarity. Computed in blocks of rows.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}' (expected one of {', '.join(METRICS)})")
+
+    x = np.asarray(features, dtype=np.float64)
+    n = x.shape[0]
+    if metric == "cosine":
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        x = x / np.where(norms > 0, norms, 1.0)
+    squared = np.einsum("ij,ij->i", x, x)
+
+    distances = np.empty((n, n))
+    for start in range(0, n, block_size):
+        block = x[start:start + block_size]
+        rows = distances[start:start + block_size]
+        if metric == "manhattan":
+            np.abs(block[:, None, :] - x[None, :, :]).sum(axis=2, out=rows)
+        elif metric == "cosine":
+            np.subtract(1.0, block @ x.T, out=rows)
+        else:
+            np.matmul(block, x.T, out=rows)
+            rows *= -2.0
+            rows += squared[start:start + block_size, None]
+            rows += squared[None, :]
+            np.maximum(rows, 0.0, out=rows)
+            np.sqrt(rows, out=rows)
+
+    np.fill_diagonal(distances, 0.0)
+    distances.flags.writeable = False
+    return distances
+
+
+def to_similarity(distances: np.ndarray, metric: str) -> np.ndarray:
+    """Similarity in [0, 1] (1 = identical) from a distance matrix"""
+    if metric == "cosine":
+        return np.clip(1.0 - distances, -1.0, 1.0)
+    largest = distances.max() if distances.size else 0.0
+    return 1.0 - distances / largest if largest > 0 else np.ones_like(distances)
+
+
+# =============================================================================
+# CLUSTERING
+# =============================================================================
+
+def average_linkage(distances: np.ndarray) -> np.ndarray:
+    """
+    UPGMA clustering of a distance matrix
+    Returns an (N-1 × 4) linkage [left, right, height, size] in the SciPy
+    convention: leaves are 0..N-1 and merge i creates cluster N+i.
+    """
+    n = distances.shape[0]
+    linkage = np.zeros((max(n - 1, 0), 4))
+    if n < 2:
+        return linkage
+
+    d = np.array(distances, dtype=np.float64)
+    np.fill_diagonal(d, np.inf)
+    active = np.ones(n, dtype=bool)
+    sizes = np.ones(n)
+    cluster_id = np.arange(n)
+
+    # Nearest neighbour of every row, refreshed only where a merge changes it
+    nearest = d.argmin(axis=1)
+    nearest_distance = d[np.arange(n), nearest]
+
+    for step in range(n - 1):
+        i = int(np.argmin(np.where(active, nearest_distance, np.inf)))
+        j = int(nearest[i])
+        height = d[i, j]
+        linkage[step] = (min(cluster_id[i], cluster_id[j]), max(cluster_id[i], cluster_id[j]),
+                         height, sizes[i] + sizes[j])
+
+        # Merge j into i: size-weighted average distances
+        merged = (sizes[i] * d[i] + sizes[j] * d[j]) / (sizes[i] + sizes[j])
+        merged[i] = np.inf
+        active[j] = False
+        merged[~active] = np.inf
+        d[i] = merged
+        d[:, i] = merged
+        d[j] = np.inf
+        d[:, j] = np.inf
+        sizes[i] += sizes[j]
+        cluster_id[i] = n + step
+        nearest_distance[j] = np.inf
+
+        nearest[i] = int(np.argmin(d[i]))
+        nearest_distance[i] = d[i, nearest[i]]
+        stale = active & ((nearest == i) | (nearest == j))
+        stale[i] = False
+        for k in np.flatnonzero(stale):
+            nearest[k] = int(np.argmin(d[k]))
+            nearest_distance[k] = d[k, nearest[k]]
+        closer = active & (merged < nearest_distance)
+        nearest[closer] = i
+        nearest_distance[closer] = merged[closer]
+
+    return linkage
+
+
+def leaf_order(linkage: np.ndarray) -> List[int]:
+    """Left-to-right leaf order of a linkage (the dendrogram ordering)"""
+    n = linkage.shape[0] + 1
+    if n == 1:
+        return [0]
+    order: List[int] = []
+    stack = [2 * n - 2]
+    while stack:
+        node = stack.pop()
+        if node < n:
+            order.append(node)
+        else:
+            left, right = linkage[node - n, :2].astype(int)
+            stack.append(right)
+            stack.append(left)
+    return order
+
+
+def dendrogram_segments(linkage: np.ndarray, order: Sequence[int]) -> Tuple[List[Optional[float]], List[Optional[float]]]:
+    """
+    x/y coordinates of every dendrogram bracket (None-separated) with leaf k
+    of order at x = k, for drawing the whole tree as one line trace
+    """
+    n = linkage.shape[0] + 1
+    x_pos: Dict[int, float] = {leaf: float(k) for k, leaf in enumerate(order)}
+    y_pos: Dict[int, float] = {leaf: 0.0 for leaf in order}
+    xs: List[Optional[float]] = []
+    ys: List[Optional[float]] = []
+    for step, (left, right, height, _) in enumerate(linkage):
+        left, right = int(left), int(right)
+        x_pos[n + step] = (x_pos[left] + x_pos[right]) / 2
+        y_pos[n + step] = height
+        xs += [x_pos[left], x_pos[left], x_pos[right], x_pos[right], None]
+        ys += [y_pos[left], height, height, y_pos[right], None]
+    return xs, ys
+
+
+# =============================================================================
+# SIMILARITY MATRIX
+# =============================================================================
+
+@dataclass
+class SimilarityMatrix:
+    """Distances between selected materials with their clustered ordering"""
+    keys: List[str]
+    names: List[str]
+    properties: List[str]
+    metric: str
+    composition_weight: float
+    distances: np.ndarray
+    linkage: np.ndarray
+    order: List[int]
+
+    def similarity(self) -> np.ndarray:
+        return to_similarity(self.distances, self.metric)
+
+    def nearest(self, key: str, count: int = 5) -> List[Tuple[str, float]]:
+        """Closest materials to one key as (key, distance) pairs"""
+        row = self.distances[self.keys.index(key)]
+        ranked = [k for k in np.argsort(row, kind="stable") if self.keys[k] != key]
+        return [(self.keys[k], float(row[k])) for k in ranked[:count]]
+
+
+def similarity_matrix(table: MaterialsTable, keys: Sequence[str], properties: Sequence[str],
+                      metric: str = "euclidean", composition_weight: float = 0.0,
+                      temperature: Optional[float] = None) -> SimilarityMatrix:
+    """All-pairs distances over properties (and composition) plus dendrogram order"""
+    keys = list(keys)
+    features = feature_matrix(table, keys, properties, composition_weight, temperature)
+    distances = pairwise_distances(features, metric)
+    linkage = average_linkage(distances)
+    return SimilarityMatrix(
+        keys=keys,
+        names=[table.materials[key]["name"] for key in keys],
+        properties=list(properties),
+        metric=metric,
+        composition_weight=composition_weight,
+        distances=distances,
+        linkage=linkage,
+        order=leaf_order(linkage) if keys else [],
+    )
@@ -0,0 +1,163 @@
+"""
+Beam and Shaft Sizing
+Smallest solid section of every material that carries a load case, from
+youngs_modulus, yield_strength, poissons_ratio, density and cost_index,
+computed as whole columns at once.
+
+    cantilever         tip load F, span L       M = F L      δ = F L³ / (3 E I)
+    simply supported   mid-span load F, span L   M = F L / 4  δ = F L³ / (48 E I)
+    torsion            torque T, length L       τ = T c / J  θ = T L / (G J)
+
+The required size is the larger of the strength size (stress ≤ yield / safety
+factor; von Mises τ_allow = yield / √3 for shafts) and the stiffness size
+(deflection or twist ≤ the allowable, when given). Inputs are SI base units
+(N, N·m, m, rad); sizes are returned in mm and masses in kg.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from database import MaterialsTable
+
+CANTILEVER = "cantilever"
+SIMPLY_SUPPORTED = "simply supported"
+TORSION = "torsion"
+LOAD_CASES = (CANTILEVER, SIMPLY_SUPPORTED, TORSION)
+
+ROUND = "round"
+SQUARE = "square"
+SECTIONS = (ROUND, SQUARE)
+
+# Bending moment and deflection coefficients: M = m F L, δ = F L³ / (k E I)
+_BEAM_COEFFICIENTS = {CANTILEVER: (1.0, 3.0), SIMPLY_SUPPORTED: (0.25, 48.0)}
+
+# Used for the shear modulus where a record has no Poisson's ratio
+DEFAULT_POISSONS_RATIO = 0.3
+
+
+@dataclass(frozen=True)
+class LoadCase:
+    """
+    A beam or shaft requirement
+    load is a force (N) for beams and a torque (N·m) for torsion; allowable is
+    the deflection (m) or angle of twist (rad), None for strength only.
+    """
+    case: str
+    load: float
+    span: float
+    safety_factor: float = 1.5
+    allowable: Optional[float] = None
+    section: str = ROUND
+
+    def __post_init__(self):
+        if self.case not in LOAD_CASES:
+            raise ValueError(f"Unknown load case '{self.case}' (expected one of {', '.join(LOAD_CASES)})")
+        if self.section not in SECTIONS:
+            raise ValueError(f"Unknown section '{self.section}' (expected one of {', '.join(SECTIONS)})")
+        if self.case == TORSION and self.section != ROUND:
+            raise ValueError("Torsion is sized for round shafts only")
+        if self.load <= 0 or self.span <= 0 or self.safety_factor <= 0:
+            raise ValueError("Load, span and safety factor must be positive")
+        if self.allowable is not None and self.allowable <= 0:
+            raise ValueError("Allowable deflection/twist must be positive")
+
+
+@dataclass
+class SizingResult:
+    """Required section of every material for one load case (NaN where data is missing)"""
+    keys: List[str]
+    names: List[str]
+    load_case: LoadCase
+    strength_size: np.ndarray     # mm
+    stiffness_size: np.ndarray    # mm (NaN without an allowable)
+    size: np.ndarray              # mm
+    mass: np.ndarray              # kg
+    cost: np.ndarray              # mass × cost_index
+    governed_by_stiffness: np.ndarray
+    feasible: np.ndarray
+
+    def best(self, by: str = "mass") -> Optional[str]:
+        """Key of the lightest (by="mass") or cheapest (by="cost") feasible material"""
+        values = np.where(self.feasible, getattr(self, by), np.nan)
+        if np.isnan(values).all():
+            return None
+        return self.keys[int(np.nanargmin(values))]
+
+    def order(self, by: str = "mass") -> np.ndarray:
+        """Row order with feasible materials first, ascending by a result column"""
+        values = np.where(self.feasible, getattr(self, by), np.inf)
+        return np.lexsort((values, ~self.feasible))
+
+
+def _strength_size(case: LoadCase, yield_pa: np.ndarray) -> np.ndarray:
+    """Section size (m) at which the peak stress equals the allowable stress"""
+    if case.case == TORSION:
+        # τ = 16 T / (π d³) ≤ σy / (√3 SF)
+        allowable = yield_pa / (np.sqrt(3.0) * case.safety_factor)
+        return np.cbrt(16.0 * case.load / (np.pi * allowable))
+
+    moment = _BEAM_COEFFICIENTS[case.case][0] * case.load * case.span
+    allowable = yield_pa / case.safety_factor
+    # Round: σ = 32 M / (π d³); square: σ = 6 M / b³
+    modulus_factor = 32.0 / np.pi if case.section == ROUND else 6.0
+    return np.cbrt(modulus_factor * moment / allowable)
+
+
+def _stiffness_size(case: LoadCase, modulus_pa: np.ndarray, poissons_ratio: np.ndarray) -> np.ndarray:
+    """Section size (m) at which the deflection or twist equals the allowable"""
+    if case.allowable is None:
+        return np.full(modulus_pa.shape, np.nan)
+
+    if case.case == TORSION:
+        # θ = T L / (G J), J = π d⁴ / 32
+        shear = modulus_pa / (2.0 * (1.0 + poissons_ratio))
+        polar = case.load * case.span / (shear * case.allowable)
+        return (32.0 * polar / np.pi) ** 0.25
+
+    inertia = case.load * case.span ** 3 / (_BEAM_COEFFICIENTS[case.case][1] * modulus_pa * case.allowable)
+    # Round: I = π d⁴ / 64; square: I = b⁴ / 12
+    return (64.0 * inertia / np.pi) ** 0.25 if case.section == ROUND else (12.0 * inertia) ** 0.25
+
+
+def size_sections(table: MaterialsTable, case: LoadCase, keys: Optional[Sequence[str]] = None,
+                  temperature: Optional[float] = None, max_size: Optional[float] = None) -> SizingResult:
+    """
+    Required section, mass and cost of every material for a load case
+    Properties are evaluated at `temperature` (°C) when given. Materials
+    missing modulus, yield strength or density are infeasible, as are sizes
+    above max_size (mm).
+    """
+    keys = list(keys) if keys is not None else table.keys
+    rows = table.positions(keys)
+    modulus = table.column_at("youngs_modulus", temperature)[rows] * 1e9    # GPa -> Pa
+    yield_pa = table.column_at("yield_strength", temperature)[rows] * 1e6   # MPa -> Pa
+    density = table.column_at("density", temperature)[rows] * 1e3           # g/cm³ -> kg/m³
+    poissons_ratio = np.nan_to_num(table.column("poissons_ratio")[rows], nan=DEFAULT_POISSONS_RATIO)
+    cost_index = table.column("cost_index")[rows]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = np.where(yield_pa > 0, _strength_size(case, yield_pa), np.nan)
+        stiffness = np.where(modulus > 0, _stiffness_size(case, modulus, poissons_ratio), np.nan)
+        size = np.fmax(strength, stiffness) if case.allowable is not None else strength
+        if case.allowable is not None:
+            size = np.where(np.isnan(stiffness), np.nan, size)
+        area = np.pi * size ** 2 / 4.0 if case.section == ROUND else size ** 2
+        mass = np.where(density > 0, density * area * case.span, np.nan)
+
+    feasible = ~np.isnan(mass)
+    if max_size is not None:
+        feasible &= size * 1e3 <= max_size
+    return SizingResult(
+        keys=keys,
+        names=[table.materials[key]["name"] for key in keys],
+        load_case=case,
+        strength_size=strength * 1e3,
+        stiffness_size=stiffness * 1e3,
+        size=size * 1e3,
+        mass=mass,
+        cost=mass * cost_index,
+        governed_by_stiffness=stiffness > strength,
+        feasible=feasible,
+    )
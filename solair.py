@@ -1,22 +1,43 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import numpy as np
-from typing import Dict, List, Any
-
-# Import the database
-from Solbase import load_verified_mechanical_materials
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+
+# plotly and pandas are imported inside the views that render them, so a
+# rerun that never shows a chart or table doesn't pay for them
+# (see import_report.py for the per-module cost)
+if TYPE_CHECKING:
+    import numpy as np
+    import plotly.graph_objects as go
+    from comparison import Comparison
+    from similarity import SimilarityMatrix
+    from uncertainty import Distribution, UncertaintyModel
+    from cycle_counting import CycleHistogram
+    from phase_diagram import PhaseGrid
+    from quench import QuenchResult
+    from carburizing import ProcessWindow
+    from stress_strain import StressStrainCurves
+
+# Import the database (verified catalog plus imported materials)
+from database import MaterialsDatabase, MaterialsTable, get_database
+from temperature import ROOM_TEMPERATURE
+from thermal import DERIVED_PROPERTIES
+from hardness import HARDNESS_SCALES, format_hardness, native_scale
+from units import PROPERTIES, SI, UNIT_SYSTEMS, format_quantity, property_label
+from prototypes import get_atomic_positions
+import metrics
 logo = "logo.png"
 
 # =============================================================================
 # 3D VISUALIZATION FUNCTIONS
 # =============================================================================
 
-def create_crystal_structure_plot(crystal_data: Dict, material_name: str) -> go.Figure:
+@metrics.timed()
+def create_crystal_structure_plot(crystal_data: Dict, material_name: str) -> "go.Figure":
     """Create complete 3D crystal structure visualization with all atoms"""
+    import plotly.graph_objects as go
     
-    if not crystal_data or not crystal_data.get("atomic_positions"):
+    atoms = get_atomic_positions(crystal_data)
+    
+    if not atoms:
         fig = go.Figure()
         fig.add_annotation(
             text="Crystal structure data not available for this material",
@@ -28,7 +49,6 @@ def create_crystal_structure_plot(crystal_data: Dict, material_name: str) -> go.
         return fig
     
     lattice = crystal_data["lattice_parameters"]
-    atoms = crystal_data["atomic_positions"]
     
     fig = go.Figure()
     
@@ -142,14 +162,464 @@ def create_crystal_structure_plot(crystal_data: Dict, material_name: str) -> go.
     
     return fig
 
+# =============================================================================
+# COMPARISON FIGURES
+# =============================================================================
+
+PARALLEL_COORDINATES = "Parallel Coordinates"
+RADAR = "Radar"
+COMPARISON_STYLES = (PARALLEL_COORDINATES, RADAR)
+
+# Parallel coordinates get a labelled "Material" axis up to this many selections
+MATERIAL_AXIS_LIMIT = 30
+
+@metrics.timed()
+def create_parallel_coordinates_plot(comparison: "Comparison") -> "go.Figure":
+    """One Parcoords trace: an axis per property, a line per material"""
+    import plotly.graph_objects as go
+    
+    dimensions = []
+    n_materials = len(comparison.keys)
+    if n_materials <= MATERIAL_AXIS_LIMIT:
+        dimensions.append(dict(
+            label="Material",
+            values=list(range(n_materials)),
+            tickvals=list(range(n_materials)),
+            ticktext=comparison.names
+        ))
+    
+    for column, label in enumerate(comparison.labels):
+        tickvals, ticktext = comparison.axis_ticks(column)
+        dimensions.append(dict(
+            label=label,
+            values=comparison.normalized[:, column],
+            tickvals=tickvals,
+            ticktext=ticktext
+        ))
+    
+    fig = go.Figure(go.Parcoords(
+        line=dict(
+            color=list(range(n_materials)),
+            colorscale="Viridis",
+            showscale=False
+        ),
+        dimensions=dimensions
+    ))
+    fig.update_layout(margin=dict(l=120, r=60))
+    return fig
+
+@metrics.timed()
+def create_radar_plot(comparison: "Comparison") -> "go.Figure":
+    """One Scatterpolargl trace holding every material's closed polygon, separated by gaps"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    n_materials, n_props = comparison.normalized.shape
+    labels = comparison.labels
+    
+    # (materials × (props + closing point + gap)) flattened into one trace
+    r = np.full((n_materials, n_props + 2), np.nan)
+    r[:, :n_props] = comparison.normalized
+    r[:, n_props] = comparison.normalized[:, 0]
+    raw = np.full_like(r, np.nan)
+    raw[:, :n_props] = comparison.raw
+    raw[:, n_props] = comparison.raw[:, 0]
+    theta = np.tile(np.array(labels + labels[:1] + [labels[0]], dtype=object), n_materials)
+    names = np.repeat(np.array(comparison.names, dtype=object), n_props + 2)
+    colors = np.repeat(np.arange(n_materials), n_props + 2)
+    
+    fig = go.Figure(go.Scatterpolargl(
+        r=r.ravel(),
+        theta=theta,
+        text=names,
+        customdata=raw.ravel(),
+        mode="lines+markers",
+        connectgaps=False,
+        line=dict(width=1.5),
+        marker=dict(size=5, color=colors, colorscale="Viridis"),
+        hovertemplate="%{text}<br>%{theta}: %{customdata:.4g}<extra></extra>",
+        fill="toself" if n_materials <= 5 else "none",
+        opacity=0.8 if n_materials <= 20 else 0.4
+    ))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True)), showlegend=False)
+    return fig
+
+def create_comparison_plot(table: "MaterialsTable", keys: List[str], properties: List[str],
+                           method: str = "min-max", style: str = PARALLEL_COORDINATES,
+                           system: str = SI, temperature: Optional[float] = None) -> "go.Figure":
+    """Normalize the selection and draw it as parallel coordinates or a radar chart"""
+    from comparison import compare
+    
+    comparison = compare(table, keys, properties, method, system, temperature)
+    if style == RADAR:
+        return create_radar_plot(comparison)
+    return create_parallel_coordinates_plot(comparison)
+
+@metrics.timed()
+def create_mechanical_comparison_plot(table: "MaterialsTable", keys: List[str], method: str = "min-max",
+                                      style: str = PARALLEL_COORDINATES, system: str = SI,
+                                      temperature: Optional[float] = None) -> "go.Figure":
+    """Build the mechanical properties comparison chart"""
+    from comparison import PROPERTY_SETS
+    
+    fig = create_comparison_plot(table, keys, PROPERTY_SETS["mechanical"], method, style, system, temperature)
+    fig.update_layout(title=f"Mechanical Properties Comparison ({method}){_at_label(temperature)}")
+    return fig
+
+@metrics.timed()
+def create_physical_comparison_plot(table: "MaterialsTable", keys: List[str], method: str = "min-max",
+                                    style: str = PARALLEL_COORDINATES, system: str = SI,
+                                    temperature: Optional[float] = None) -> "go.Figure":
+    """Build the physical properties comparison chart"""
+    from comparison import PROPERTY_SETS
+    
+    fig = create_comparison_plot(table, keys, PROPERTY_SETS["physical"], method, style, system, temperature)
+    fig.update_layout(title=f"Physical Properties Comparison ({method}){_at_label(temperature)}")
+    return fig
+
+def _at_label(temperature: Optional[float]) -> str:
+    return f" at {temperature:g} °C" if temperature is not None else ""
+
+@metrics.timed()
+def create_temperature_curve_plot(material: Dict, temperature: Optional[float] = None,
+                                  system: str = SI) -> "go.Figure":
+    """One line per property table, each normalized to its room-temperature value"""
+    import numpy as np
+    import plotly.graph_objects as go
+    from units import convert
+    
+    fig = go.Figure()
+    for prop, curve in material["temperature_curves"].items():
+        temps = np.asarray(curve["temperature"], dtype=np.float64)
+        values = np.asarray(convert(np.asarray(curve["values"], dtype=np.float64), prop, system))
+        reference = np.interp(ROOM_TEMPERATURE, temps, values)
+        fig.add_trace(go.Scatter(
+            x=temps,
+            y=values / reference if reference else values,
+            customdata=values,
+            mode="lines+markers",
+            name=property_label(prop, system),
+            hovertemplate="%{x:g} °C: %{customdata:.4g}<extra>%{fullData.name}</extra>"
+        ))
+    if temperature is not None:
+        fig.add_vline(x=temperature, line_dash="dash", line_color="#888")
+    fig.update_layout(
+        xaxis_title="Temperature (°C)",
+        yaxis_title="Fraction of room-temperature value",
+        legend=dict(orientation="h", y=-0.2)
+    )
+    return fig
+
+# Materials shown in the uncertainty chart
+UNCERTAINTY_CHART_LIMIT = 40
+
+@metrics.timed()
+def create_uncertainty_plot(distribution: "Distribution", names: List[str], order: "Any",
+                            index: str) -> "go.Figure":
+    """Median with 5–95 % whiskers for every material, as one trace"""
+    import plotly.graph_objects as go
+    
+    low, median, high = (distribution.percentile(q)[order] for q in (5.0, 50.0, 95.0))
+    fig = go.Figure(go.Scatter(
+        x=median,
+        y=[names[i] for i in order],
+        mode="markers",
+        marker=dict(size=8, color="#1f77b4"),
+        error_x=dict(type="data", symmetric=False, array=high - median, arrayminus=median - low, thickness=1.5),
+        customdata=list(zip(low, high)),
+        hovertemplate="%{y}<br>P50 %{x:.4g}<br>P5–P95 %{customdata[0]:.4g} – %{customdata[1]:.4g}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"{index}: median and 5–95 % range ({distribution.n_samples:,} samples)",
+        yaxis=dict(autorange="reversed"),
+        height=max(400, 22 * len(order) + 120)
+    )
+    return fig
+
+@metrics.timed()
+def create_rainflow_plot(histogram: "CycleHistogram", unit: str) -> "go.Figure":
+    """Rainflow matrix: cycle counts over range and mean (log colour scale)"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    ranges, means, counts = histogram.matrix()
+    with np.errstate(divide="ignore"):
+        z = np.where(counts > 0, np.log10(counts), np.nan)
+    fig = go.Figure(go.Heatmap(
+        x=means, y=ranges, z=z, customdata=counts,
+        colorscale="Viridis", colorbar=dict(title="log₁₀ cycles"),
+        hovertemplate=f"Range %{{y:.4g}} {unit}<br>Mean %{{x:.4g}} {unit}<br>%{{customdata:.4g}} cycles<extra></extra>"
+    ))
+    fig.update_layout(title="Rainflow Matrix", xaxis_title=f"Mean ({unit})", yaxis_title=f"Range ({unit})", height=450)
+    return fig
+
+@metrics.timed()
+def create_history_plot(positions: "np.ndarray", values: "np.ndarray", unit: str, samples: int) -> "go.Figure":
+    """Min–max envelope of a window of a load history"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Scattergl(
+        x=positions, y=values, mode="lines", line=dict(width=1),
+        hovertemplate=f"Sample %{{x:,}}<br>%{{y:.4g}} {unit}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"Load History ({len(positions):,} of {samples:,} samples shown)",
+        xaxis_title="Sample", yaxis_title=unit, height=350
+    )
+    return fig
+
+# Grid nodes sent to the browser per axis; hover reads every shown node from the cached grid
+PHASE_CHART_NODES = (168, 121)
+
+@metrics.timed()
+def create_phase_diagram_plot(grid: "PhaseGrid", carbon: float, temperature: float,
+                              steels: Optional[Dict[str, float]] = None) -> "go.Figure":
+    """Phase fields of the Fe–Fe₃C diagram with lever-rule hover and the selected point"""
+    import numpy as np
+    import plotly.graph_objects as go
+    from phase_diagram import REGIONS
+    
+    # Strided view of the precomputed grid: no reclassification on rerun
+    column_step = max(1, len(grid.compositions) // (PHASE_CHART_NODES[0] - 1))
+    row_step = max(1, len(grid.temperatures) // (PHASE_CHART_NODES[1] - 1))
+    view = (slice(None, None, row_step), slice(None, None, column_step))
+    region = grid.region[view]
+    labels = np.array([label for label, _, _ in REGIONS])
+    fig = go.Figure(go.Heatmap(
+        x=grid.compositions[view[1]], y=grid.temperatures[view[0]], z=region,
+        text=labels[region],
+        customdata=np.round(np.stack([grid.first[view], grid.second[view], grid.fraction[view]], axis=-1), 4),
+        colorscale="Turbo", zmin=0, zmax=len(REGIONS) - 1, showscale=False,
+        hovertemplate=("%{x:.2f} wt% C, %{y:.0f} °C<br><b>%{text}</b><br>"
+                       "Tie-line %{customdata[0]:.3f} – %{customdata[1]:.3f} wt% C<br>"
+                       "Second phase %{customdata[2]:.1%}<extra></extra>")
+    ))
+    for name, c in (steels or {}).items():
+        fig.add_vline(x=c, line=dict(color="white", dash="dot", width=1),
+                      annotation_text=name, annotation_position="top")
+    fig.add_trace(go.Scatter(x=[carbon], y=[temperature], mode="markers",
+                             marker=dict(size=12, color="white", line=dict(color="black", width=2)),
+                             hoverinfo="skip", showlegend=False))
+    fig.update_layout(title="Fe–Fe₃C Phase Diagram", xaxis_title="Carbon (wt%)",
+                      yaxis_title="Temperature (°C)", height=550)
+    return fig
+
+@metrics.timed()
+def create_quench_plot(result: "QuenchResult") -> "go.Figure":
+    """Centre (solid) and surface (dashed) temperature histories of every material"""
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+    
+    fig = go.Figure()
+    for i, name in enumerate(result.names):
+        color = qualitative.Plotly[i % len(qualitative.Plotly)]
+        for at, dash in (("centre", "solid"), ("surface", "dash")):
+            fig.add_trace(go.Scatter(
+                x=result.times, y=getattr(result, at)[i], mode="lines", name=f"{name} ({at})",
+                legendgroup=name, line=dict(color=color, dash=dash),
+                hovertemplate=f"{name} {at}<br>%{{x:.1f}} s: %{{y:.0f}} °C<extra></extra>"
+            ))
+    fig.update_layout(title="Cooling Curves", xaxis_title="Time (s)", yaxis_title="Temperature (°C)", height=500)
+    return fig
+
+@metrics.timed()
+def create_process_window_plot(window: "ProcessWindow") -> "go.Figure":
+    """Case depth contours over carburizing temperature and time"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Contour(
+        x=window.hours, y=window.temperatures, z=window.depth,
+        colorscale="Viridis", colorbar=dict(title="Case depth (mm)"),
+        contours=dict(showlabels=True),
+        hovertemplate="%{y:.0f} °C, %{x:.1f} h<br>Case depth %{z:.2f} mm<extra></extra>"
+    ))
+    fig.update_layout(title=f"Process Window (case to {window.case_carbon:.2f} wt% C)",
+                      xaxis_title="Time (h)", yaxis_title="Temperature (°C)", height=450)
+    return fig
+
+@metrics.timed()
+def create_carbon_profile_plot(depths: "Any", profiles: Dict[str, "Any"], case_carbon: float) -> "go.Figure":
+    """Carbon profiles (wt% C against depth) with the case carbon level"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    for name, profile in profiles.items():
+        fig.add_trace(go.Scatter(x=depths, y=profile, mode="lines", name=name))
+    fig.add_hline(y=case_carbon, line=dict(color="gray", dash="dot"), annotation_text="case carbon")
+    fig.update_layout(title="Carbon Profile", xaxis_title="Depth (mm)", yaxis_title="Carbon (wt%)", height=450)
+    return fig
+
+# Above this many curves the overlay is one WebGL trace without a legend
+OVERLAY_LEGEND_LIMIT = 20
+
+@metrics.timed()
+def create_stress_strain_plot(curves: "StressStrainCurves", kind: str = "engineering") -> "go.Figure":
+    """Overlay of engineering or true stress–strain curves"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    strain = getattr(curves, f"{kind}_strain") * 100.0
+    stress = getattr(curves, f"{kind}_stress")
+    fig = go.Figure()
+    if len(curves.names) <= OVERLAY_LEGEND_LIMIT:
+        for i, name in enumerate(curves.names):
+            fig.add_trace(go.Scatter(x=strain[i], y=stress[i], mode="lines", name=name,
+                                     hovertemplate=f"{name}<br>%{{x:.2f}} %: %{{y:.0f}} MPa<extra></extra>"))
+    else:
+        # One trace for all curves: rows end in a NaN gap so lines don't join
+        gap = np.full((len(strain), 1), np.nan, dtype=strain.dtype)
+        names = np.repeat(np.array(curves.names, dtype=object), strain.shape[1] + 1)
+        fig.add_trace(go.Scattergl(
+            x=np.hstack([strain, gap]).ravel(), y=np.hstack([stress, gap]).ravel(), mode="lines",
+            line=dict(width=1), opacity=0.6, text=names, showlegend=False,
+            hovertemplate="%{text}<br>%{x:.2f} %: %{y:.0f} MPa<extra></extra>"
+        ))
+    title = "Engineering" if kind == "engineering" else "True"
+    fig.update_layout(title=f"{title} Stress–Strain Curves (Ramberg–Osgood)",
+                      xaxis_title=f"{title} strain (%)", yaxis_title=f"{title} stress (MPa)", height=500)
+    return fig
+
+# Heatmaps larger than this drop per-cell hover names and axis labels
+HEATMAP_LABEL_LIMIT = 60
+
+@metrics.timed()
+def create_similarity_heatmap(matrix: "SimilarityMatrix", clustered: bool = True,
+                              show_similarity: bool = False) -> "go.Figure":
+    """Heatmap of the distance (or similarity) matrix with its dendrogram on top"""
+    import numpy as np
+    import plotly.graph_objects as go
+    from similarity import dendrogram_segments
+    
+    n = len(matrix.keys)
+    order = np.array(matrix.order if clustered else range(n), dtype=np.intp)
+    values = matrix.similarity() if show_similarity else matrix.distances
+    z = values[np.ix_(order, order)]
+    names = [matrix.names[i] for i in order]
+    labelled = n <= HEATMAP_LABEL_LIMIT
+    
+    fig = go.Figure(go.Heatmap(
+        z=z,
+        x=np.arange(n),
+        y=np.arange(n),
+        colorscale="Viridis" if show_similarity else "Viridis_r",
+        colorbar=dict(title="Similarity" if show_similarity else "Distance", len=0.75, y=0.375),
+        text=[[f"{a} ↔ {b}" for b in names] for a in names] if labelled else None,
+        hovertemplate=("%{text}" if labelled else "%{y} ↔ %{x}") + "<br>%{z:.3f}<extra></extra>"
+    ))
+    
+    axis = dict(
+        tickvals=list(range(n)) if labelled else [],
+        ticktext=names if labelled else [],
+        showgrid=False,
+        zeroline=False
+    )
+    fig.update_layout(
+        xaxis=dict(axis, domain=[0, 1]),
+        yaxis=dict(axis, domain=[0, 0.75], autorange="reversed"),
+        height=max(500, min(1200, 300 + 12 * n)),
+        showlegend=False
+    )
+    
+    if clustered and n > 1:
+        xs, ys = dendrogram_segments(matrix.linkage, matrix.order)
+        fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=dict(color="#555", width=1),
+                                 hoverinfo="skip", yaxis="y2"))
+        fig.update_layout(yaxis2=dict(domain=[0.78, 1], showticklabels=False, showgrid=False, zeroline=False))
+    
+    return fig
+
+def render_figure(fig: "go.Figure", width: Optional[int] = None):
+    """
+    Send a figure to the browser, recording its JSON payload size when tracked
+    Line traces are first reduced to the point budget of the chart width
+    (the figure's own width, else DEFAULT_CHART_WIDTH px).
+    """
+    from downsample import decimate_figure, point_budget
+    
+    with metrics.span("decimate"):
+        decimate_figure(fig, point_budget(width or fig.layout.width))
+    with metrics.span("plotly_chart"):
+        if metrics.tracking_payload():
+            with metrics.span("figure_json"):
+                metrics.add_payload(len(fig.to_json().encode("utf-8")))
+        st.plotly_chart(fig, use_container_width=True)
+
 # =============================================================================
 # MAIN APPLICATION CLASS
 # =============================================================================
 
+@st.cache_resource
+def get_shared_database() -> MaterialsDatabase:
+    """One immutable database per server process, shared by every session"""
+    return get_database()
+
+
+@st.cache_resource(max_entries=16)
+def get_similarity_matrix(version: str, keys: tuple, properties: tuple, metric: str,
+                          composition_weight: float, temperature: Optional[float] = None) -> "SimilarityMatrix":
+    """Distance matrix per (selection, property set, metric); view toggles reuse it"""
+    from similarity import similarity_matrix
+    return similarity_matrix(get_shared_database(), keys, properties, metric, composition_weight, temperature)
+
+
+@st.cache_resource
+def get_uncertainty_model(version: str) -> "UncertaintyModel":
+    """Distribution parameter arrays of the shared database"""
+    from uncertainty import UncertaintyModel
+    return UncertaintyModel(get_shared_database())
+
+
+@st.cache_data(max_entries=4, show_spinner="Counting cycles…")
+def get_cycle_histogram(file_id: str, _upload, column: Optional[str], bin_width: float) -> "CycleHistogram":
+    """Rainflow histogram of an uploaded history, streamed in chunks (keyed by upload id)"""
+    from cycle_counting import count_cycles, read_history_csv
+    _upload.seek(0)
+    return count_cycles(read_history_csv(_upload, column), bin_width)
+
+
+@st.cache_data(max_entries=16, show_spinner="Reading the window…")
+def get_history_window(file_id: str, _upload, column: Optional[str], start: int, stop: int,
+                       buckets: int) -> tuple:
+    """Min–max envelope of samples [start, stop) of an uploaded history, streamed in chunks"""
+    from downsample import stream_window
+    from cycle_counting import read_history_csv
+    _upload.seek(0)
+    return stream_window(read_history_csv(_upload, column), start, stop, buckets)
+
+
+@st.cache_resource(max_entries=32)
+def get_index_distribution(version: str, index: str, keys: tuple, n_samples: int,
+                           default_cov: float, seed: int) -> "Distribution":
+    """Monte Carlo percentiles of an index; reruns with the same inputs reuse them"""
+    from uncertainty import index_distribution
+    return index_distribution(get_uncertainty_model(version), index, keys, n_samples,
+                              default_cov=default_cov, seed=seed)
+
+
+@st.cache_resource
+def get_phase_grid() -> "PhaseGrid":
+    """Fe–Fe₃C diagram classified once per server process"""
+    from phase_diagram import phase_grid
+    return phase_grid()
+
+
 class MechanicalEngineeringMaterialsApp:
     def __init__(self):
-        self.materials_data = load_verified_mechanical_materials()
+        self.db = get_shared_database()
+        self.materials_data = self.db.materials
+    
+    @property
+    def unit_system(self) -> str:
+        """Unit system picked in the sidebar toggle"""
+        return st.session_state.get("unit_system", SI)
+    
+    @property
+    def temperature(self) -> Optional[float]:
+        """Temperature picked in the sidebar (None at room temperature)"""
+        temperature = st.session_state.get("temperature", ROOM_TEMPERATURE)
+        return None if temperature == ROOM_TEMPERATURE else float(temperature)
     
+    @metrics.timed()
     def display_material_details(self, material_key: str):
         """Display detailed material information"""
         material = self.materials_data[material_key]
@@ -164,7 +634,7 @@ class MechanicalEngineeringMaterialsApp:
         ])
         
         with tab1:
-            self.display_properties(material)
+            self.display_properties(material, material_key)
         
         with tab2:
             self.display_crystal_structure(material, material_key)
@@ -181,35 +651,73 @@ class MechanicalEngineeringMaterialsApp:
         with tab6:
             self.display_sources(material)
     
-    def display_properties(self, material: Dict):
-        """Display material properties"""
-        props = material["properties"]
+    @metrics.timed()
+    def display_properties(self, material: Dict, material_key: str):
+        """Display material properties in the selected unit system"""
+        system = self.unit_system
+        temperature = self.temperature
+        props = self.db.values(material_key, system=system, temperature=temperature)
+        room = self.db.values(material_key, system=system) if temperature is not None else props
+        
+        if temperature is not None:
+            st.caption(f"🌡️ Evaluated at {temperature:g} °C (Δ vs. room temperature)")
+        
+        def show(prop):
+            if prop == "hardness":
+                show_hardness()
+                return
+            delta = props[prop] - room[prop]
+            st.metric(PROPERTIES[prop].label, format_quantity(props[prop], prop, system),
+                      delta=f"{delta:+.3g}" if delta else None)
+        
+        def show_hardness():
+            # Native scale as measured, the other scales converted (ASTM E140)
+            native = native_scale(material)
+            row = self.db.index[material_key]
+            others = [format_hardness(self.db.hardness(scale)[row], scale) for scale in HARDNESS_SCALES
+                      if scale != native and self.db.hardness(scale)[row] == self.db.hardness(scale)[row]]
+            st.metric(PROPERTIES["hardness"].label, format_hardness(material["properties"].get("hardness"), native),
+                      help=("≈ " + " • ".join(others) + " (ASTM E140 conversion)") if others
+                      else "Outside the range of the other scales")
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.subheader("📐 Basic Properties")
-            st.metric("Density", f"{props['density']} g/cm³")
-            st.metric("Young's Modulus", f"{props['youngs_modulus']} GPa")
-            st.metric("Poisson's Ratio", f"{props['poissons_ratio']}")
-            st.metric("Melting Point", f"{props['melting_point']} °C")
+            for prop in ("density", "youngs_modulus", "poissons_ratio", "melting_point"):
+                show(prop)
         
         with col2:
             st.subheader("💪 Mechanical Properties")
-            st.metric("Yield Strength", f"{props['yield_strength']} MPa")
-            st.metric("Tensile Strength", f"{props['tensile_strength']} MPa")
-            st.metric("Elongation", f"{props['elongation']} %")
-            st.metric("Hardness", f"{props['hardness']} BHN")
-            st.metric("Fatigue Strength", f"{props['fatigue_strength']} MPa")
+            for prop in ("yield_strength", "tensile_strength", "elongation", "hardness", "fatigue_strength"):
+                show(prop)
         
         with col3:
             st.subheader("🔥 Thermal & Electrical")
-            st.metric("Thermal Conductivity", f"{props['thermal_conductivity']} W/m·K")
-            st.metric("Thermal Expansion", f"{props['thermal_expansion']} μm/m·K")
-            st.metric("Electrical Resistivity", f"{props['electrical_resistivity']:.2e} Ω·m")
-            st.metric("Fracture Toughness", f"{props['fracture_toughness']} MPa√m")
+            for prop in ("thermal_conductivity", "thermal_expansion", "electrical_resistivity", "fracture_toughness"):
+                show(prop)
+        
+        with st.expander("🔥 Thermal performance"):
+            derived = self.db.values(material_key, DERIVED_PROPERTIES, temperature=temperature)
+            for col, (name, value) in zip(st.columns(len(derived)), derived.items()):
+                col.metric(DERIVED_PROPERTIES[name].label, format_quantity(value, name),
+                           help=DERIVED_PROPERTIES[name].description)
+        
+        if material.get("property_ranges"):
+            spreads = []
+            for prop, spec in material["property_ranges"].items():
+                if spec.get("distribution") == "normal":
+                    spreads.append(f"{PROPERTIES[prop].label} σ = {spec['std']:g}")
+                else:
+                    spreads.append(f"{PROPERTIES[prop].label} {spec['min']:g}–{spec['max']:g}")
+            st.caption("📏 Ranges (canonical units): " + " • ".join(spreads))
+        
+        if material.get("temperature_curves"):
+            with st.expander("🌡️ Temperature dependence"):
+                render_figure(create_temperature_curve_plot(material, temperature, system))
             
     
+    @metrics.timed()
     def display_crystal_structure(self, material: Dict, material_key: str):
         """Display crystal structure"""
         if "crystal_structure" in material:
@@ -221,9 +729,9 @@ class MechanicalEngineeringMaterialsApp:
                 st.subheader("Crystal Information")
                 st.write(f"**Crystal System**: {crystal_data['crystal_system']}")
                 st.write(f"**Structure Type**: {crystal_data['structure_type']}")
-                st.write(f"**Space Group**: {crystal_data['space_group']}")
-                st.write(f"**Coordination Number**: {crystal_data['coordination_number']}")
-                st.write(f"**Atomic Packing Factor**: {crystal_data['atomic_packing_factor']}")
+                st.write(f"**Space Group**: {crystal_data.get('space_group', 'N/A')}")
+                st.write(f"**Coordination Number**: {crystal_data.get('coordination_number', 'N/A')}")
+                st.write(f"**Atomic Packing Factor**: {crystal_data.get('atomic_packing_factor', 'N/A')}")
                 st.write(f"**Atoms per Unit Cell**: {crystal_data.get('atoms_per_unit_cell', 'N/A')}")
                 
                 if "description" in crystal_data:
@@ -241,9 +749,10 @@ class MechanicalEngineeringMaterialsApp:
             with col2:
                 st.subheader("3D Crystal Structure")
                 fig = create_crystal_structure_plot(crystal_data, material["name"])
-                st.plotly_chart(fig, use_container_width=True)
+                render_figure(fig)
                 
                 
+    @metrics.timed()
     def display_applications(self, material: Dict):
         """Display applications and characteristics"""
         col1, col2 = st.columns(2)
@@ -263,6 +772,7 @@ class MechanicalEngineeringMaterialsApp:
                 for process, temp in material["heat_treatment"].items():
                     st.write(f"**{process.replace('_', ' ').title()}**: {temp}")
     
+    @metrics.timed()
     def display_composition(self, material: Dict):
         """Display chemical composition"""
         composition = material["composition"]
@@ -278,18 +788,21 @@ class MechanicalEngineeringMaterialsApp:
                 "Atomic %": f"{fraction * 100:.1f}"  # Simplified
             })
         
+        import pandas as pd
         df = pd.DataFrame(comp_data)
         st.dataframe(df, use_container_width=True, hide_index=True)
         
-        # Pie chart for visualization
+        # Pie chart for visualization (go.Pie avoids importing plotly.express)
         if len(composition) > 1:
-            fig = px.pie(
+            import plotly.graph_objects as go
+            fig = go.Figure(go.Pie(
                 values=list(composition.values()),
-                names=list(composition.keys()),
-                title="Composition Distribution"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                labels=list(composition.keys())
+            ))
+            fig.update_layout(title="Composition Distribution")
+            render_figure(fig)
     
+    @metrics.timed()
     def display_educational(self, material: Dict):
         """Display educational insights"""
         st.subheader("🎓 Educational Insights")
@@ -346,6 +859,7 @@ class MechanicalEngineeringMaterialsApp:
         - Understanding its crystal structure helps predict mechanical behavior
         """)
     
+    @metrics.timed()
     def display_sources(self, material: Dict):
         """Display data sources"""
         st.subheader("📚 Verified Data Sources")
@@ -357,144 +871,543 @@ class MechanicalEngineeringMaterialsApp:
         
 
     
+    @metrics.timed()
     def show_comparison_tool(self):
         """Show material comparison tool"""
         st.header("📈 Material Comparison Tool")
         
-        material_options = {data["name"]: key for key, data in self.materials_data.items()}
+        material_options = self.db.name_to_key
         selected_materials = st.multiselect(
             "Select materials to compare:",
-            options=list(material_options.keys()),
+            options=self.db.names,
+            default=[]
+        )
+        selected_categories = st.multiselect(
+            "Or add whole categories:",
+            options=self.db.categories,
+            format_func=lambda cat: cat.replace('_', ' ').title(),
             default=[]
         )
         
-        if len(selected_materials) < 2:
+        # Keys in selection order, categories appended without duplicates
+        selected_keys = list(dict.fromkeys(
+            [material_options[name] for name in selected_materials]
+            + [key for cat in selected_categories for key in self.db.by_category[cat]]
+        ))
+        
+        if len(selected_keys) < 2:
             st.warning("Please select at least 2 materials for comparison")
             return
         
         comparison_type = st.selectbox(
             "Comparison Type:",
-            ["Mechanical Properties", "Physical Properties", "Crystal Structures"]
+            ["Mechanical Properties", "Physical Properties", "Crystal Structures", "Similarity Matrix",
+             "Stress–Strain Curves"]
         )
         
+        if comparison_type == "Crystal Structures":
+            self.compare_crystal_structures(selected_keys)
+            return
+        if comparison_type == "Stress–Strain Curves":
+            self.compare_stress_strain(selected_keys)
+            return
+        if comparison_type == "Similarity Matrix":
+            self.compare_similarity(selected_keys)
+            return
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            style = st.radio("Chart:", COMPARISON_STYLES, horizontal=True)
+        with col2:
+            from comparison import NORMALIZATIONS
+            method = st.radio("Normalization:", NORMALIZATIONS, horizontal=True)
+        
         if comparison_type == "Mechanical Properties":
-            self.compare_mechanical_properties(selected_materials, material_options)
-        elif comparison_type == "Physical Properties":
-            self.compare_physical_properties(selected_materials, material_options)
+            self.compare_mechanical_properties(selected_keys, method, style)
         else:
-            self.compare_crystal_structures(selected_materials, material_options)
+            self.compare_physical_properties(selected_keys, method, style)
     
-    def compare_mechanical_properties(self, selected_materials, material_options):
+    @metrics.timed()
+    def compare_mechanical_properties(self, selected_keys, method, style):
         """Compare mechanical properties"""
-        properties = ["yield_strength", "tensile_strength", "youngs_modulus", "hardness", "elongation"]
-        property_names = ["Yield Strength (MPa)", "Tensile Strength (MPa)", "Young's Modulus (GPa)", "Hardness (BHN)", "Elongation (%)"]
+        fig = create_mechanical_comparison_plot(self.db, selected_keys, method, style, self.unit_system,
+                                                self.temperature)
+        render_figure(fig)
         
-        fig = go.Figure()
+        with st.expander("🔨 Hardness on every scale"):
+            rows = self.db.positions(selected_keys)
+            columns = {scale: self.db.hardness(scale)[rows] for scale in HARDNESS_SCALES}
+            st.dataframe([
+                dict({"Material": self.materials_data[key]["name"],
+                      "Measured": format_hardness(self.materials_data[key]["properties"].get("hardness"),
+                                                  native_scale(self.materials_data[key]))},
+                     **{scale: columns[scale][i] for scale in HARDNESS_SCALES})
+                for i, key in enumerate(selected_keys)
+            ], use_container_width=True, hide_index=True)
+            st.caption("Converted through Vickers with the ASTM E140 steel tables; blank outside a scale's range.")
+    
+    @metrics.timed()
+    def compare_stress_strain(self, selected_keys):
+        """Synthetic tensile curves of the selection, overlaid, with CSV export"""
+        from stress_strain import stress_strain_curves
         
-        for prop, prop_name in zip(properties, property_names):
-            values = []
-            for material_name in selected_materials:
-                material_key = material_options[material_name]
-                values.append(self.materials_data[material_key]["properties"][prop])
-            
-            fig.add_trace(go.Bar(
-                name=prop_name,
-                x=selected_materials,
-                y=values
-            ))
+        kind = st.radio("Curve:", ["engineering", "true"], horizontal=True, format_func=str.title)
+        curves = stress_strain_curves(self.db, selected_keys, self.temperature)
+        render_figure(create_stress_strain_plot(curves, kind))
+        st.caption("Ramberg–Osgood fits through yield (0.2 % offset) and tensile strength, necking at the "
+                   "Considère point and fracture at the elongation; true curves end at necking.")
+        st.download_button("⬇️ Download curves (CSV)", curves.to_csv(), file_name="stress_strain_curves.csv",
+                           mime="text/csv")
+    
+    @metrics.timed()
+    def compare_physical_properties(self, selected_keys, method, style):
+        """Compare physical properties"""
+        fig = create_physical_comparison_plot(self.db, selected_keys, method, style, self.unit_system,
+                                              self.temperature)
+        render_figure(fig)
+    
+    @metrics.timed()
+    def compare_similarity(self, selected_keys):
+        """All-pairs similarity heatmap with dendrogram ordering"""
+        from comparison import PROPERTY_SETS
+        from database import PROPERTY_FIELDS
+        from similarity import METRICS
         
-        fig.update_layout(
-            title="Mechanical Properties Comparison",
-            barmode='group',
-            xaxis_title="Materials",
-            yaxis_title="Property Values"
+        properties = st.multiselect(
+            "Properties:",
+            options=PROPERTY_FIELDS,
+            default=PROPERTY_SETS["mechanical"] + PROPERTY_SETS["physical"],
+            format_func=lambda prop: property_label(prop, self.unit_system)
         )
+        if not properties:
+            st.warning("Please select at least one property")
+            return
         
-        st.plotly_chart(fig, use_container_width=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            metric = st.radio("Metric:", METRICS, horizontal=True)
+            composition_weight = st.slider("Composition weight:", 0.0, 5.0, 0.0, 0.5)
+        with col2:
+            clustered = st.toggle("Cluster order", value=True)
+        with col3:
+            show_similarity = st.toggle("Show similarity", value=False)
+        
+        matrix = get_similarity_matrix(self.db.version, tuple(selected_keys), tuple(properties),
+                                       metric, composition_weight, self.temperature)
+        render_figure(create_similarity_heatmap(matrix, clustered, show_similarity))
     
-    def compare_physical_properties(self, selected_materials, material_options):
-        """Compare physical properties"""
-        properties = ["density", "thermal_conductivity", "thermal_expansion", "melting_point"]
-        property_names = ["Density (g/cm³)", "Thermal Conductivity (W/m·K)", "Thermal Expansion (μm/m·K)", "Melting Point (°C)"]
+    @metrics.timed()
+    def show_design_calculator(self):
+        """Required beam/shaft section, mass and cost of every material for one load case"""
+        import numpy as np
+        import pandas as pd
+        import sizing
         
-        fig = go.Figure()
+        st.header("🧮 Design Calculator")
+        st.caption("Sizes a solid section of every material for the load case; "
+                   "properties are taken at the sidebar temperature.")
         
-        for prop, prop_name in zip(properties, property_names):
-            values = []
-            for material_name in selected_materials:
-                material_key = material_options[material_name]
-                values.append(self.materials_data[material_key]["properties"][prop])
-            
-            fig.add_trace(go.Bar(
-                name=prop_name,
-                x=selected_materials,
-                y=values
-            ))
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            case = st.selectbox("Load case:", sizing.LOAD_CASES, format_func=str.title)
+            torsion = case == sizing.TORSION
+            section = sizing.ROUND if torsion else st.radio("Section:", sizing.SECTIONS, horizontal=True,
+                                                            format_func=str.title)
+        with col2:
+            load = st.number_input("Torque (N·m):" if torsion else "Load (N):", min_value=1.0, value=1000.0, step=100.0)
+            span = st.number_input("Length (m):" if torsion else "Span (m):", min_value=0.01, value=1.0, step=0.1)
+            safety_factor = st.number_input("Safety factor:", min_value=1.0, value=1.5, step=0.1)
+        with col3:
+            limit = st.number_input("Allowable twist (°):" if torsion else "Allowable deflection (mm):",
+                                    min_value=0.0, value=1.0 if torsion else 5.0, step=0.5,
+                                    help="0 sizes for strength only")
+            max_size = st.number_input("Largest section (mm):", min_value=0.0, value=0.0, step=10.0,
+                                       help="0 for no limit")
         
-        fig.update_layout(
-            title="Physical Properties Comparison",
-            barmode='group'
+        allowable = None
+        if limit > 0:
+            allowable = float(np.radians(limit)) if torsion else limit / 1e3
+        result = sizing.size_sections(
+            self.db,
+            sizing.LoadCase(case, load, span, safety_factor, allowable, section),
+            temperature=self.temperature,
+            max_size=max_size or None,
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        lightest, cheapest = result.best("mass"), result.best("cost")
+        if lightest is None:
+            st.warning("No material satisfies the load case.")
+            return
+        col1, col2 = st.columns(2)
+        for col, title, key, column in ((col1, "🪶 Lightest", lightest, result.mass), (col2, "💰 Cheapest", cheapest, result.cost)):
+            row = result.keys.index(key)
+            col.metric(title, result.names[row],
+                       f"{result.size[row]:.3g} mm, {result.mass[row]:.3g} kg", delta_color="off")
+        
+        dimension = "d" if section == sizing.ROUND else "b"
+        df = pd.DataFrame({
+            "Material": result.names,
+            f"{dimension} (mm)": result.size,
+            "Mass (kg)": result.mass,
+            "Relative cost": result.cost,
+            "Governed by": np.where(result.governed_by_stiffness, "stiffness", "strength"),
+            "Feasible": result.feasible,
+        }).iloc[result.order("mass")]
+        
+        def highlight(row):
+            if row.name == result.keys.index(lightest):
+                return ["background-color: #d4edda"] * len(row)
+            if row.name == result.keys.index(cheapest):
+                return ["background-color: #fff3cd"] * len(row)
+            return [""] * len(row)
+        
+        st.dataframe(df.style.apply(highlight, axis=1).format(precision=3), use_container_width=True, hide_index=True)
+        st.caption("Green: lightest feasible • yellow: cheapest feasible. Click a column header to sort.")
     
+    @metrics.timed()
+    def show_fatigue_tool(self):
+        """Fatigue life and safety factor of every material for a load or spectrum"""
+        import numpy as np
+        import pandas as pd
+        import fatigue
+        
+        st.header("🔁 Fatigue Screening")
+        st.caption("Basquin S-N line from tensile and fatigue strength, mean-stress correction and "
+                   "Miner's rule; properties are taken at the sidebar temperature.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            source = st.radio("Loading:", ["Constant amplitude", "Load spectrum (CSV)", "Load history (rainflow)"],
+                              horizontal=True)
+            method = st.radio("Mean-stress correction:", fatigue.METHODS, horizontal=True, format_func=str.title)
+        with col2:
+            design_passes = st.number_input("Design life (spectrum passes):", min_value=1.0, value=1.0, step=1.0)
+            estimate = st.checkbox("Estimate missing fatigue strength (0.45 × tensile)", value=False)
+        
+        if source == "Constant amplitude":
+            col1, col2, col3 = st.columns(3)
+            amplitude = col1.number_input("Stress amplitude (MPa):", min_value=1.0, value=150.0, step=10.0)
+            mean = col2.number_input("Mean stress (MPa):", value=50.0, step=10.0)
+            cycles = col3.number_input("Cycles per pass:", min_value=1.0, value=1e6, step=1e5, format="%.0f")
+            spectrum = fatigue.LoadSpectrum.constant(amplitude, mean, cycles)
+        elif source == "Load spectrum (CSV)":
+            upload = st.file_uploader("Blocks with columns amplitude, mean, cycles (MPa)", type=["csv"])
+            if upload is None:
+                st.info("Upload a spectrum to screen the database against it.")
+                return
+            blocks = pd.read_csv(upload)
+            missing = {"amplitude", "mean", "cycles"} - set(blocks.columns)
+            if missing:
+                st.error(f"Missing columns: {', '.join(sorted(missing))}")
+                return
+            spectrum = fatigue.LoadSpectrum(blocks["amplitude"].to_numpy(), blocks["mean"].to_numpy(),
+                                            blocks["cycles"].to_numpy())
+            st.caption(f"{len(spectrum):,} blocks, {spectrum.cycles:,.0f} cycles per pass")
+        
+        stress_scale = None
+        if source == "Load history (rainflow)":
+            col1, col2, col3 = st.columns(3)
+            unit = col1.radio("Samples in:", ["MPa", "µε"], horizontal=True)
+            bin_width = col2.number_input(f"Bin width ({unit}):", min_value=0.01, value=5.0, step=1.0)
+            column = col3.text_input("Column:", placeholder="last column") or None
+            upload = st.file_uploader("Stress or strain history (one sample per row)", type=["csv"])
+            if upload is None:
+                st.info("Upload a load history to rainflow-count it (ASTM E1049).")
+                return
+            try:
+                histogram = get_cycle_histogram(upload.file_id, upload, column, bin_width)
+            except (KeyError, ValueError) as exc:
+                st.error(f"Cannot read the history: {exc}")
+                return
+            if not histogram.samples:
+                st.warning("The history has no samples.")
+                return
+            st.caption(f"{histogram.samples:,} samples → {histogram.cycles:,.1f} cycles in {len(histogram.counts):,} bins")
+            render_figure(create_rainflow_plot(histogram, unit))
+            with st.expander("📉 Load history"):
+                # Only the zoom window is re-read, at the full point budget of the chart
+                window = st.slider("Samples:", 0, histogram.samples, (0, histogram.samples),
+                                   step=max(1, histogram.samples // 1000))
+                if window[1] > window[0]:
+                    from downsample import point_budget
+                    positions, values = get_history_window(upload.file_id, upload, column, window[0], window[1],
+                                                           point_budget() // 2)
+                    render_figure(create_history_plot(positions, values, unit, window[1] - window[0]))
+            spectrum = histogram.to_spectrum()
+            if unit == "µε":
+                # Elastic: σ [MPa] = E [GPa] × ε [µε] × 1e-3, per material
+                stress_scale = self.db.column_at("youngs_modulus", self.temperature) * 1e-3
+        
+        result = fatigue.fatigue_life(self.db, spectrum, method, design_passes=design_passes,
+                                      temperature=self.temperature, endurance_ratio=0.45 if estimate else None,
+                                      stress_scale=stress_scale)
+        rows = result.order()
+        rows = rows[~np.isnan(result.safety_factor[rows])]
+        if not len(rows):
+            st.warning("No material has both tensile and fatigue strength.")
+            return
+        st.dataframe(pd.DataFrame({
+            "Material": [result.names[i] for i in rows],
+            "Safety factor": result.safety_factor[rows],
+            "Life (cycles)": result.life_cycles[rows],
+            "Damage per pass": result.damage[rows],
+            "Passes": np.where(result.life[rows] >= design_passes, "✓", "✗"),
+        }), use_container_width=True, hide_index=True)
     
+    @metrics.timed()
+    def show_uncertainty_tool(self):
+        """Monte Carlo spread of a performance index for every material"""
+        import numpy as np
+        import query
         
+        st.header("🎲 Property Uncertainty")
+        st.caption("Samples every material's property ranges (min/typical/max or normal) and "
+                   "propagates them through a performance index.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            index = st.selectbox("Index:", list(query.NAMED_INDICES),
+                                 format_func=lambda name: f"{name} — {query.NAMED_INDICES[name][0]}")
+            custom = st.text_input("…or an expression:", placeholder="yield_strength^0.5/density")
+            index = custom.strip() or index
+        with col2:
+            n_samples = st.select_slider("Samples per material:", [1_000, 5_000, 10_000, 50_000], value=10_000)
+            default_cov = st.slider("Assumed scatter without a range (% CoV):", 0, 20, 0) / 100
+            categories = st.multiselect("Categories:", self.db.categories, default=[],
+                                        format_func=lambda cat: cat.replace('_', ' ').title())
+        
+        keys = tuple(key for cat in categories for key in self.db.by_category[cat]) if categories else tuple(self.db.keys)
+        try:
+            distribution = get_index_distribution(self.db.version, index, keys, n_samples, default_cov, 0)
+        except query.QueryError as exc:
+            st.error(str(exc))
+            return
+        
+        median = distribution.percentile(50.0)
+        order = np.argsort(-np.nan_to_num(median, nan=-np.inf), kind="stable")
+        order = order[~np.isnan(median[order])]
+        names = [self.materials_data[key]["name"] for key in distribution.keys]
+        render_figure(create_uncertainty_plot(distribution, names, order[:UNCERTAINTY_CHART_LIMIT], index))
+        
+        with_ranges = {key for key in distribution.keys if self.materials_data[key].get("property_ranges")}
+        st.dataframe([
+            {
+                "Material": names[i],
+                "P5": distribution.percentile(5.0)[i],
+                "P50": median[i],
+                "P95": distribution.percentile(95.0)[i],
+                "Mean": distribution.mean[i],
+                "Std": distribution.std[i],
+                "Ranges": "✓" if distribution.keys[i] in with_ranges else "",
+            }
+            for i in order
+        ], use_container_width=True, hide_index=True)
     
-    def compare_crystal_structures(self, selected_materials, material_options):
+    @metrics.timed()
+    def show_quench_tool(self):
+        """Cooling or heating curves of selected materials for one part and quenchant"""
+        import quench
+        
+        st.header("🌊 Quench Simulator")
+        st.caption("Transient conduction in a plate, cylinder or sphere with a surface heat transfer "
+                   "coefficient; conductivity, specific heat and density at the mean temperature.")
+        
+        selected_keys = st.multiselect(
+            "Materials:", options=self.db.keys, default=["aisi_1020", "al_6061", "copper"],
+            format_func=lambda key: self.materials_data[key]["name"]
+        )
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            geometry = st.selectbox("Part:", quench.GEOMETRIES, format_func=str.title)
+            label = "Half-thickness" if geometry == quench.PLATE else "Radius"
+            size = st.number_input(f"{label} (mm):", min_value=0.1, value=10.0, step=1.0)
+            half_length = None
+            if geometry != quench.SPHERE and st.checkbox("Finite length (2D)", value=False):
+                half_length = st.number_input("Half-length (mm):", min_value=0.1, value=20.0, step=1.0) * 1e-3
+        with col2:
+            initial = st.number_input("Part temperature (°C):", value=850.0, step=25.0)
+            quenchant = st.selectbox("Quenchant:", list(quench.QUENCHANTS), index=2, format_func=str.title)
+            htc = st.number_input("Heat transfer coefficient (W/m²·K):", min_value=1.0,
+                                  value=quench.QUENCHANTS[quenchant], step=100.0)
+        with col3:
+            ambient = st.number_input("Quenchant temperature (°C):", value=25.0, step=5.0)
+            duration = st.number_input("Duration (s):", min_value=1.0, value=120.0, step=30.0)
+            target = st.number_input("Report time to (°C):", value=0.5 * (initial + ambient), step=25.0)
+        
+        if not selected_keys:
+            st.info("Select materials to simulate.")
+            return
+        try:
+            case = quench.QuenchCase(geometry, size * 1e-3, initial, ambient, htc, duration, half_length=half_length)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+        result = quench.simulate_quench(self.db, case, selected_keys)
+        render_figure(create_quench_plot(result))
+        
+        to_centre, to_surface = result.time_to(target, "centre"), result.time_to(target, "surface")
+        st.dataframe([
+            {
+                "Material": name,
+                f"Centre to {target:.0f} °C (s)": to_centre[i],
+                f"Surface to {target:.0f} °C (s)": to_surface[i],
+                f"Centre after {duration:.0f} s (°C)": result.centre[i, -1],
+                "Largest centre–surface difference (°C)": abs(result.centre[i] - result.surface[i]).max(),
+            }
+            for i, name in enumerate(result.names)
+        ], use_container_width=True, hide_index=True)
+    
+    @metrics.timed()
+    def show_carburizing_tool(self):
+        """Case depth process window and boost-diffuse profiles of a carburizing steel"""
+        import numpy as np
+        import carburizing
+        from phase_diagram import carbon_content
+        
+        st.header("🔩 Carburizing")
+        st.caption("Carbon diffusion from a surface carbon potential with Arrhenius diffusivity "
+                   "D = D₀ exp(-Q/RT) stored with the material.")
+        
+        keys = [key for key in self.db.keys if carburizing.diffusion_data(self.materials_data[key])]
+        if not keys:
+            st.info("No material lists carbon diffusion data.")
+            return
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            key = st.selectbox("Material:", keys, format_func=lambda key: self.materials_data[key]["name"])
+            data = carburizing.diffusion_data(self.materials_data[key])
+        with col2:
+            core = st.number_input("Core carbon (wt%):", min_value=0.0, max_value=0.8,
+                                   value=min(carbon_content(self.materials_data[key]), 0.8), step=0.05)
+            surface = st.number_input("Surface carbon (wt%):", min_value=0.3, max_value=1.4, value=1.0, step=0.05)
+        with col3:
+            case_carbon = st.number_input("Case carbon (wt%):", min_value=0.05, max_value=1.2,
+                                          value=carburizing.CASE_CARBON, step=0.05)
+            target = st.number_input("Target case depth (mm):", min_value=0.05, value=1.0, step=0.1)
+        
+        try:
+            window = carburizing.process_window(data, np.arange(850.0, 1001.0, 5.0), np.linspace(0.25, 24.0, 96),
+                                                surface, core, case_carbon)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+        render_figure(create_process_window_plot(window))
+        hours = window.time_for(target)
+        st.caption("Time to the target case depth: " + " • ".join(
+            f"{t:.0f} °C {h:.1f} h" for t, h in zip(window.temperatures[::6], hours[::6])
+        ))
+        
+        st.subheader("Boost-diffuse schedule")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            temperature = st.number_input("Temperature (°C):", min_value=800.0, max_value=1100.0, value=925.0, step=5.0)
+        with col2:
+            boost_hours = st.number_input("Boost (h):", min_value=0.1, value=3.0, step=0.5)
+            boost_potential = st.number_input("Boost carbon potential (wt%):", min_value=0.3, value=1.1, step=0.05)
+        with col3:
+            diffuse_hours = st.number_input("Diffuse (h):", min_value=0.0, value=1.0, step=0.5)
+            diffuse_potential = st.number_input("Diffuse carbon potential (wt%):", min_value=0.3, value=0.8, step=0.05)
+        
+        schedule = [carburizing.CarburizingStep(boost_hours, temperature, boost_potential)]
+        if diffuse_hours > 0:
+            schedule.append(carburizing.CarburizingStep(diffuse_hours, temperature, diffuse_potential))
+        depths, profiles = carburizing.diffuse(data, schedule, core)
+        total_hours = boost_hours + diffuse_hours
+        curves = {f"After boost ({boost_hours:g} h)": profiles[0]}
+        if diffuse_hours > 0:
+            curves[f"After diffuse ({total_hours:g} h)"] = profiles[-1]
+        curves[f"Constant {surface:g} wt% for {total_hours:g} h (erf)"] = carburizing.carbon_profile(
+            data, depths, total_hours, temperature, surface, core)
+        render_figure(create_carbon_profile_plot(depths, curves, case_carbon))
+        
+        depth = carburizing.profile_case_depth(depths, np.array(list(curves.values())), case_carbon)
+        st.dataframe([
+            {"Profile": name, "Surface carbon (wt%)": profile[0], "Case depth (mm)": depth[i]}
+            for i, (name, profile) in enumerate(curves.items())
+        ], use_container_width=True, hide_index=True)
+    
+    @metrics.timed()
+    def show_phase_diagram(self):
+        """Fe–Fe₃C diagram with lever-rule fractions at a chosen composition and temperature"""
+        import numpy as np
+        from phase_diagram import CEMENTITE, EUTECTOID, carbon_content, microconstituents
+        
+        st.header("⚗️ Fe–Fe₃C Phase Diagram")
+        st.caption("Equilibrium (slow cooling) phases of iron–carbon alloys. Every node of the diagram is "
+                   "precomputed once; moving the point only reads the cached grid.")
+        
+        grid = get_phase_grid()
+        col1, col2 = st.columns(2)
+        with col1:
+            carbon = st.slider("Carbon (wt%):", 0.0, CEMENTITE, EUTECTOID[0], step=0.01)
+        with col2:
+            temperature = st.slider("Temperature (°C):", float(grid.temperatures[0]), float(grid.temperatures[-1]),
+                                    800.0, step=1.0)
+        
+        steels = {
+            material["name"]: carbon_content(material)
+            for material in self.materials_data.values()
+            if (material.get("composition") or {}).get("Fe", 0.0) >= 0.95
+        }
+        render_figure(create_phase_diagram_plot(grid, carbon, temperature, steels))
+        
+        point = grid.lookup(carbon, temperature)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader(f"{point['region']} at {point['temperature']:.0f} °C")
+            st.dataframe([
+                {"Phase": phase["phase"], "Carbon (wt%)": phase["carbon"], "Mass fraction": phase["fraction"]}
+                for phase in point["phases"]
+            ], use_container_width=True, hide_index=True)
+        with col2:
+            st.subheader("After slow cooling to room temperature")
+            amounts = microconstituents(np.array(point["carbon"]))
+            st.dataframe([
+                {"Microconstituent": name.capitalize(), "Mass fraction": float(value)}
+                for name, value in amounts.items() if value > 0
+            ], use_container_width=True, hide_index=True)
+    
+    @metrics.timed()
+    def compare_crystal_structures(self, selected_keys):
         """Compare crystal structures"""
         st.subheader("Crystal Structure Comparison")
         
-        for material_name in selected_materials:
-            material_key = material_options[material_name]
+        for material_key in selected_keys:
             material_data = self.materials_data[material_key]
+            material_name = material_data["name"]
             
             if "crystal_structure" in material_data:
                 crystal = material_data["crystal_structure"]
                 st.write(f"**{material_name}**: {crystal['structure_type']} - {crystal.get('description', '')}")
-                st.write(f"Coordination Number: {crystal['coordination_number']}, Packing Factor: {crystal['atomic_packing_factor']}")
+                st.write(f"Coordination Number: {crystal.get('coordination_number', 'N/A')}, Packing Factor: {crystal.get('atomic_packing_factor', 'N/A')}")
             else:
                 st.write(f"**{material_name}**: Crystal structure data not available")
             
             st.write("---")
     
+    @metrics.timed()
     def browse_materials(self):
         """Browse materials by category"""
         st.header("📚 Materials Database")
         
-        # Group by category
-        categories = {}
-        for key, material in self.materials_data.items():
-            cat = material["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append((key, material))
-        
-        # Category selector
+        # Category selector (categories are indexed once in the shared database)
         selected_category = st.selectbox(
             "Select Material Category:",
-            ["All Categories"] + list(categories.keys())
+            ("All Categories",) + self.db.categories
         )
         
         if selected_category == "All Categories":
-            materials_to_show = list(self.materials_data.items())
+            keys_to_show = self.db.keys
         else:
-            materials_to_show = categories[selected_category]
+            keys_to_show = self.db.by_category[selected_category]
         
         # Material selection
-        material_names = [data["name"] for _, data in materials_to_show]
-        selected_material_name = st.selectbox(
+        selected_material_key = st.selectbox(
             "Select a material:",
-            options=material_names
+            options=keys_to_show,
+            format_func=lambda key: self.materials_data[key]["name"]
         )
         
-        # Find the selected material key
-        selected_material_key = None
-        for key, data in materials_to_show:
-            if data["name"] == selected_material_name:
-                selected_material_key = key
-                break
-        
         if selected_material_key:
             self.display_material_details(selected_material_key)
     
@@ -509,36 +1422,71 @@ class MechanicalEngineeringMaterialsApp:
             initial_sidebar_state="expanded"
         )
         
-        st.title("⚙️ Mechanical Engineering Materials Database(MEMD)")
-        
-        st.logo(logo)
-        
-        # Sidebar
-        
-        
-        st.sidebar.title("🧭 Navigation")
-        
-        app_mode = st.sidebar.radio(
-            "Select Mode:",
-            ["📚 Browse Materials", "📈 Compare Materials"]
-        )
-        
-        st.sidebar.title("📊 Database Info")
-        
-        
-        st.sidebar.info(f"**Total Materials**: {len(self.materials_data)}")
-
-        
-        
+        metrics.start_rerun(track_payload=st.session_state.get("debug_timings", False))
         
+        with metrics.span("run"):
+            st.title("⚙️ Mechanical Engineering Materials Database(MEMD)")
+            
+            st.logo(logo)
+            
+            # Sidebar
+            st.sidebar.title("🧭 Navigation")
+            
+            app_mode = st.sidebar.radio(
+                "Select Mode:",
+                ["📚 Browse Materials", "📈 Compare Materials", "🧮 Design Calculator", "🔁 Fatigue", "🎲 Uncertainty",
+                 "⚗️ Phase Diagram", "🌊 Quench",
+                 "🔩 Carburizing"]
+            )
+            
+            st.sidebar.title("📊 Database Info")
+            
+            st.sidebar.info(f"**Total Materials**: {len(self.materials_data)}")
+            st.sidebar.radio("📏 Units", UNIT_SYSTEMS, key="unit_system", horizontal=True)
+            st.sidebar.number_input("🌡️ Temperature (°C)", value=ROOM_TEMPERATURE, step=25.0, key="temperature",
+                                    help="Properties with temperature tables are evaluated at this temperature")
+            st.sidebar.checkbox("🐞 Debug timings", key="debug_timings")
+            
+            # Main content
+            if app_mode == "📚 Browse Materials":
+                self.browse_materials()
+            elif app_mode == "📈 Compare Materials":
+                self.show_comparison_tool()
+            elif app_mode == "🧮 Design Calculator":
+                self.show_design_calculator()
+            elif app_mode == "🔁 Fatigue":
+                self.show_fatigue_tool()
+            elif app_mode == "🎲 Uncertainty":
+                self.show_uncertainty_tool()
+            elif app_mode == "⚗️ Phase Diagram":
+                self.show_phase_diagram()
+            elif app_mode == "🌊 Quench":
+                self.show_quench_tool()
+            elif app_mode == "🔩 Carburizing":
+                self.show_carburizing_tool()
+            else:
+                self.show_learning_guide()
         
-        # Main content
-        if app_mode == "📚 Browse Materials":
-            self.browse_materials()
-        elif app_mode == "📈 Compare Materials":
-            self.show_comparison_tool()
-        else:
-            self.show_learning_guide()
+        metrics.finish_rerun()
+        if st.session_state.get("debug_timings"):
+            self.show_debug_panel()
+    
+    def show_debug_panel(self):
+        """Show this rerun's timing spans in the sidebar"""
+        with st.sidebar.expander("🐞 Rerun Timings", expanded=True):
+            spans = metrics.rerun_spans()
+            total = next((s.seconds for s in spans if s.name == "run"), 0.0)
+            st.caption(f"Rerun: {total * 1000:.1f} ms • {len(spans)} spans")
+            st.dataframe([s.as_dict() for s in spans], use_container_width=True, hide_index=True)
+            
+            report = metrics.session_memory(st.session_state, self, shared=self.db)
+            st.caption(
+                f"Session memory: {report['session_bytes'] / 1024:.1f} KiB of "
+                f"{report['budget_bytes'] / 1024:.0f} KiB budget • "
+                f"shared database: {report['shared_bytes'] / 1024:.1f} KiB (v{self.db.version})"
+            )
+            if report["over_budget"]:
+                st.warning("This session is over its memory budget")
 
 # =============================================================================
 # RUN APPLICATION
@@ -0,0 +1,64 @@
+"""
+Active Materials Store
+The verified Solbase catalog plus materials appended by the bulk importer
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from Solbase import load_verified_mechanical_materials
+
+STORE_ENV_VAR = "MEMD_STORE"
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "materials_store.jsonl")
+
+
+def get_store_path(path: Optional[str] = None) -> str:
+    """Resolve the active store path (argument, then $MEMD_STORE, then default)"""
+    return path or os.environ.get(STORE_ENV_VAR) or DEFAULT_STORE_PATH
+
+
+def iter_store(path: Optional[str] = None) -> Iterator[Tuple[str, Dict]]:
+    """Yield (material_key, record) pairs from the store one line at a time"""
+    path = get_store_path(path)
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            yield entry["key"], entry["record"]
+
+
+def append_records(records: Iterable[Tuple[str, Dict]], path: Optional[str] = None) -> int:
+    """Append (material_key, record) pairs to the store and flush them to disk"""
+    path = get_store_path(path)
+    count = 0
+    with open(path, "a", encoding="utf-8") as fh:
+        for key, record in records:
+            fh.write(json.dumps({"key": key, "record": record}, ensure_ascii=False))
+            fh.write("\n")
+            count += 1
+        fh.flush()
+        os.fsync(fh.fileno())
+    return count
+
+
+def load_materials(store_path: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Load the verified database merged with every imported material
+    Later store entries replace earlier ones with the same key
+    """
+    materials = load_verified_mechanical_materials()
+    for key, record in iter_store(store_path):
+        materials[key] = record
+    return materials
+
+
+def content_version(materials: Dict[str, Dict]) -> str:
+    """Short content hash identifying one state of the database"""
+    payload = json.dumps(materials, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:12]
@@ -0,0 +1,177 @@
+"""
+Synthetic Stress–Strain Curves
+Engineering and true tensile curves of every material from youngs_modulus,
+yield_strength, tensile_strength and elongation, using a Ramberg–Osgood
+law in true stress and strain:
+
+    ε = σ / E + 0.002 (σ / σy)ⁿ
+
+The exponent n is chosen per material so that the engineering maximum equals
+the tensile strength. Necking starts where dσ/dε = σ (Considère), which puts
+the uniform plastic strain near 1/n. Beyond necking the engineering stress
+falls linearly to fracture at the elongation. True curves stop at necking,
+where the uniform-strain conversion no longer holds. A material whose
+elongation is below that uniform strain fractures while still hardening, so
+its n instead puts the tensile strength at the fracture strain.
+
+The law is explicit in stress, so the curves are a (materials × points)
+stress grid evaluated in one pass, with no per-material root finding beyond
+a vectorized bisection for n. Strains are fractions; stresses are MPa.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from database import MaterialsTable
+
+OFFSET = 0.002
+CURVE_POINTS = 200
+NECKING_POINTS = 20
+# Engineering stress at fracture as a fraction of the tensile strength
+FRACTURE_STRESS_RATIO = 0.8
+# Materials per block (bounds the float64 temporaries; curves are stored as float32)
+CHUNK_MATERIALS = 8192
+# Relative strain tolerance for "fractures at the end of the stress grid"
+FRACTURE_TOLERANCE = 1e-6
+# Bounds of the Ramberg–Osgood exponent (n → ∞ is perfectly plastic)
+EXPONENT_RANGE = (1.1, 200.0)
+
+
+def _necking(exponent: np.ndarray, yield_mpa: np.ndarray, modulus_mpa: np.ndarray):
+    """(true stress, true strain) at necking for each exponent"""
+    plastic = 1.0 / exponent
+    stress = yield_mpa * (plastic / OFFSET) ** (1.0 / exponent)
+    return stress, stress / modulus_mpa + plastic
+
+
+def hardening_exponent(yield_mpa: np.ndarray, tensile_mpa: np.ndarray, modulus_mpa: np.ndarray) -> np.ndarray:
+    """Ramberg–Osgood n reproducing the tensile strength (vectorized bisection in log n)"""
+    low = np.full(np.shape(yield_mpa), np.log(EXPONENT_RANGE[0]))
+    high = np.full(np.shape(yield_mpa), np.log(EXPONENT_RANGE[1]))
+    with np.errstate(invalid="ignore", over="ignore"):
+        for _ in range(50):
+            middle = 0.5 * (low + high)
+            stress, strain = _necking(np.exp(middle), yield_mpa, modulus_mpa)
+            # The engineering maximum falls as n grows
+            too_hard = stress * np.exp(-strain) > tensile_mpa
+            low = np.where(too_hard, middle, low)
+            high = np.where(too_hard, high, middle)
+    exponent = np.exp(0.5 * (low + high))
+    return np.where(np.isnan(yield_mpa + tensile_mpa + modulus_mpa), np.nan, exponent)
+
+
+@dataclass
+class StressStrainCurves:
+    """Curves of every material as float32 (materials × points) arrays (NaN rows where data is missing)"""
+    keys: List[str]
+    names: List[str]
+    exponent: np.ndarray
+    uniform_strain: np.ndarray          # engineering strain at the tensile strength
+    engineering_strain: np.ndarray
+    engineering_stress: np.ndarray
+    true_strain: np.ndarray             # up to necking
+    true_stress: np.ndarray
+
+    def curve(self, i: int, kind: str = "engineering"):
+        """(strain, stress) of one material, "engineering" or "true" """
+        return getattr(self, f"{kind}_strain")[i], getattr(self, f"{kind}_stress")[i]
+
+    def to_csv(self) -> str:
+        """Long-format CSV: material, curve, strain, stress (MPa)"""
+        lines = ["material,curve,strain,stress_mpa"]
+        for i, name in enumerate(self.names):
+            label = '"' + name.replace('"', '""') + '"'
+            for kind in ("engineering", "true"):
+                strain, stress = self.curve(i, kind)
+                valid = ~np.isnan(strain)
+                lines.extend(f"{label},{kind},{e:.6g},{s:.6g}" for e, s in zip(strain[valid], stress[valid]))
+        return "\n".join(lines) + "\n"
+
+
+def fracture_exponent(yield_mpa: np.ndarray, tensile_mpa: np.ndarray, modulus_mpa: np.ndarray,
+                      fracture_strain: np.ndarray) -> np.ndarray:
+    """
+    Ramberg–Osgood n putting the engineering stress at the fracture strain at the
+    tensile strength (closed form). It is below the Considère fit, so the curve
+    still rises at fracture.
+    """
+    true_stress = tensile_mpa * (1.0 + fracture_strain)
+    plastic = np.log1p(fracture_strain) - true_stress / modulus_mpa
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.log(plastic / OFFSET) / np.log(true_stress / yield_mpa)
+    return np.clip(np.where(exponent > 0, exponent, np.nan), *EXPONENT_RANGE)
+
+
+def _curves(modulus, yield_mpa, tensile, fracture_strain, exponent, points):
+    """Engineering and true curves of a block of materials, and the uniform strain"""
+    necking_stress, _ = _necking(exponent, yield_mpa, modulus)
+    # Materials fracturing before necking end at the tensile strength at fracture
+    top = np.fmin(necking_stress, tensile * (1.0 + fracture_strain))
+
+    # Uniform stress grid up to necking or fracture; the law gives strain explicitly
+    stress = top[:, None] * np.linspace(0.0, 1.0, points)[None, :]
+    with np.errstate(invalid="ignore"):
+        strain = stress / modulus[:, None] + OFFSET * (stress / yield_mpa[:, None]) ** exponent[:, None]
+    engineering_strain = np.expm1(strain)
+    engineering_stress = stress / (1.0 + engineering_strain)
+    uniform = engineering_strain[:, -1]
+
+    # Stop at fracture when it comes before necking; otherwise add the necking branch
+    # (the tolerance keeps a grid end that lands on the fracture strain)
+    before_fracture = engineering_strain <= fracture_strain[:, None] * (1.0 + FRACTURE_TOLERANCE)
+    share = np.linspace(0.0, 1.0, NECKING_POINTS + 1)[None, 1:]
+    necks = (fracture_strain > uniform * (1.0 + FRACTURE_TOLERANCE))[:, None]
+    tail_strain = np.where(necks, uniform[:, None] + share * (fracture_strain - uniform)[:, None], np.nan)
+    tail_stress = np.where(necks, tensile[:, None] * (1.0 - share * (1.0 - FRACTURE_STRESS_RATIO)), np.nan)
+    return (
+        np.hstack([np.where(before_fracture, engineering_strain, np.nan), tail_strain]),
+        np.hstack([np.where(before_fracture, engineering_stress, np.nan), tail_stress]),
+        np.where(before_fracture, strain, np.nan),
+        np.where(before_fracture, stress, np.nan),
+        uniform,
+    )
+
+
+def stress_strain_curves(table: MaterialsTable, keys: Optional[Sequence[str]] = None,
+                         temperature: Optional[float] = None, points: int = CURVE_POINTS) -> StressStrainCurves:
+    """Engineering and true curves of every material (properties at `temperature` when given)"""
+    keys = list(keys) if keys is not None else table.keys
+    rows = table.positions(keys)
+    modulus = table.column_at("youngs_modulus", temperature)[rows] * 1e3   # GPa -> MPa
+    yield_mpa = table.column_at("yield_strength", temperature)[rows]
+    tensile = table.column_at("tensile_strength", temperature)[rows]
+    fracture_strain = table.column_at("elongation", temperature)[rows] / 100.0
+    valid = (modulus > 0) & (yield_mpa > 0) & (fracture_strain > 0)
+    nan = np.full(len(keys), np.nan)
+    modulus, yield_mpa = np.where(valid, modulus, nan), np.where(valid, yield_mpa, nan)
+    tensile = np.where(valid, np.fmax(tensile, yield_mpa * (1 + 1e-6)), nan)
+
+    exponent = hardening_exponent(yield_mpa, tensile, modulus)
+    # Fracture before necking: the maximum is at fracture instead
+    _, necking_strain = _necking(exponent, yield_mpa, modulus)
+    brittle = np.expm1(necking_strain) > fracture_strain
+    exponent[brittle] = fracture_exponent(yield_mpa[brittle], tensile[brittle], modulus[brittle],
+                                          fracture_strain[brittle])
+    engineering_strain = np.empty((len(keys), points + NECKING_POINTS), dtype=np.float32)
+    engineering_stress = np.empty_like(engineering_strain)
+    true_strain = np.empty((len(keys), points), dtype=np.float32)
+    true_stress = np.empty_like(true_strain)
+    uniform = np.empty(len(keys))
+    for start in range(0, len(keys), CHUNK_MATERIALS):
+        block = slice(start, start + CHUNK_MATERIALS)
+        (engineering_strain[block], engineering_stress[block], true_strain[block], true_stress[block],
+         uniform[block]) = _curves(modulus[block], yield_mpa[block], tensile[block], fracture_strain[block],
+                                   exponent[block], points)
+
+    return StressStrainCurves(
+        keys=keys,
+        names=[table.materials[key]["name"] for key in keys],
+        exponent=exponent,
+        uniform_strain=uniform,
+        engineering_strain=engineering_strain,
+        engineering_stress=engineering_stress,
+        true_strain=true_strain,
+        true_stress=true_stress,
+    )
@@ -0,0 +1,117 @@
+"""
+Temperature-Dependent Properties
+Records may carry property-vs-temperature tables next to their
+room-temperature scalars:
+
+    "temperature_curves": {
+        "youngs_modulus": {"temperature": [20, 200, 400, 600], "values": [200, 180, 140, 62]}
+    }
+
+Temperatures are in °C and values in the property's canonical unit.
+Interpolation is piecewise linear and flat beyond the ends of a table;
+materials without a table for a property keep their scalar at every
+temperature. Every material is evaluated in one vectorized lookup.
+"""
+
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+ROOM_TEMPERATURE = 20.0
+
+Temperatures = Union[float, Sequence[float], np.ndarray]
+
+
+def curve_of(record, prop: str) -> Optional[Dict]:
+    """A record's temperature table for one property, if any"""
+    curves = record.get("temperature_curves") or {}
+    curve = curves.get(prop)
+    if not curve or not curve.get("temperature"):
+        return None
+    return curve
+
+
+class CurveIndex:
+    """
+    Every material's table for one property packed into flat arrays
+    Row r's points are shifted by r * span so a single searchsorted over the
+    flat temperature array finds the bracketing points of all materials.
+    """
+
+    def __init__(self, prop: str, materials, keys: Sequence[str], fallback: np.ndarray):
+        self.prop = prop
+        self.fallback = fallback
+        rows, temps, values, lengths = [], [], [], []
+        for row, key in enumerate(keys):
+            curve = curve_of(materials[key], prop)
+            if curve is not None:
+                rows.append(row)
+                temps.extend(curve["temperature"])
+                values.extend(curve["values"])
+                lengths.append(len(curve["temperature"]))
+
+        self.rows = np.array(rows, dtype=np.intp)
+        self.has_curve = np.zeros(len(keys), dtype=bool)
+        self.has_curve[self.rows] = True
+        self.temperatures = np.array(temps, dtype=np.float64)
+        self.values = np.array(values, dtype=np.float64)
+        self.lengths = np.array(lengths, dtype=np.intp)
+        self.starts = np.concatenate([[0], np.cumsum(self.lengths)[:-1]]).astype(np.intp) if lengths else self.lengths
+
+        if lengths:
+            self.low = self.temperatures[self.starts]
+            self.high = self.temperatures[self.starts + self.lengths - 1]
+            self.origin = self.temperatures.min()
+            self.span = self.temperatures.max() - self.origin + 1.0
+            shift = np.repeat(np.arange(len(lengths)) * self.span, self.lengths)
+            self._keys = shift + (self.temperatures - self.origin)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def evaluate(self, temperatures: Temperatures) -> np.ndarray:
+        """
+        Property of every material at the given temperature(s)
+        Scalar temperature -> (materials,); array of n temperatures -> (materials × n)
+        """
+        scalar = np.ndim(temperatures) == 0
+        t = np.atleast_1d(np.asarray(temperatures, dtype=np.float64))
+        out = np.repeat(self.fallback[:, None], len(t), axis=1)
+        if len(self.rows):
+            q = np.clip(t[None, :], self.low[:, None], self.high[:, None])
+            shifted = np.arange(len(self.rows))[:, None] * self.span + (q - self.origin)
+            i0 = np.searchsorted(self._keys, shifted.ravel(), side="right").reshape(q.shape) - 1
+            first = self.starts[:, None]
+            last = (self.starts + self.lengths - 1)[:, None]
+            i0 = np.clip(i0, first, np.maximum(last - 1, first))
+            i1 = np.minimum(i0 + 1, last)
+            t0, t1 = self.temperatures[i0], self.temperatures[i1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weight = np.where(t1 > t0, (q - t0) / (t1 - t0), 0.0)
+            v0 = self.values[i0]
+            out[self.rows] = v0 + weight * (self.values[i1] - v0)
+        return out[:, 0] if scalar else out
+
+
+def materials_at(table, temperature: float) -> Dict[str, Dict]:
+    """
+    The table's records with "properties" evaluated at a temperature, for the
+    dict-based query layer. Records without any table are shared, not copied.
+    """
+    from database import PROPERTY_FIELDS
+
+    evaluated = {}
+    for prop in PROPERTY_FIELDS:
+        index = table.curve(prop)
+        if len(index):
+            column = table.column_at(prop, temperature)
+            for row in index.rows:
+                evaluated.setdefault(table.keys[row], {})[prop] = float(column[row])
+
+    materials = {}
+    for key in table.keys:
+        record = table.materials[key]
+        if key in evaluated:
+            record = dict(record, properties=dict(record["properties"], **evaluated[key]))
+        materials[key] = record
+    return materials
@@ -6,23 +6,51 @@ def get_material_template():
             "name": "Material Name",
             "class": "metal",  # metal, polymer, ceramic, composite
             "category": "specific_category",  # steel, aluminum, stainless_steel, etc.
-            "composition": {"Element1": 0.xx, "Element2": 0.xx},
+            "composition": {"Element1": 0.0, "Element2": 0.0},
+            "hardness_scale": "HB",  # optional; scale of "hardness": HB (default), HV, HRC or HRB
             "properties": {
                 "density": 0.0,  # g/cm³
                 "youngs_modulus": 0.0,  # GPa
                 "yield_strength": 0.0,  # MPa
                 "tensile_strength": 0.0,  # MPa
                 "elongation": 0.0,  # %
-                "hardness": 0.0,  # Brinell/Vickers
+                "reduction_area": 0.0,  # %
+                "hardness": 0.0,  # on hardness_scale
                 "thermal_conductivity": 0.0,  # W/m·K
+                "specific_heat": 0.0,  # J/kg·K
+                "thermal_expansion": 0.0,  # μm/m·K
                 "melting_point": 0.0,  # °C
                 "electrical_resistivity": 0.0,  # Ω·m
-                "cost": 0.0,  # relative cost
-                "fatigue_strength": 0.0  # MPa
+                "poissons_ratio": 0.0,  # dimensionless
+                "fatigue_strength": 0.0,  # MPa
+                "fracture_toughness": 0.0,  # MPa√m
+                "cost_index": 0.0  # relative cost
+            },
+            "crystal_structure": {
+                "crystal_system": "Cubic",  # Cubic, Hexagonal, ...
+                "structure_type": "BCC",
+                "space_group": "Im-3m",
+                "lattice_parameters": {"a": 0.0, "b": 0.0, "c": 0.0, "alpha": 90, "beta": 90, "gamma": 90},  # Å, °
+                "prototype": "BCC",  # name in prototypes.PROTOTYPES
+                "species": {"A": "Element1"},  # element on each prototype sublattice
+                "coordination_number": 0,
+                "atomic_packing_factor": 0.0,
+                "atoms_per_unit_cell": 0,
+                "description": "Structure description"
+            },
+            "temperature_curves": {  # optional; °C and the property's unit (see temperature.py)
+                "youngs_modulus": {"temperature": [20, 200, 400], "values": [0.0, 0.0, 0.0]}
+            },
+            "property_ranges": {  # optional; triangular/uniform (min, typical, max) or normal (std)
+                "yield_strength": {"min": 0.0, "typical": 0.0, "max": 0.0}
+            },
+            "diffusion": {  # optional; solute -> D0 (m²/s), Q (kJ/mol) (see carburizing.py)
+                "C": {"D0": 0.0, "Q": 0.0, "phase": "austenite"}
             },
             "applications": ["Application 1", "Application 2"],
             "characteristics": ["Characteristic 1", "Characteristic 2"],
             "educational_insights": ["Educational insight 1", "Insight 2"],
+            "sources": ["Source 1", "Source 2"],
             "manufacturing_notes": {
                 "machinability": "Good/Fair/Poor",
                 "weldability": "Good/Fair/Poor", 
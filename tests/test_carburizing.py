@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import carburizing
+from Solbase import load_verified_mechanical_materials
+
+SURFACE, CORE = 1.0, 0.2
+
+
+@pytest.fixture
+def steel():
+    return carburizing.diffusion_data(load_verified_mechanical_materials()["aisi_1020"])
+
+
+def test_single_step_matches_error_function(steel):
+    step = carburizing.CarburizingStep(hours=4.0, temperature=925.0, carbon_potential=SURFACE)
+    depths, profiles = carburizing.diffuse(steel, [step], CORE, depth=3.0, nodes=301, time_step=10.0)
+    exact = carburizing.carbon_profile(steel, depths, 4.0, 925.0, SURFACE, CORE)
+    assert np.abs(profiles[0] - exact).max() < 2e-4
+
+    expected = carburizing.case_depth(steel, 4.0, 925.0, SURFACE, CORE)
+    assert carburizing.profile_case_depth(depths, profiles)[0] == pytest.approx(expected, rel=1e-3)
+
+
+def test_split_step_equals_one_step(steel):
+    whole = carburizing.diffuse(steel, [carburizing.CarburizingStep(4.0, 925.0, SURFACE)], CORE)[1]
+    halves = carburizing.diffuse(steel, [carburizing.CarburizingStep(2.0, 925.0, SURFACE)] * 2, CORE)[1]
+    np.testing.assert_allclose(halves[-1], whole[0], atol=1e-12)
+
+
+def test_process_window(steel):
+    window = carburizing.process_window(steel, [900.0, 925.0, 950.0], [1.0, 4.0, 9.0], SURFACE, CORE)
+    # Depth grows as √t and with temperature
+    np.testing.assert_allclose(window.depth[:, 2] / window.depth[:, 0], 3.0)
+    assert (np.diff(window.depth[:, 0]) > 0).all()
+    np.testing.assert_allclose(window.time_for(window.depth[1, 1])[1], 4.0)
+    with pytest.raises(ValueError):
+        carburizing.case_depth(steel, 1.0, 925.0, SURFACE, CORE, case_carbon=0.1)
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+import comparison
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+MATRIX = np.array([
+    [1.0, 10.0, 5.0, np.nan],
+    [2.0, 1000.0, 5.0, np.nan],
+    [4.0, np.nan, 5.0, np.nan],
+])
+
+
+@pytest.mark.parametrize("method", ["min-max", "log"])
+def test_unit_interval_bounds(method):
+    normalized, offset, scale = comparison.normalize(MATRIX, method)
+    np.testing.assert_allclose(np.nanmin(normalized[:, :2], axis=0), 0.0)
+    np.testing.assert_allclose(np.nanmax(normalized[:, :2], axis=0), 1.0)
+    # NaN stays NaN; a constant column sits at 0 with scale 1
+    assert np.isnan(normalized[2, 1]) and np.isnan(normalized[:, 3]).all()
+    assert (normalized[:, 2] == 0.0).all() and scale[2] == 1.0
+    np.testing.assert_allclose(comparison.denormalize(normalized, method, offset, scale)[:, :3], MATRIX[:, :3])
+
+
+def test_z_score():
+    normalized, offset, scale = comparison.normalize(MATRIX[:, :1], "z-score")
+    assert normalized.mean() == pytest.approx(0.0, abs=1e-12)
+    assert normalized.std() == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        comparison.normalize(MATRIX, "rank")
+
+
+def test_log_ignores_non_positive_values():
+    normalized = comparison.normalize(np.array([[0.0], [1.0], [100.0]]), "log")[0]
+    assert np.isnan(normalized[0, 0])
+    np.testing.assert_allclose(normalized[1:, 0], [0.0, 1.0])
+
+
+def test_compare_drops_missing_properties():
+    table = MaterialsTable(load_verified_mechanical_materials())
+    keys = ["aisi_1020", "al_6061", "copper"]
+    result = comparison.compare(table, keys, ["density", "youngs_modulus", "no_such_property"])
+    assert result.properties == ["density", "youngs_modulus"]
+    assert result.raw.shape == (3, 2)
+    assert result.raw[0, 0] == pytest.approx(7.87)
+    ticks, labels = result.axis_ticks(0, count=3)
+    np.testing.assert_allclose(ticks, [0.0, 0.5, 1.0])
+    assert labels[0] == "2.7" and labels[-1] == "8.96"
@@ -0,0 +1,70 @@
+import io
+
+import numpy as np
+import pytest
+
+import cycle_counting
+
+# ASTM E1049-85 section 5.4.4 (Fig. 6) and its counts per range (Table 4)
+E1049_HISTORY = [-2, 1, -3, 5, -1, 3, -4, 4, -2]
+E1049_COUNTS = {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5}
+
+
+def _by_range(histogram):
+    counts = {}
+    for bin_, count in zip(histogram.range_bins.tolist(), histogram.counts.tolist()):
+        counts[bin_] = counts.get(bin_, 0.0) + count
+    return counts
+
+
+def _history(samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.normal(size=samples)) * 5 + 20 * np.sin(np.arange(samples) / 50)
+
+
+def test_astm_e1049_example():
+    histogram = cycle_counting.count_cycles(np.array(E1049_HISTORY, dtype=float))
+    assert _by_range(histogram) == E1049_COUNTS
+    assert histogram.samples == len(E1049_HISTORY)
+    assert histogram.cycles == sum(E1049_COUNTS.values())
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 5, 8])
+def test_astm_e1049_example_in_chunks(chunk):
+    chunks = (E1049_HISTORY[i:i + chunk] for i in range(0, len(E1049_HISTORY), chunk))
+    assert _by_range(cycle_counting.count_cycles(chunks)) == E1049_COUNTS
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64, 1000, 4097])
+def test_chunk_size_does_not_change_the_histogram(chunk):
+    history = _history(5000)
+    # Plateaus and NaN samples must not change the result either
+    history[100:110] = history[100]
+    history[2000] = np.nan
+    whole = cycle_counting.count_cycles(history, bin_width=2.0)
+    chunked = cycle_counting.count_cycles((history[i:i + chunk] for i in range(0, len(history), chunk)), bin_width=2.0)
+    np.testing.assert_array_equal(chunked.range_bins, whole.range_bins)
+    np.testing.assert_array_equal(chunked.mean_bins, whole.mean_bins)
+    np.testing.assert_array_equal(chunked.counts, whole.counts)
+    assert chunked.samples == whole.samples == len(history) - 1
+
+
+def test_empty_history():
+    histogram = cycle_counting.count_cycles(iter([]))
+    assert histogram.samples == 0 and histogram.cycles == 0.0
+    ranges, means, grid = histogram.matrix()
+    assert grid.shape == (0, 0)
+    assert len(histogram.to_spectrum()) == 0
+
+
+def test_csv_chunks_and_spectrum():
+    history = _history(300, seed=1)
+    text = "time,stress\n" + "".join(f"{i},{value}\n" for i, value in enumerate(history))
+    chunks = cycle_counting.read_history_csv(io.StringIO(text), "stress", chunk_rows=64)
+    histogram = cycle_counting.count_cycles(chunks, bin_width=4.0)
+    np.testing.assert_array_equal(histogram.counts, cycle_counting.count_cycles(history, bin_width=4.0).counts)
+
+    spectrum = histogram.to_spectrum(scale=2.0)
+    np.testing.assert_allclose(spectrum.amplitude, histogram.ranges)   # range / 2 × scale
+    assert spectrum.cycles == histogram.cycles
+    assert histogram.matrix()[2].sum() == histogram.cycles
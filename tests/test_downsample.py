@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import downsample
+
+
+def _curves(count, points, seed=0):
+    """`count` curves of `points` samples separated by single NaN gaps"""
+    rng = np.random.default_rng(seed)
+    y = rng.normal(size=(count, points + 1))
+    y[:, -1] = np.nan
+    y = y.ravel()[:-1]
+    return np.arange(len(y), dtype=np.float64), y
+
+
+@pytest.mark.parametrize("method", downsample.METHODS)
+@pytest.mark.parametrize("count, points", [(1, 100_000), (3, 20_000), (100, 50), (1000, 10)])
+def test_budget_is_respected(method, count, points):
+    x, y = _curves(count, points)
+    keep = downsample.decimate(x, y, 1000, method)
+    assert len(keep) <= 1000
+    assert (np.diff(keep) > 0).all()
+    # Curves never merge: every kept curve is still followed by a NaN
+    gaps = np.isnan(y[keep])
+    assert not (gaps[1:] & gaps[:-1]).any()
+
+
+def test_many_short_curves_keep_the_longest():
+    lengths = [2, 50, 3, 40] * 300
+    y = np.concatenate([np.append(np.ones(length), np.nan) for length in lengths])[:-1]
+    x = np.arange(len(y), dtype=np.float64)
+    curve_length = np.concatenate([np.full(length + 1, length) for length in lengths])[:-1]
+    keep = downsample.decimate(x, y, 1000)
+    assert len(keep) <= 1000
+    # Each curve needs 4 points and its gap: only the first 200 of the 50-point curves fit
+    curves = keep[~np.isnan(y[keep])]
+    assert set(curve_length[curves].tolist()) == {50}
+    assert len(curves) == 4 * 200
+
+
+def test_short_trace_is_untouched():
+    np.testing.assert_array_equal(downsample.decimate([0, 1, 2], [1, np.nan, 3], 1000), [0, 1, 2])
+    assert len(downsample.decimate(np.arange(2000.0), np.full(2000, np.nan), 1000)) == 0
+    with pytest.raises(ValueError):
+        downsample.decimate([0, 1], [0, 1], 1, method="every-other")
+
+
+def test_minmax_keeps_peaks():
+    y = np.zeros(10_000)
+    y[1234], y[8765] = 5.0, -7.0
+    keep = downsample.decimate(np.arange(len(y), dtype=np.float64), y, 500, downsample.MINMAX)
+    assert {1234, 8765} <= set(keep.tolist())
+
+
+@pytest.mark.parametrize("chunk", [1, 333, 4096, 50_000])
+def test_stream_window_matches_minmax(chunk):
+    rng = np.random.default_rng(1)
+    series = np.cumsum(rng.normal(size=50_000))
+    start, stop, buckets = 12_345, 32_345, 400   # the window divides evenly into buckets
+    chunks = (series[i:i + chunk] for i in range(0, len(series), chunk))
+    at, values = downsample.stream_window(chunks, start, stop, buckets)
+
+    expected = start + downsample.minmax_indices(series[start:stop], buckets)
+    # minmax_indices also keeps the window's ends
+    np.testing.assert_array_equal(np.union1d(at, [start, stop - 1]), expected)
+    np.testing.assert_array_equal(values, series[at])
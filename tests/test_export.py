@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import export
+from database import MaterialsTable, get_database
+from Solbase import load_verified_mechanical_materials
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _round_trip(table, tmp_path):
+    path = str(tmp_path / "materials.parquet")
+    assert export.write_parquet(path, table) == len(table)
+    return pq.read_table(path)
+
+
+@pytest.mark.parametrize("make_table", [
+    lambda: MaterialsTable(load_verified_mechanical_materials()),
+    get_database,
+], ids=["plain", "shared"])
+def test_parquet_round_trip(make_table, tmp_path):
+    table = make_table()
+    exported = _round_trip(table, tmp_path)
+
+    assert exported.num_rows == len(table)
+    assert exported.column("key").to_pylist() == list(table.keys)
+    np.testing.assert_array_equal(exported.column("density").to_numpy(), table.column("density"))
+
+    row = table.keys.index("aisi_1020")
+    crystal = exported.column("crystal_structure")[row].as_py()
+    assert crystal["lattice_parameters"] == {"a": 2.866, "b": 2.866, "c": 2.866,
+                                             "alpha": 90.0, "beta": 90.0, "gamma": 90.0}
+    assert len(crystal["atomic_positions"]) == 9   # BCC cell: 8 corners and the body centre
+    composition = exported.column("composition")[row].as_py()
+    assert {"element": "Fe", "fraction": 0.99} in composition
+    assert len(composition) == len(table.materials["aisi_1020"]["composition"])
+
+    assert exported.schema.field("hardness").metadata[b"unit"] == b"HV"
+    assert exported.schema.field("density").metadata[b"unit"] == "g/cm³".encode("utf-8")
+
+
+def test_empty_table_exports_no_rows(tmp_path):
+    # An empty table is falsy (it has __len__) but must not fall back to the catalog
+    exported = _round_trip(MaterialsTable({}), tmp_path)
+    assert exported.num_rows == 0
+    assert export.to_arrow_table(MaterialsTable({})).num_rows == 0
+    assert export.write_arrow(str(tmp_path / "empty.arrow"), MaterialsTable({})) == 0
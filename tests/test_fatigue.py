@@ -0,0 +1,83 @@
+import math
+
+import numpy as np
+import pytest
+
+import fatigue
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+KEYS = ["aisi_1020", "al_6061", "ti_6al_4v"]
+
+
+@pytest.fixture
+def table():
+    return MaterialsTable(load_verified_mechanical_materials())
+
+
+def _naive(record, spectrum, method, design_passes):
+    """(damage, safety factor) from a plain float64 loop over the blocks"""
+    ultimate = record["properties"]["tensile_strength"]
+    endurance = record["properties"]["fatigue_strength"]
+    exponent = math.log(endurance / (0.9 * ultimate)) / math.log(1e6 / 1e3)
+    coefficient = 0.9 * ultimate / 1e3 ** exponent
+    knee = any(record["composition"].get(element, 0.0) >= 0.5 for element in ("Fe", "Ti"))
+
+    blocks = []
+    for amplitude, mean, count in zip(spectrum.amplitude, spectrum.mean, spectrum.counts):
+        ratio = max(mean, 0.0) / ultimate
+        factor = 1.0 - (ratio if method == "goodman" else ratio ** 2)
+        blocks.append((amplitude / factor, count))
+
+    damage = sum(count / (amplitude / coefficient) ** (1.0 / exponent)
+                 for amplitude, count in blocks if not (knee and amplitude < endurance))
+
+    def elementary(scale):
+        return sum(count * design_passes / (scale * amplitude / coefficient) ** (1.0 / exponent)
+                   for amplitude, count in blocks)
+
+    # Bisection on the stress factor that brings the elementary damage to 1
+    low, high = 1e-6, 1e6
+    for _ in range(200):
+        middle = math.sqrt(low * high)
+        low, high = (middle, high) if elementary(middle) < 1.0 else (low, middle)
+    return damage, math.sqrt(low * high)
+
+
+@pytest.mark.parametrize("method", ["goodman", "gerber"])
+def test_damage_and_safety_match_float64_reference(table, method):
+    weakest = min(table.materials[key]["properties"]["tensile_strength"] for key in KEYS)
+    steel_endurance = table.materials["aisi_1020"]["properties"]["fatigue_strength"]
+    spectrum = fatigue.LoadSpectrum(
+        amplitude=[150.0, 90.0, 300.0, 650.0, 0.005, 0.5 * steel_endurance],
+        mean=[50.0, -30.0, 80.0, 40.0, 0.99999 * weakest, 0.0],
+        counts=[1e4, 2.5e5, 5e3, 200.0, 10.0, 1e5],
+    )
+    result = fatigue.fatigue_life(table, spectrum, method, keys=KEYS, design_passes=3.0)
+
+    for row, key in enumerate(KEYS):
+        damage, safety = _naive(table.materials[key], spectrum, method, design_passes=3.0)
+        assert result.damage[row] == pytest.approx(damage, rel=1e-5)
+        assert result.safety_factor[row] == pytest.approx(safety, rel=1e-5)
+
+
+def test_block_below_the_knee_does_no_damage(table):
+    endurance = table.materials["aisi_1020"]["properties"]["fatigue_strength"]
+    curves = fatigue.SNCurves(table, KEYS)
+    below = fatigue.LoadSpectrum.constant(0.9 * endurance, cycles=1e9)
+    above = fatigue.LoadSpectrum.constant(200.0, cycles=1e3)
+    both = fatigue.LoadSpectrum([0.9 * endurance, 200.0], [0.0, 0.0], [1e9, 1e3])
+
+    # Steel and titanium stop at their limits, aluminium does not
+    assert fatigue.miner_damage(curves, below).tolist()[::2] == [0.0, 0.0]
+    assert fatigue.miner_damage(curves, below)[1] > 0.0
+    assert fatigue.miner_damage(curves, both)[0] == pytest.approx(fatigue.miner_damage(curves, above)[0], rel=1e-5)
+    assert fatigue.miner_damage(curves, below, knee=False)[0] > 0.0
+
+
+def test_mean_at_tensile_strength_fails_at_once(table):
+    ultimate = table.materials["al_6061"]["properties"]["tensile_strength"]
+    spectrum = fatigue.LoadSpectrum([10.0, 10.0], [ultimate, 0.0], [1.0, 1.0])
+    result = fatigue.fatigue_life(table, spectrum, keys=KEYS)
+    assert np.isinf(result.damage[1]) and result.life[1] == 0.0
+    assert np.isfinite(result.damage[[0, 2]]).all()
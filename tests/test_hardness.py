@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import hardness
+
+
+def test_rockwell_brinell_round_trip():
+    hrc = np.arange(20.0, 64.5, 0.5)
+    hb = hardness.convert_hardness(hrc, hardness.ROCKWELL_C, hardness.BRINELL)
+    assert not np.isnan(hb).any()
+    np.testing.assert_allclose(hardness.convert_hardness(hb, hardness.BRINELL, hardness.ROCKWELL_C), hrc, atol=1e-9)
+
+
+def test_table_nodes():
+    assert hardness.convert_hardness(40, hardness.ROCKWELL_C, hardness.BRINELL) == pytest.approx(371)
+    assert hardness.convert_hardness(371, hardness.BRINELL, hardness.VICKERS) == pytest.approx(392)
+    assert hardness.convert_hardness(90, hardness.ROCKWELL_B, hardness.BRINELL) == pytest.approx(176)
+
+
+def test_out_of_range_is_nan():
+    assert np.isnan(hardness.convert_hardness(1150, hardness.BRINELL, hardness.VICKERS))
+    assert np.isnan(hardness.convert_hardness(200, hardness.VICKERS, hardness.ROCKWELL_C))   # below HRC 20
+    assert np.isnan(hardness.convert_hardness(75, hardness.ROCKWELL_C, hardness.VICKERS))
+
+
+def test_soft_brinell_and_vickers_pass_through():
+    values = np.array([5.0, 60.0, 10000.0])
+    np.testing.assert_array_equal(hardness.convert_hardness(values, hardness.VICKERS, hardness.VICKERS), values)
+    np.testing.assert_allclose(hardness.convert_hardness(values[:2], hardness.BRINELL, hardness.VICKERS),
+                               values[:2] / hardness.SOFT_BRINELL_RATIO)
+
+
+def test_mixed_scales():
+    converted = hardness.convert_hardness([200, 40, 90, 1150], ["HV", "HRC", "HRB", "HB"], hardness.VICKERS)
+    np.testing.assert_allclose(converted, [200, 392, 185, np.nan])
+    with pytest.raises(ValueError):
+        hardness.convert_hardness([1.0], hardness.VICKERS, "HK")
+
+
+def test_scale_names():
+    assert hardness.scale_name(" BHN ") == hardness.BRINELL
+    assert hardness.scale_name("Rockwell") is None and hardness.scale_name(None) is None
+    assert hardness.format_hardness(45.25, hardness.ROCKWELL_C) == "45.2 HRC"
+    assert hardness.format_hardness(float("nan"), hardness.BRINELL) == "—"
@@ -0,0 +1,43 @@
+import csv
+import json
+
+import importer
+from Solbase import load_verified_mechanical_materials
+
+
+def _catalog_row(key: str) -> dict:
+    """One CSV row with the scalar fields of a verified record under a new key"""
+    record = load_verified_mechanical_materials()["aisi_1020"]
+    # Without the prototype: sublattice names are case-sensitive, column names are normalized
+    crystal = {k: v for k, v in record["crystal_structure"].items()
+               if k not in ("prototype", "species", "atomic_positions")}
+    nested = {"composition": record["composition"], "properties": record["properties"], "crystal_structure": crystal}
+    row = {"key": key, "name": f"{record['name']} ({key})", "class": record["class"]}
+    row.update(importer.flatten_row(nested))
+    return row
+
+
+def test_non_numeric_lattice_parameter_is_rejected(tmp_path):
+    good, bad = _catalog_row("test_good"), _catalog_row("test_bad")
+    bad["crystal_structure.lattice_parameters.a"] = "3.6 Å"
+    source = tmp_path / "catalog.csv"
+    with open(source, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(good))
+        writer.writeheader()
+        writer.writerows([good, bad])
+
+    rejects = tmp_path / "rejects.jsonl"
+    report = importer.import_catalog(str(source), store_path=str(tmp_path / "store.jsonl"),
+                                     rejects_path=str(rejects))
+
+    assert (report.accepted, report.rejected) == (1, 1)
+    rejected = [json.loads(line) for line in rejects.read_text(encoding="utf-8").splitlines()]
+    assert [entry["row"] for entry in rejected] == [2]
+    assert rejected[0]["reason"].startswith("crystal_structure.lattice_parameters.a")
+
+
+def test_header_only_source_imports_nothing(tmp_path):
+    source = tmp_path / "empty.csv"
+    source.write_text("key,name\n", encoding="utf-8")
+    report = importer.import_catalog(str(source), store_path=str(tmp_path / "store.jsonl"))
+    assert (report.rows_read, report.accepted, report.rejected) == (0, 0, 0)
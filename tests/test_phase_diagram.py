@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import phase_diagram
+
+
+def test_lever_rule_fractions_sum_to_one():
+    grid = phase_diagram.phase_grid(carbon_step=0.05, temperature_step=5.0)
+    for carbon, temperature in [(0.4, 750.0), (0.4, 700.0), (1.2, 900.0), (3.0, 1200.0), (5.0, 600.0), (0.1, 1480.0)]:
+        result = grid.lookup(carbon, temperature)
+        assert sum(phase["fraction"] for phase in result["phases"]) == pytest.approx(1.0)
+        # The phase compositions reproduce the overall carbon
+        assert sum(phase["fraction"] * phase["carbon"] for phase in result["phases"]) == pytest.approx(result["carbon"])
+    with pytest.raises(ValueError):
+        grid.region[0, 0] = 0
+
+
+def test_regions():
+    cases = {
+        (0.4, 750.0): "α + γ",
+        (0.4, 900.0): "γ",
+        (0.4, 700.0): "α + Fe₃C",
+        (1.2, 800.0): "γ + Fe₃C",
+        (3.0, 1250.0): "L + γ",
+        (6.0, 1160.0): "L + Fe₃C",
+        (0.0, 1450.0): "δ",
+        (2.0, 1550.0): "L",
+    }
+    for (carbon, temperature), label in cases.items():
+        region = phase_diagram.classify(carbon, temperature)[0]
+        assert phase_diagram.REGIONS[int(region)][0] == label, (carbon, temperature)
+
+
+def test_eutectoid_is_all_pearlite():
+    parts = phase_diagram.microconstituents([phase_diagram.EUTECTOID[0], 0.4, 1.2, phase_diagram.EUTECTIC[0], 3.0])
+    assert parts["pearlite"][0] == pytest.approx(1.0)
+    assert parts["transformed ledeburite"][3] == pytest.approx(1.0)
+    total = sum(parts.values())
+    np.testing.assert_allclose(total, 1.0)
+    # Hypoeutectoid: pearlite share from the lever rule between α and the eutectoid
+    assert parts["pearlite"][1] == pytest.approx((0.4 - phase_diagram.MAX_FERRITE) / (phase_diagram.EUTECTOID[0] - phase_diagram.MAX_FERRITE))
@@ -0,0 +1,53 @@
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import prototypes
+from Solbase import load_verified_mechanical_materials
+
+# Last commit whose Solbase.py listed every material's atomic positions inline
+INLINE_POSITIONS_COMMIT = "2686f37"
+
+
+@pytest.fixture(scope="module")
+def inline_catalog():
+    try:
+        source = subprocess.run(["git", "show", f"{INLINE_POSITIONS_COMMIT}:Solbase.py"],
+                                cwd=Path(__file__).resolve().parents[1],
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("the git history with the inline positions is not available")
+    namespace = {}
+    exec(compile(source, f"Solbase.py@{INLINE_POSITIONS_COMMIT}", "exec"), namespace)
+    return namespace["load_verified_mechanical_materials"]()
+
+
+def test_prototype_positions_equal_the_inline_tables(inline_catalog):
+    materials = load_verified_mechanical_materials()
+    assert set(materials) == set(inline_catalog)
+    for key, old in inline_catalog.items():
+        crystal = materials[key]["crystal_structure"]
+        assert "atomic_positions" not in crystal, key
+        assert prototypes.get_atomic_positions(crystal) == old["crystal_structure"]["atomic_positions"], key
+
+
+def test_scaled_positions_follow_the_lattice():
+    materials = load_verified_mechanical_materials()
+    groups = prototypes.group_by_prototype(materials)
+    keys = groups["BCC"]
+    lengths = prototypes.lattice_lengths(materials, keys)
+    scaled = prototypes.scaled_positions("BCC", lengths)
+    assert scaled.shape == (len(keys), len(prototypes.get_prototype("BCC")), 3)
+    row = keys.index("aisi_1020")
+    np.testing.assert_allclose(scaled[row].max(axis=0), lengths[row])
+    assert sorted(key for group in groups.values() for key in group) == sorted(materials)
+
+
+def test_explicit_positions_win_and_unknown_prototypes_raise():
+    explicit = [{"element": "X", "x": 0.0, "y": 0.0, "z": 0.0, "type": "corner"}]
+    assert prototypes.get_atomic_positions({"prototype": "BCC", "atomic_positions": explicit}) is explicit
+    assert prototypes.get_atomic_positions(None) == []
+    with pytest.raises(KeyError):
+        prototypes.get_prototype("no_such_structure")
@@ -0,0 +1,61 @@
+import copy
+import math
+
+import numpy as np
+import pytest
+
+import quench
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+
+def _first_root(biot):
+    """First positive root of λ tan λ = Bi (on (0, π/2))"""
+    low, high = 0.0, math.pi / 2
+    for _ in range(100):
+        middle = 0.5 * (low + high)
+        low, high = (middle, high) if middle * math.tan(middle) < biot else (low, middle)
+    return 0.5 * (low + high)
+
+
+def test_plate_centre_matches_one_term_solution():
+    half_thickness, conductivity, diffusivity, htc = 0.01, 50.0, 1e-5, 5000.0
+    biot = htc * half_thickness / conductivity
+    case = quench.QuenchCase(quench.PLATE, half_thickness, initial=850.0, ambient=50.0, htc=htc,
+                             duration=2 * half_thickness ** 2 / diffusivity, steps=4000, nodes=81)
+    times, positions, theta = quench.quench_history(case, [diffusivity], [htc * diffusivity / conductivity])
+
+    root = _first_root(biot)
+    coefficient = 4 * math.sin(root) / (2 * root + math.sin(2 * root))
+    fourier = diffusivity * times / half_thickness ** 2
+    later = fourier >= 0.5   # where the higher terms have died out
+    expected = coefficient * np.exp(-root ** 2 * fourier[later])
+    assert positions[0] == 0.0 and positions[-1] == half_thickness
+    np.testing.assert_allclose(theta[0, later, 0], expected, atol=2e-3)
+
+
+def test_history_is_cached_and_read_only():
+    case = quench.QuenchCase(quench.CYLINDER, 0.02, initial=900.0, ambient=20.0, htc=1500.0,
+                             duration=60.0, steps=50, half_length=0.05)
+    first = quench.quench_history(case, [1e-5, 4e-6], [3e-4, 2e-4])[2]
+    again = quench.quench_history(case, np.array([1e-5, 4e-6]), np.array([3e-4, 2e-4]))[2]
+    assert again is first
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first[0, 0, 0] = 1.0
+
+
+def test_missing_thermal_properties_give_nan_rows():
+    materials = copy.deepcopy(load_verified_mechanical_materials())
+    for key, name in (("copper", "thermal_conductivity"), ("gold", "density"), ("lead", "specific_heat")):
+        del materials[key]["properties"][name]
+    table = MaterialsTable(materials)
+    case = quench.QuenchCase(quench.SPHERE, 0.01, initial=800.0, ambient=20.0, htc=5000.0, duration=30.0, steps=60)
+    keys = ["aisi_1020", "copper", "gold", "lead", "al_6061"]
+    result = quench.simulate_quench(table, case, keys)
+
+    missing = np.isnan(result.temperatures).all(axis=(1, 2))
+    assert missing.tolist() == [False, True, True, True, False]
+    assert not np.isnan(result.temperatures[~missing]).any()
+    assert (result.centre[~missing, 0] == 800.0).all()
+    assert np.isnan(result.time_to(400.0)[1:4]).all()
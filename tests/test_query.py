@@ -0,0 +1,7 @@
+import query
+
+
+def test_overflowing_index_is_skipped():
+    terms = query.parse_index("density^1000")
+    assert query.evaluate_index({"density": 7.87}, terms) is None
+    assert query.evaluate_index({"density": 1.5}, terms) > 0
@@ -0,0 +1,86 @@
+import copy
+
+import pytest
+
+import schema
+from Solbase import load_verified_mechanical_materials
+
+
+@pytest.fixture
+def record():
+    return copy.deepcopy(load_verified_mechanical_materials()["aisi_1020"])
+
+
+def _errors(record):
+    return schema.errors_only(schema.validate_record(record))
+
+
+def test_catalog_record_is_valid(record):
+    assert _errors(record) == []
+
+
+def test_abstract_node_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        schema.Node()
+
+
+def test_missing_required_property(record):
+    del record["properties"]["youngs_modulus"]
+    assert _errors(record) == [("error", "properties.youngs_modulus", "is required")]
+
+
+def test_wrong_type(record):
+    record["properties"]["density"] = "7.87"
+    assert _errors(record) == [("error", "properties.density", "expected number, got str")]
+    record["properties"]["density"] = True
+    assert _errors(record) == [("error", "properties.density", "expected number, got bool")]
+
+
+def test_out_of_range(record):
+    record["properties"]["poissons_ratio"] = 0.6
+    [(level, path, message)] = _errors(record)
+    assert path == "properties.poissons_ratio"
+    assert message == "0.6 outside [-1, 0.5]"
+
+
+def test_exclusive_minimum(record):
+    record["properties"]["poissons_ratio"] = -1   # inclusive bound: allowed
+    record["properties"]["density"] = 0           # exclusive bound: rejected
+    [(level, path, message)] = _errors(record)
+    assert path == "properties.density"
+    assert message == "0 g/cm³ outside (0, 30]"
+    record["properties"]["density"] = 1e-9
+    assert _errors(record) == []
+
+
+def test_yield_above_tensile_warns(record):
+    record["properties"]["yield_strength"] = 500
+    issues = schema.validate_record(record)
+    assert issues == [("warning", "properties.yield_strength", "500 MPa exceeds tensile strength 420 MPa")]
+
+
+def test_cross_field_rules_skip_non_numeric_operands(record):
+    record["properties"]["tensile_strength"] = "420 MPa"
+    record["crystal_structure"]["lattice_parameters"]["a"] = None
+    record["temperature_curves"]["youngs_modulus"]["temperature"][1] = "100"
+    paths = [path for _, path, _ in schema.validate_record(record)]
+    assert paths == [
+        "properties.tensile_strength",
+        "crystal_structure.lattice_parameters.a",
+        "temperature_curves.youngs_modulus.temperature[1]",
+    ]
+
+
+def test_process_pool_matches_serial(record):
+    items = []
+    for i in range(40):
+        item = copy.deepcopy(record)
+        if i % 3 == 0:
+            item["properties"]["density"] = -1.0
+        if i % 5 == 0:
+            item["properties"]["yield_strength"] = 900
+        items.append((f"m{i}", item))
+    serial = schema.validate_records(items, chunk_size=7)
+    pooled = schema.validate_records(items, processes=2, chunk_size=7)
+    assert pooled == serial
+    assert len(serial) == len({i for i in range(40) if i % 3 == 0 or i % 5 == 0})
@@ -0,0 +1,96 @@
+import gzip
+import json
+
+import pytest
+
+import server
+from Solbase import load_verified_mechanical_materials
+
+
+@pytest.fixture
+def api():
+    return server.MaterialsAPI(load_verified_mechanical_materials())
+
+
+def _json(response):
+    return json.loads(response.body)
+
+
+def test_responses_are_cached_per_canonical_url(api):
+    first = api.respond("/materials?per_page=5&page=2")
+    again = api.respond("/materials/?page=2&per_page=5")
+    assert again is first
+    assert (api.hits, api.misses) == (1, 1)
+
+
+def test_pagination(api):
+    payload = _json(api.respond("/materials?per_page=5&page=2"))
+    keys = list(load_verified_mechanical_materials())
+    assert {k: payload[k] for k in ("page", "per_page", "total", "pages")} == \
+        {"page": 2, "per_page": 5, "total": len(keys), "pages": -(-len(keys) // 5)}
+    assert [item["key"] for item in payload["items"]] == keys[5:10]
+    # Pages past the end clamp to the last one
+    last = _json(api.respond("/materials?per_page=5&page=999"))
+    assert last["page"] == last["pages"]
+
+
+def test_temperature_view(api):
+    room = _json(api.respond("/materials/aisi_1020"))
+    hot = _json(api.respond("/materials/aisi_1020?at=500"))
+    assert room["properties"]["youngs_modulus"] == 200
+    assert hot["properties"]["youngs_modulus"] == pytest.approx(120)   # a table node
+    assert hot["key"] == "aisi_1020"
+
+
+@pytest.mark.parametrize("target, status", [
+    ("/materials/unobtainium", 404),
+    ("/materials/unobtainium/structure", 404),
+    ("/nowhere", 404),
+    ("/rank", 400),
+    ("/rank?index=density^x", 400),
+    ("/materials?page=two", 400),
+    ("/materials/aisi_1020?at=hot", 400),
+    ("/materials?filter=density~5", 400),
+])
+def test_error_statuses(api, target, status):
+    response = api.respond(target)
+    assert response.status == status
+    assert "error" in _json(response)
+
+
+def test_gzip_threshold(api):
+    small = api.respond("/health")
+    large = api.respond("/materials")
+    assert len(small.body) < server.GZIP_MIN_BYTES and small.gzipped is None
+    assert len(large.body) >= server.GZIP_MIN_BYTES
+    assert gzip.decompress(large.gzipped) == large.body
+
+    raw = server._build_response(api, "GET", "/materials", {"accept-encoding": "gzip, br"})
+    head, body = raw.split(b"\r\n\r\n", 1)
+    assert b"Content-Encoding: gzip" in head
+    assert gzip.decompress(body) == large.body
+
+
+def test_etag_revalidation(api):
+    response = api.respond("/materials/aisi_1020")
+    fresh = server._build_response(api, "GET", "/materials/aisi_1020", {"if-none-match": response.etag})
+    assert fresh.startswith(b"HTTP/1.1 304 Not Modified\r\n")
+    assert fresh.endswith(b"\r\n\r\n") and b"Content-Length: 0" in fresh
+
+    stale = server._build_response(api, "GET", "/materials/aisi_1020", {"if-none-match": '"stale"'})
+    assert stale.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert stale.endswith(response.body)
+
+
+def test_unexpected_error_returns_json_500(api):
+    assert api.respond("/rank?index=density^1000").status == 200
+
+    def fail(path, params):
+        raise RuntimeError("boom")
+
+    api.route = fail
+    response = api.respond("/materials?page=1")
+    assert response.status == 500
+    assert "error" in _json(response)
+    # Failures are not cached
+    assert api.respond("/materials?page=1") is not response
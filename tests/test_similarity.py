@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import similarity
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+
+def _pdist(x, metric):
+    """Plain per-pair distances (what scipy.spatial.distance.pdist computes)"""
+    n = len(x)
+    result = np.zeros((n, n))
+    for i, j in itertools.product(range(n), repeat=2):
+        a, b = x[i], x[j]
+        if metric == "euclidean":
+            result[i, j] = np.sqrt(((a - b) ** 2).sum())
+        elif metric == "manhattan":
+            result[i, j] = np.abs(a - b).sum()
+        else:
+            result[i, j] = 1.0 - a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+    np.fill_diagonal(result, 0.0)
+    return result
+
+
+@pytest.mark.parametrize("metric", similarity.METRICS)
+def test_distances_match_pairwise_loop(metric):
+    x = np.random.default_rng(0).normal(size=(40, 6))
+    distances = similarity.pairwise_distances(x, metric, block_size=7)
+    np.testing.assert_allclose(distances, _pdist(x, metric), atol=1e-12)
+    assert not distances.flags.writeable
+
+
+def test_average_linkage_matches_naive_upgma():
+    x = np.random.default_rng(1).normal(size=(25, 3))
+    distances = similarity.pairwise_distances(x)
+    linkage = similarity.average_linkage(distances)
+
+    clusters = {i: [i] for i in range(len(x))}
+    for step in range(len(x) - 1):
+        pairs = itertools.combinations(sorted(clusters), 2)
+        a, b = min(pairs, key=lambda p: distances[np.ix_(clusters[p[0]], clusters[p[1]])].mean())
+        height = distances[np.ix_(clusters[a], clusters[b])].mean()
+        np.testing.assert_allclose(linkage[step], [a, b, height, len(clusters[a]) + len(clusters[b])])
+        clusters[len(x) + step] = clusters.pop(a) + clusters.pop(b)
+
+    assert sorted(similarity.leaf_order(linkage)) == list(range(len(x)))
+
+
+def test_similarity_matrix_of_catalog():
+    table = MaterialsTable(load_verified_mechanical_materials())
+    keys = ["aisi_1020", "ss_304", "al_6061", "copper", "gold"]
+    result = similarity.similarity_matrix(table, keys, ["density", "youngs_modulus", "tensile_strength"])
+    assert result.distances.shape == (5, 5)
+    np.testing.assert_allclose(result.distances, result.distances.T)
+    assert result.similarity().max() == 1.0 and result.similarity().min() == 0.0
+    assert result.nearest("aisi_1020", 1)[0][0] == "ss_304"
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import sizing
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+# AISI 1020: E = 200 GPa, σy = 350 MPa, ν = 0.29, ρ = 7.87 g/cm³
+
+
+@pytest.fixture
+def table():
+    return MaterialsTable(load_verified_mechanical_materials())
+
+
+def _steel(table, case):
+    return sizing.size_sections(table, case, ["aisi_1020", "al_6061"])
+
+
+def test_cantilever_round_bar(table):
+    # 1 kN tip load on 1 m, SF 1.5, 5 mm allowable tip deflection
+    result = _steel(table, sizing.LoadCase(sizing.CANTILEVER, 1000.0, 1.0, allowable=0.005))
+    # d³ = 32 M / (π σy / SF) with M = 1000 N·m
+    assert result.strength_size[0] == pytest.approx(35.2107, rel=1e-5)
+    # d⁴ = 64 F L³ / (3 π E δ)
+    assert result.stiffness_size[0] == pytest.approx(51.0478, rel=1e-5)
+    assert result.size[0] == result.stiffness_size[0] and result.governed_by_stiffness[0]
+    assert result.mass[0] == pytest.approx(16.1072, rel=1e-5)
+    assert result.cost[0] == result.mass[0]
+
+
+def test_simply_supported_square_and_shaft(table):
+    square = _steel(table, sizing.LoadCase(sizing.SIMPLY_SUPPORTED, 1000.0, 1.0, section=sizing.SQUARE))
+    # b³ = 6 (F L / 4) / (σy / SF)
+    assert square.size[0] == pytest.approx(18.5939, rel=1e-5)
+    assert np.isnan(square.stiffness_size).all() and not square.governed_by_stiffness.any()
+
+    shaft = _steel(table, sizing.LoadCase(sizing.TORSION, 200.0, 1.0, allowable=0.01))
+    # d³ = 16 T / (π σy / (√3 SF)); d⁴ = 32 T L / (π G θ), G = E / 2(1 + ν)
+    assert shaft.strength_size[0] == pytest.approx(19.6273, rel=1e-5)
+    assert shaft.stiffness_size[0] == pytest.approx(40.2629, rel=1e-5)
+
+
+def test_best_and_feasibility(table):
+    case = sizing.LoadCase(sizing.CANTILEVER, 1000.0, 1.0, allowable=0.005)
+    result = sizing.size_sections(table, case, ["aisi_1020", "al_6061", "ti_6al_4v"], max_size=60.0)
+    # Aluminium would be lightest but needs a bar over 60 mm
+    assert not result.feasible[1] and result.mass[1] < result.mass[2]
+    assert result.best() == "ti_6al_4v" and result.best("cost") == "aisi_1020"
+    assert result.order()[-1] == 1
+    with pytest.raises(ValueError):
+        sizing.LoadCase(sizing.TORSION, 1.0, 1.0, section=sizing.SQUARE)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from database import get_database
+from stress_strain import stress_strain_curves
+
+
+def test_engineering_maximum_is_the_tensile_strength():
+    db = get_database()
+    curves = stress_strain_curves(db)
+    rows = db.positions(curves.keys)
+    tensile = db.column("tensile_strength")[rows]
+    valid = ~np.isnan(curves.exponent)
+    assert valid.sum() >= 20
+    peak = np.nanmax(curves.engineering_stress[valid], axis=1)
+    np.testing.assert_allclose(peak, tensile[valid], rtol=1e-5)
+
+
+def test_fracture_before_necking_ends_at_the_tensile_strength():
+    db = get_database()
+    # Tungsten: 2 % elongation, well below its uniform strain
+    row = db.positions(["tungsten"])[0]
+    curves = stress_strain_curves(db, keys=["tungsten"])
+    strain, stress = curves.curve(0)
+    last = np.flatnonzero(~np.isnan(strain))[-1]
+    assert strain[last] == np.nanmax(strain)
+    np.testing.assert_allclose(strain[last], db.column("elongation")[row] / 100, rtol=1e-5)
+    np.testing.assert_allclose(stress[last], db.column("tensile_strength")[row], rtol=1e-5)
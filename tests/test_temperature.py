@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import temperature
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+CURVES = {
+    "a": {"temperature": [20, 200, 400, 600], "values": [200, 180, 140, 62]},
+    "b": None,
+    "c": {"temperature": [-100, 0, 1000], "values": [1.0, 2.0, 4.0]},
+    "d": {"temperature": [300], "values": [7.0]},
+}
+
+
+@pytest.fixture
+def index():
+    materials = {key: {"temperature_curves": {"youngs_modulus": curve} if curve else {}} for key, curve in CURVES.items()}
+    return temperature.CurveIndex("youngs_modulus", materials, list(CURVES), np.array([1.0, 2.0, 3.0, 4.0]))
+
+
+def test_table_nodes_are_exact(index):
+    for t, expected in [(20.0, 200.0), (200.0, 180.0), (400.0, 140.0), (600.0, 62.0)]:
+        assert index.evaluate(t)[0] == expected
+    assert index.evaluate(0.0)[2] == 2.0 and index.evaluate(1000.0)[2] == 4.0
+
+
+def test_matches_np_interp(index):
+    t = np.linspace(-300.0, 1500.0, 97)
+    values = index.evaluate(t)
+    assert values.shape == (4, len(t))
+    for row, curve in enumerate(CURVES.values()):
+        if curve is None:
+            np.testing.assert_array_equal(values[row], 2.0)   # the scalar fallback
+        else:
+            np.testing.assert_allclose(values[row], np.interp(t, curve["temperature"], curve["values"]))
+
+
+def test_catalog_at_temperature():
+    table = MaterialsTable(load_verified_mechanical_materials())
+    row = table.keys.index("aisi_1020")
+    assert table.column_at("youngs_modulus", None)[row] == 200
+    assert table.column_at("youngs_modulus", 500.0)[row] == pytest.approx(120)
+    hot = temperature.materials_at(table, 500.0)
+    assert hot["aisi_1020"]["properties"]["youngs_modulus"] == pytest.approx(120)
+    assert table.materials["aisi_1020"]["properties"]["youngs_modulus"] == 200
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import thermal
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+
+@pytest.fixture
+def table():
+    return MaterialsTable(load_verified_mechanical_materials())
+
+
+def test_thermal_shock_index_of_steel(table):
+    p = table.materials["aisi_1020"]["properties"]
+    # R = σ_ts (1 - ν) / (E α), MPa / (GPa · μm/m·K) -> K
+    expected = p["tensile_strength"] * 1e6 * (1 - p["poissons_ratio"]) / (
+        p["youngs_modulus"] * 1e9 * p["thermal_expansion"] * 1e-6)
+    assert thermal.derived_value(p, "thermal_shock_resistance") == pytest.approx(expected)
+    # a = k / (ρ c_p) in mm²/s
+    diffusivity = p["thermal_conductivity"] / (p["density"] * 1e3 * p["specific_heat"]) * 1e6
+    assert thermal.derived_value(p, "thermal_diffusivity") == pytest.approx(diffusivity)
+
+
+@pytest.mark.parametrize("name", sorted(thermal.DERIVED_PROPERTIES))
+def test_virtual_columns_equal_the_formula(table, name):
+    derived = thermal.DERIVED_PROPERTIES[name]
+    column = table.column(name)
+    for row, key in enumerate(table.keys):
+        value = thermal.derived_value(table.materials[key]["properties"], name)
+        if value is None:
+            assert np.isnan(column[row]), key
+        else:
+            assert column[row] == pytest.approx(value), key
+    assert not np.isnan(column).all()
+    assert derived.inputs and thermal.derived_label(name).endswith(f"({derived.unit})")
+
+
+def test_missing_or_zero_inputs_give_none():
+    properties = {"thermal_conductivity": 50.0, "thermal_expansion": 0.0}
+    assert thermal.derived_value(properties, "thermal_distortion") is None
+    del properties["thermal_expansion"]
+    assert thermal.derived_value(properties, "thermal_distortion") is None
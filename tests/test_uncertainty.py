@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+import pytest
+
+import uncertainty
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+KEYS = ["aisi_1020", "ti_6al_4v", "copper"]
+
+
+@pytest.fixture
+def model():
+    return uncertainty.UncertaintyModel(MaterialsTable(load_verified_mechanical_materials()))
+
+
+def test_seeded_percentiles_are_reproducible(model):
+    first = uncertainty.index_distribution(model, "yield_strength/density", KEYS, n_samples=2000, seed=7)
+    again = uncertainty.index_distribution(model, "yield_strength/density", KEYS, n_samples=2000, seed=7)
+    other = uncertainty.index_distribution(model, "yield_strength/density", KEYS, n_samples=2000, seed=8)
+    for q in uncertainty.DEFAULT_PERCENTILES:
+        np.testing.assert_array_equal(again.percentile(q), first.percentile(q))
+    assert not np.array_equal(other.percentile(50.0)[:2], first.percentile(50.0)[:2])
+
+
+def test_sampled_distributions(model):
+    result = uncertainty.propagate(model, lambda s: s["yield_strength"], ["yield_strength"], KEYS,
+                                   n_samples=200_000, percentiles=(5.0, 50.0))
+    # Triangular (295, 350, 420): the median lies right of the mode
+    median = 420 - math.sqrt(0.5 * 125 * 70)
+    assert result.percentile(50.0)[0] == pytest.approx(median, abs=0.5)
+    assert result.mean[0] == pytest.approx((295 + 350 + 420) / 3, abs=0.3)
+    # Copper has no range: fixed at its value
+    copper = model.table.materials["copper"]["properties"]["yield_strength"]
+    assert result.percentile(5.0)[2] == result.percentile(50.0)[2] == copper and result.std[2] == 0.0
+
+    cost = uncertainty.propagate(model, lambda s: s["cost_index"], ["cost_index"], ["ti_6al_4v"],
+                                 n_samples=200_000, percentiles=(5.0,))
+    assert cost.percentile(5.0)[0] == pytest.approx(14 + 0.05 * 11, abs=0.05)
+    modulus = uncertainty.propagate(model, lambda s: s["youngs_modulus"], ["youngs_modulus"], ["aisi_1020"],
+                                    n_samples=200_000)
+    assert modulus.mean[0] == pytest.approx(200, abs=0.1) and modulus.std[0] == pytest.approx(4, abs=0.05)
+
+
+def test_default_cov_and_invalid_results(model):
+    spread = uncertainty.propagate(model, lambda s: s["density"], ["density"], KEYS, n_samples=50_000, default_cov=0.1)
+    density = model.table.column("density")[model.table.positions(KEYS)]
+    np.testing.assert_allclose(spread.std, 0.1 * density, rtol=0.02)
+    # Non-finite samples are ignored
+    half = uncertainty.propagate(model, lambda s: np.where(s["density"] > density[:, None], np.inf, 1.0),
+                                 ["density"], KEYS, n_samples=1000, default_cov=0.1)
+    np.testing.assert_array_equal(half.mean, 1.0)
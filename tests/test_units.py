@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import units
+from database import MaterialsTable
+from Solbase import load_verified_mechanical_materials
+
+
+@pytest.mark.parametrize("prop", sorted(units.PROPERTIES))
+def test_si_us_round_trip(prop):
+    values = np.array([0.5, 20.0, 1234.5])
+    us = units.from_canonical(values, prop, units.display_unit(prop, units.US))
+    np.testing.assert_allclose(units.to_canonical(us, prop, units.display_unit(prop, units.US)), values, rtol=1e-12)
+    np.testing.assert_allclose(units.convert(values, prop, units.SI), values)
+
+
+def test_known_conversions():
+    assert units.convert(100.0, "melting_point", units.US) == pytest.approx(212.0)
+    assert units.convert(6.894757, "yield_strength", units.US) == pytest.approx(1.0)
+    assert units.to_canonical(7870.0, "density", "kg/m³") == pytest.approx(7.87)
+    assert units.to_canonical(0.0, "melting_point", "K") == pytest.approx(-273.15)
+    assert units.to_canonical(1.0, "electrical_resistivity", "µΩ·cm") == pytest.approx(1e-8)
+    assert units.unit_factors("thermal_conductivity", "W/m K") == (1.0, 0.0)
+    with pytest.raises(units.UnitError):
+        units.unit_factors("density", "furlongs")
+
+
+def test_cached_us_columns():
+    table = MaterialsTable(load_verified_mechanical_materials())
+    si = table.column_in("tensile_strength")
+    us = table.column_in("tensile_strength", units.US)
+    assert table.column_in("tensile_strength", units.US) is us
+    assert not us.flags.writeable
+    np.testing.assert_allclose(units.to_canonical(us, "tensile_strength", "ksi"), si)
+
+
+def test_display():
+    assert units.property_label("yield_strength", units.US) == "Yield Strength (ksi)"
+    assert units.property_label("poissons_ratio") == "Poisson's Ratio"
+    assert units.format_quantity(28000.0, "tensile_strength") == "28000 MPa"
+    assert units.format_quantity(None, "density") == "—"
@@ -0,0 +1,93 @@
+"""
+Thermal Performance Indices
+Derived properties combining the thermal and elastic columns:
+
+    thermal_shock_resistance     R   = σ_ts (1 - ν) / (E α)      K
+    thermal_shock_resistance_k   R′  = k R                        W/m
+    thermal_diffusivity          a   = k / (ρ c_p)                mm²/s
+    thermal_distortion           k / α                            W/μm
+    transient_distortion         a / α                            (mm²/s)/(μm/m·K)
+
+Inputs are in the canonical units of schema.py. The formulas are plain
+arithmetic, so they evaluate one material's floats (query.py) and whole
+NumPy columns (database.py virtual columns) alike. Standard library only.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DerivedProperty:
+    """A virtual property computed from stored ones"""
+    label: str
+    unit: str
+    inputs: Tuple[str, ...]
+    formula: Callable[[Mapping], object]
+    description: str
+    fmt: str = ".4g"
+
+
+def _shock(p):
+    # MPa / (GPa · μm/m·K) = 1e3 K
+    return p["tensile_strength"] * (1.0 - p["poissons_ratio"]) / (p["youngs_modulus"] * p["thermal_expansion"]) * 1e3
+
+
+def _diffusivity(p):
+    # (W/m·K) / (g/cm³ · J/kg·K) = 1e-3 m²/s = 1e3 mm²/s
+    return p["thermal_conductivity"] / (p["density"] * p["specific_heat"]) * 1e3
+
+
+DERIVED_PROPERTIES: Dict[str, DerivedProperty] = {
+    "thermal_shock_resistance": DerivedProperty(
+        "Thermal Shock Resistance R", "K",
+        ("tensile_strength", "poissons_ratio", "youngs_modulus", "thermal_expansion"),
+        _shock,
+        "Largest sudden surface temperature change without cracking",
+    ),
+    "thermal_shock_resistance_k": DerivedProperty(
+        "Thermal Shock Resistance R′", "W/m",
+        ("tensile_strength", "poissons_ratio", "youngs_modulus", "thermal_expansion", "thermal_conductivity"),
+        lambda p: _shock(p) * p["thermal_conductivity"],
+        "Heat flux tolerated under steady or slow heating",
+    ),
+    "thermal_diffusivity": DerivedProperty(
+        "Thermal Diffusivity", "mm²/s",
+        ("thermal_conductivity", "density", "specific_heat"),
+        _diffusivity,
+        "How quickly a temperature change spreads through the part",
+    ),
+    "thermal_distortion": DerivedProperty(
+        "Thermal Distortion Index", "W/μm",
+        ("thermal_conductivity", "thermal_expansion"),
+        lambda p: p["thermal_conductivity"] / p["thermal_expansion"],
+        "Steady-state heat flux per unit distortion (higher is flatter)",
+    ),
+    "transient_distortion": DerivedProperty(
+        "Transient Distortion Index", "(mm²/s)/(μm/m·K)",
+        ("thermal_conductivity", "density", "specific_heat", "thermal_expansion"),
+        lambda p: _diffusivity(p) / p["thermal_expansion"],
+        "Resistance to distortion while heating transiently (higher is better)",
+    ),
+}
+
+
+def derived_value(properties: Mapping, name: str) -> Optional[float]:
+    """One material's derived property, or None when an input is missing/invalid"""
+    derived = DERIVED_PROPERTIES[name]
+    inputs = {}
+    for prop in derived.inputs:
+        x = properties.get(prop)
+        if not isinstance(x, (int, float)) or x != x:
+            return None
+        inputs[prop] = x
+    try:
+        value = derived.formula(inputs)
+    except ZeroDivisionError:
+        return None
+    return value if value == value and abs(value) != float("inf") else None
+
+
+def derived_label(name: str) -> str:
+    derived = DERIVED_PROPERTIES[name]
+    return f"{derived.label} ({derived.unit})"
@@ -0,0 +1,197 @@
+"""
+Property Uncertainty
+Records may give a spread for any property next to its handbook value:
+
+    "property_ranges": {
+        "yield_strength": {"min": 295, "typical": 350, "max": 420},              # triangular
+        "youngs_modulus": {"distribution": "normal", "std": 4},                  # mean = property
+        "cost_index": {"distribution": "uniform", "min": 0.8, "max": 1.3}
+    }
+
+Monte Carlo propagation draws (materials × samples) matrices for every
+property an expression needs, evaluates it on whole blocks of materials at
+once and reduces each block to percentiles, so memory stays bounded at any
+catalog size.
+"""
+
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from database import MaterialsTable
+from query import parse_index
+from thermal import DERIVED_PROPERTIES
+
+DISTRIBUTIONS = ("triangular", "uniform", "normal")
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+# Upper bound on (materials × samples) elements per property in one block
+BLOCK_ELEMENTS = 2_000_000
+
+_FIXED, _TRIANGULAR, _UNIFORM, _NORMAL = range(4)
+
+
+class PropertyRanges:
+    """Distribution parameters of one property for every material, as arrays"""
+
+    def __init__(self, table: MaterialsTable, prop: str):
+        typical = table.column(prop)
+        n = len(table)
+        self.kind = np.full(n, _FIXED, dtype=np.int8)
+        self.low = typical.copy()
+        self.mode = typical.copy()
+        self.high = typical.copy()
+        self.std = np.zeros(n)
+
+        for row, key in enumerate(table.keys):
+            spec = (table.materials[key].get("property_ranges") or {}).get(prop)
+            if not spec:
+                continue
+            distribution = spec.get("distribution", "triangular")
+            if distribution == "normal":
+                self.kind[row] = _NORMAL
+                self.mode[row] = spec.get("typical", typical[row])
+                self.std[row] = spec["std"]
+            else:
+                self.kind[row] = _UNIFORM if distribution == "uniform" else _TRIANGULAR
+                self.low[row] = spec["min"]
+                self.high[row] = spec["max"]
+                self.mode[row] = min(max(spec.get("typical", typical[row]), spec["min"]), spec["max"])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.kind != _FIXED))
+
+    def sample(self, rows: np.ndarray, n_samples: int, rng: np.random.Generator,
+               default_cov: float = 0.0) -> np.ndarray:
+        """
+        (len(rows) × n_samples) samples. Materials without a range are fixed at
+        their value, or normal with std = default_cov × value when default_cov > 0.
+        """
+        kind = self.kind[rows]
+        mode = self.mode[rows]
+        out = np.repeat(mode[:, None], n_samples, axis=1)
+
+        fixed = kind == _FIXED
+        normal = (kind == _NORMAL) | (fixed & (default_cov > 0))
+        if normal.any():
+            std = np.where(kind[normal] == _NORMAL, self.std[rows][normal], default_cov * np.abs(mode[normal]))
+            out[normal] += std[:, None] * rng.standard_normal((int(normal.sum()), n_samples))
+
+        bounded = (kind == _TRIANGULAR) | (kind == _UNIFORM)
+        if bounded.any():
+            low, high, peak = self.low[rows][bounded], self.high[rows][bounded], mode[bounded]
+            u = rng.random((int(bounded.sum()), n_samples))
+            width = (high - low)[:, None]
+            uniform = low[:, None] + u * width
+            # Triangular inverse CDF with the mode at fraction c of the interval
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c = np.where(high > low, (peak - low) / (high - low), 0.5)[:, None]
+            left = low[:, None] + np.sqrt(u * width * (c * width))
+            right = high[:, None] - np.sqrt((1.0 - u) * width * ((1.0 - c) * width))
+            triangular = np.where(u < c, left, right)
+            out[bounded] = np.where((kind[bounded] == _UNIFORM)[:, None], uniform, triangular)
+        return out
+
+
+class UncertaintyModel:
+    """Samplers for every property of a table (parameter arrays built on first use)"""
+
+    def __init__(self, table: MaterialsTable):
+        self.table = table
+        self._ranges: Dict[str, PropertyRanges] = {}
+
+    def ranges(self, prop: str) -> PropertyRanges:
+        ranges = self._ranges.get(prop)
+        if ranges is None:
+            ranges = self._ranges[prop] = PropertyRanges(self.table, prop)
+        return ranges
+
+
+# =============================================================================
+# PROPAGATION
+# =============================================================================
+
+@dataclass
+class Distribution:
+    """Per-material summary of a Monte Carlo result"""
+    keys: List[str]
+    percentiles: Dict[float, np.ndarray]
+    mean: np.ndarray
+    std: np.ndarray
+    n_samples: int
+
+    def percentile(self, q: float) -> np.ndarray:
+        return self.percentiles[q]
+
+
+def propagate(model: UncertaintyModel, fn: Callable[[Dict[str, np.ndarray]], np.ndarray],
+              properties: Sequence[str], keys: Optional[Sequence[str]] = None, n_samples: int = 10_000,
+              percentiles: Sequence[float] = DEFAULT_PERCENTILES, default_cov: float = 0.0,
+              seed: Optional[int] = 0) -> Distribution:
+    """
+    Monte Carlo distribution of fn over the selected materials
+    fn receives {property: (block × n_samples) array} and returns a
+    (block × n_samples) array; non-finite results are ignored.
+    """
+    table = model.table
+    keys = list(keys) if keys is not None else table.keys
+    rows = table.positions(keys)
+    rng = np.random.default_rng(seed)
+    block = max(1, BLOCK_ELEMENTS // max(n_samples, 1))
+
+    summary = {q: np.full(len(rows), np.nan) for q in percentiles}
+    mean = np.full(len(rows), np.nan)
+    std = np.full(len(rows), np.nan)
+    for start in range(0, len(rows), block):
+        chunk = rows[start:start + block]
+        samples = {prop: model.ranges(prop).sample(chunk, n_samples, rng, default_cov) for prop in properties}
+        with np.errstate(all="ignore"):
+            values = np.asarray(fn(samples), dtype=np.float64)
+        values = np.where(np.isfinite(values), values, np.nan)
+        stop = start + len(chunk)
+        complete = ~np.isnan(values).any(axis=1)
+        if complete.all():
+            result = np.percentile(values, list(percentiles), axis=1)
+            mean[start:stop] = values.mean(axis=1)
+            std[start:stop] = values.std(axis=1)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows stay NaN
+                result = np.nanpercentile(values, list(percentiles), axis=1)
+                mean[start:stop] = np.nanmean(values, axis=1)
+                std[start:stop] = np.nanstd(values, axis=1)
+        for q, column in zip(percentiles, result):
+            summary[q][start:stop] = column
+    return Distribution(keys=keys, percentiles=summary, mean=mean, std=std, n_samples=n_samples)
+
+
+def index_function(index: str) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+    """
+    Vectorized form of a query.py index expression over sampled properties
+    Derived thermal properties are recomputed from their sampled inputs.
+    """
+    terms = parse_index(index)
+
+    def evaluate(samples: Dict[str, np.ndarray]) -> np.ndarray:
+        value = None
+        for prop, exponent in terms:
+            x = DERIVED_PROPERTIES[prop].formula(samples) if prop in DERIVED_PROPERTIES else samples[prop]
+            if exponent != int(exponent) or exponent < 0:
+                x = np.where(x > 0, x, np.nan)
+            term = x ** exponent
+            value = term if value is None else value * term
+        return value
+
+    evaluate.properties = sorted({name for prop, _ in terms
+                                  for name in (DERIVED_PROPERTIES[prop].inputs if prop in DERIVED_PROPERTIES else (prop,))})
+    return evaluate
+
+
+def index_distribution(model: UncertaintyModel, index: str, keys: Optional[Sequence[str]] = None,
+                       n_samples: int = 10_000, percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                       default_cov: float = 0.0, seed: Optional[int] = 0) -> Distribution:
+    """Percentiles of a performance index for every material"""
+    fn = index_function(index)
+    return propagate(model, fn, fn.properties, keys, n_samples, percentiles, default_cov, seed)
@@ -0,0 +1,181 @@
+"""
+Units Registry
+Dimension, display label and number format of every property in "properties",
+the conversion factors between units of each dimension, and the display units
+of the SI and US customary unit systems.
+
+Values are stored in the canonical units documented in template.py/schema.py.
+Conversions are affine (value * scale + offset) so they apply unchanged to
+floats and to whole NumPy columns. Standard library only.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from thermal import DERIVED_PROPERTIES
+
+SI = "SI"
+US = "US"
+UNIT_SYSTEMS = (SI, US)
+
+
+class UnitError(ValueError):
+    """Raised for a unit that is unknown for a property's dimension"""
+
+
+@dataclass(frozen=True)
+class PropertyUnit:
+    """How one property is measured and shown"""
+    label: str
+    dimension: str
+    fmt: str = ".4g"
+
+
+PROPERTIES: Dict[str, PropertyUnit] = {
+    "density": PropertyUnit("Density", "density"),
+    "youngs_modulus": PropertyUnit("Young's Modulus", "modulus"),
+    "yield_strength": PropertyUnit("Yield Strength", "stress"),
+    "tensile_strength": PropertyUnit("Tensile Strength", "stress"),
+    "elongation": PropertyUnit("Elongation", "percent"),
+    "reduction_area": PropertyUnit("Reduction of Area", "percent"),
+    "hardness": PropertyUnit("Hardness", "hardness"),
+    "thermal_conductivity": PropertyUnit("Thermal Conductivity", "thermal_conductivity"),
+    "specific_heat": PropertyUnit("Specific Heat", "specific_heat"),
+    "thermal_expansion": PropertyUnit("Thermal Expansion", "thermal_expansion"),
+    "melting_point": PropertyUnit("Melting Point", "temperature"),
+    "electrical_resistivity": PropertyUnit("Electrical Resistivity", "resistivity", ".2e"),
+    "poissons_ratio": PropertyUnit("Poisson's Ratio", "ratio"),
+    "fatigue_strength": PropertyUnit("Fatigue Strength", "stress"),
+    "fracture_toughness": PropertyUnit("Fracture Toughness", "fracture_toughness"),
+    "cost_index": PropertyUnit("Cost Index", "ratio"),
+}
+
+# Dimension of every property (the canonical unit is the one in schema.py)
+PROPERTY_DIMENSIONS = {prop: unit.dimension for prop, unit in PROPERTIES.items()}
+
+# (scale, offset): canonical = value * scale + offset; keys are normalized unit names
+UNIT_CONVERSIONS = {
+    "density": {"g/cm3": (1.0, 0.0), "kg/m3": (1e-3, 0.0), "lb/in3": (27.679905, 0.0), "lb/ft3": (0.016018463, 0.0)},
+    "modulus": {"gpa": (1.0, 0.0), "mpa": (1e-3, 0.0), "psi": (6.894757e-6, 0.0), "ksi": (6.894757e-3, 0.0), "msi": (6.894757, 0.0)},
+    "stress": {"mpa": (1.0, 0.0), "gpa": (1e3, 0.0), "pa": (1e-6, 0.0), "psi": (6.894757e-3, 0.0), "ksi": (6.894757, 0.0)},
+    "percent": {"%": (1.0, 0.0), "fraction": (100.0, 0.0)},
+    # Hardness columns are Vickers; other scales are not affine (see hardness.py)
+    "hardness": {"hv": (1.0, 0.0)},
+    "thermal_conductivity": {"w/m·k": (1.0, 0.0), "w/mk": (1.0, 0.0), "btu/hr·ft·°f": (1.730735, 0.0), "btu/hrftf": (1.730735, 0.0)},
+    "specific_heat": {"j/kg·k": (1.0, 0.0), "j/kgk": (1.0, 0.0), "kj/kg·k": (1e3, 0.0), "kj/kgk": (1e3, 0.0), "btu/lb·°f": (4186.8, 0.0), "btu/lbf": (4186.8, 0.0)},
+    "thermal_expansion": {"μm/m·k": (1.0, 0.0), "um/mk": (1.0, 0.0), "1/k": (1e6, 0.0), "μin/in·°f": (1.8, 0.0), "uin/inf": (1.8, 0.0)},
+    "temperature": {"°c": (1.0, 0.0), "c": (1.0, 0.0), "k": (1.0, -273.15), "°f": (5.0 / 9.0, -160.0 / 9.0), "f": (5.0 / 9.0, -160.0 / 9.0)},
+    "resistivity": {"ω·m": (1.0, 0.0), "ohm·m": (1.0, 0.0), "ohmm": (1.0, 0.0), "ω·cm": (1e-2, 0.0), "ohmcm": (1e-2, 0.0), "μω·cm": (1e-8, 0.0), "uohmcm": (1e-8, 0.0), "μω·in": (2.54e-8, 0.0), "uohmin": (2.54e-8, 0.0)},
+    "ratio": {"": (1.0, 0.0)},
+    "fracture_toughness": {"mpa√m": (1.0, 0.0), "mpasqrtm": (1.0, 0.0), "ksi√in": (1.098843, 0.0), "ksisqrtin": (1.098843, 0.0)},
+}
+
+# Display unit of every dimension per unit system
+SYSTEM_UNITS = {
+    SI: {
+        "density": "g/cm³",
+        "modulus": "GPa",
+        "stress": "MPa",
+        "percent": "%",
+        "hardness": "HV",
+        "thermal_conductivity": "W/m·K",
+        "specific_heat": "J/kg·K",
+        "thermal_expansion": "μm/m·K",
+        "temperature": "°C",
+        "resistivity": "Ω·m",
+        "ratio": "",
+        "fracture_toughness": "MPa√m",
+    },
+    US: {
+        "density": "lb/in³",
+        "modulus": "Msi",
+        "stress": "ksi",
+        "percent": "%",
+        "hardness": "HV",
+        "thermal_conductivity": "BTU/hr·ft·°F",
+        "specific_heat": "BTU/lb·°F",
+        "thermal_expansion": "μin/in·°F",
+        "temperature": "°F",
+        "resistivity": "μΩ·in",
+        "ratio": "",
+        "fracture_toughness": "ksi√in",
+    },
+}
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+def normalize_unit(unit: str) -> str:
+    """Lookup form of a unit name: lower case, no spaces, ³ -> 3"""
+    unit = unit.strip().lower().replace(" ", "").replace("^", "")
+    return unit.replace("³", "3").replace("µ", "μ")
+
+
+def unit_factors(prop: str, unit: Optional[str]) -> tuple:
+    """(scale, offset) taking `unit` to the canonical unit of prop"""
+    if not unit:
+        return 1.0, 0.0
+    table = UNIT_CONVERSIONS[PROPERTY_DIMENSIONS[prop]]
+    normalized = normalize_unit(unit)
+    if normalized not in table:
+        plain = re.sub(r"[·°]", "", normalized).replace("ω", "ohm").replace("μ", "u").replace("√", "sqrt")
+        if plain not in table:
+            raise UnitError(f"unknown unit '{unit}' for {prop}")
+        normalized = plain
+    return table[normalized]
+
+
+def to_canonical(values, prop: str, unit: Optional[str]):
+    """Convert a value or NumPy array from `unit` into the canonical unit"""
+    scale, offset = unit_factors(prop, unit)
+    if scale == 1.0 and offset == 0.0:
+        return values
+    return values * scale + offset
+
+
+def from_canonical(values, prop: str, unit: Optional[str]):
+    """Convert a value or NumPy array from the canonical unit into `unit`"""
+    scale, offset = unit_factors(prop, unit)
+    if scale == 1.0 and offset == 0.0:
+        return values
+    return (values - offset) / scale
+
+
+def display_unit(prop: str, system: str = SI) -> str:
+    """Display unit of a property in a unit system (derived properties: their only unit)"""
+    if prop in DERIVED_PROPERTIES:
+        return DERIVED_PROPERTIES[prop].unit
+    return SYSTEM_UNITS[system][PROPERTY_DIMENSIONS[prop]]
+
+
+def convert(values, prop: str, system: str = SI):
+    """Canonical value(s) of prop expressed in the unit system's display unit"""
+    if prop in DERIVED_PROPERTIES:
+        return values
+    return from_canonical(values, prop, display_unit(prop, system))
+
+
+# =============================================================================
+# DISPLAY
+# =============================================================================
+
+def property_label(prop: str, system: str = SI) -> str:
+    """Display label with unit, e.g. "Yield Strength (ksi)" """
+    entry = PROPERTIES.get(prop) or DERIVED_PROPERTIES.get(prop)
+    label = entry.label if entry else prop.replace("_", " ").title()
+    unit = display_unit(prop, system) if entry else ""
+    return f"{label} ({unit})" if unit else label
+
+
+def format_quantity(value: Optional[float], prop: str, system: str = SI) -> str:
+    """Value already in the system's display unit, formatted with its unit"""
+    if value is None or value != value:
+        return "—"
+    fmt = (PROPERTIES.get(prop) or DERIVED_PROPERTIES[prop]).fmt
+    # Round to the format's precision but print plainly (28000, not 2.8e+04)
+    text = format(float(format(value, fmt)), "g") if fmt.endswith("g") else format(value, fmt)
+    unit = display_unit(prop, system)
+    return f"{text} {unit}" if unit else text